@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# crac/benchmark_selector.py
+# Latency benchmark for the predictive test selector
+# Generates synthetic git repositories and times each selection phase
+
+import io
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from predictive_test_selector import PredictiveTestSelector  # noqa: E402
+
+
+GIT_ENV_ARGS = [
+    '-c', 'user.name=benchmark',
+    '-c', 'user.email=benchmark@example.com',
+    '-c', 'commit.gpgsign=false',
+]
+
+
+def git(repo: Path, *args):
+    """Run a quiet git command in the synthetic repository."""
+    subprocess.run(
+        ['git', *GIT_ENV_ARGS, *args],
+        cwd=repo,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def source_class(index: int, packages: int) -> tuple:
+    """(package, class name) of synthetic source class `index`."""
+    return f"com.bench.pkg{index % packages}", f"Component{index}"
+
+
+def write_source(repo: Path, index: int, args, rng: random.Random, revision: int = 0):
+    """Write one source class importing a few lower-numbered classes."""
+    package, name = source_class(index, args.packages)
+    imports = []
+    fields = []
+    for dep in sorted({rng.randrange(index) for _ in range(min(index, args.fan_out))}):
+        dep_package, dep_name = source_class(dep, args.packages)
+        if dep_package != package:
+            imports.append(f"import {dep_package}.{dep_name};")
+        fields.append(f"    private {dep_name} dep{dep};")
+
+    path = repo / "src" / "main" / "java" / Path(*package.split('.')) / f"{name}.java"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"package {package};\n\n"
+        + "\n".join(imports)
+        + f"\n\npublic class {name} {{\n"
+        + "\n".join(fields)
+        + f"\n    public int revision() {{ return {revision}; }}\n}}\n"
+    )
+    return path
+
+
+def write_test(repo: Path, index: int, args):
+    """Write a test for source class `index` (or a standalone test past the sources)."""
+    package, name = source_class(index % args.sources, args.packages)
+    test_name = f"{name}Test" if index < args.sources else f"Standalone{index}Test"
+    path = repo / "src" / "test" / "java" / Path(*package.split('.')) / f"{test_name}.java"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"package {package};\n\n"
+        f"public class {test_name} {{\n"
+        f"    private final {name} subject = new {name}();\n"
+        f"}}\n"
+    )
+
+
+def generate_repository(repo: Path, args) -> list:
+    """
+    Create a synthetic repository and leave `args.changed` sources modified.
+
+    Returns:
+        Paths of the modified source files, relative to the repository
+    """
+    rng = random.Random(args.seed)
+    git(repo, 'init', '-q')
+
+    for index in range(args.sources):
+        write_source(repo, index, args, rng)
+    for index in range(args.tests):
+        write_test(repo, index, args)
+    git(repo, 'add', '-A')
+    git(repo, 'commit', '-q', '-m', 'initial')
+
+    for revision in range(1, args.commits):
+        for index in rng.sample(range(args.sources), min(args.sources, args.files_per_commit)):
+            write_source(repo, index, args, random.Random(index), revision)
+        git(repo, 'commit', '-q', '-a', '-m', f'revision {revision}')
+
+    changed = []
+    for index in rng.sample(range(args.sources), min(args.sources, args.changed)):
+        path = write_source(repo, index, args, random.Random(index), args.commits)
+        changed.append(path.relative_to(repo).as_posix())
+    return changed
+
+
+def time_selection(repo: Path, args) -> dict:
+    """Run one selection in-process and return its profile."""
+    started = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        selector = PredictiveTestSelector(str(repo), args.depth)
+        selected = selector.select(budget_seconds=args.budget_seconds)
+    total_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "total_ms": round(total_ms, 3),
+        "selected": len(selected),
+        **selector.profiler.to_dict(),
+    }
+
+
+def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the predictive test selector on synthetic repositories"
+    )
+    parser.add_argument('--sources', type=int, default=500, help='Source classes')
+    parser.add_argument('--tests', type=int, default=500, help='Test classes')
+    parser.add_argument('--packages', type=int, default=20, help='Java packages')
+    parser.add_argument('--commits', type=int, default=20, help='Commits of history')
+    parser.add_argument('--files-per-commit', type=int, default=10,
+                        help='Source files touched by each commit')
+    parser.add_argument('--changed', type=int, default=50,
+                        help='Source files left modified in the working tree')
+    parser.add_argument('--fan-out', type=int, default=3,
+                        help='Imports per source class')
+    parser.add_argument('--depth', type=int, default=2, help='Dependency depth')
+    parser.add_argument('--budget-seconds', type=float, default=30.0,
+                        help='Selection time budget')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Warm-cache runs after the cold run')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--output', '-o', help='Write JSON results to a file')
+    parser.add_argument('--keep', action='store_true',
+                        help='Keep the generated repository')
+    parser.add_argument('--profile', action='store_true',
+                        help='Include per-phase timings and subprocess counts')
+
+    args = parser.parse_args()
+    if args.sources < 1:
+        parser.error("--sources must be at least 1")
+
+    repo = Path(tempfile.mkdtemp(prefix="selector-bench-"))
+    try:
+        started = time.perf_counter()
+        changed = generate_repository(repo, args)
+        generate_ms = (time.perf_counter() - started) * 1000
+
+        runs = [time_selection(repo, args) for _ in range(1 + args.repeat)]
+        if not args.profile:
+            for run in runs:
+                del run["phases"], run["subprocesses"]
+
+        warm = [run["total_ms"] for run in runs[1:]]
+        results = {
+            "config": {
+                key: value for key, value in vars(args).items()
+                if key not in ('output', 'keep', 'profile')
+            },
+            "generate_ms": round(generate_ms, 3),
+            "changed_files": len(changed),
+            "cold": runs[0],
+            "warm": runs[1:],
+            "warm_median_ms": sorted(warm)[len(warm) // 2] if warm else None,
+        }
+        if args.keep:
+            results["repository"] = str(repo)
+    finally:
+        if not args.keep:
+            shutil.rmtree(repo, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Benchmark results written to {args.output}")
+    else:
+        print(json.dumps(results, indent=2))
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+# crac/dependency_graph.py
+# Cached class-level import graph of the Java sources
+
+import json
+import os
+import re
+from pathlib import Path
+
+from profiler import Profiler
+
+DEPENDENCY_GRAPH_VERSION = 1
+DEFAULT_DEPENDENCY_DEPTH = 2      # reverse-dependency hops to follow
+DEPENDENCY_DECAY = 0.5            # risk multiplier per dependency hop
+
+
+class DependencyGraph:
+    """
+    Class-level dependency graph of the Java sources, parsed from
+    `package`/`import` statements and same-package class references.
+    
+    Each file's parse result is cached in dep_graph.json together with the
+    git HEAD it was built against. A refresh re-parses only files that
+    changed between the cached HEAD and the current one, files changed in
+    the working tree, and files that are new to the cache, so the full
+    source tree is parsed once. Outside a git repository every refresh
+    walks the source roots and re-parses files whose mtime moved.
+    """
+    
+    PACKAGE_RE = re.compile(r'^\s*package\s+([\w.]+)\s*;', re.M)
+    IMPORT_RE = re.compile(r'^\s*import\s+(static\s+)?([\w.]+(?:\.\*)?)\s*;', re.M)
+    NOISE_RE = re.compile(r'//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\])*"', re.S)
+    TYPE_RE = re.compile(r'\b[A-Z]\w*')
+    
+    def __init__(self, project_root: Path, cache_file: Path, source_roots: list,
+                 profiler: Profiler = None):
+        self.project_root = Path(project_root)
+        self.profiler = profiler or Profiler()
+        self.cache_file = Path(cache_file)
+        self.source_roots = [Path(root).as_posix() for root in source_roots]
+        self.files = {}
+        self._dependents = None
+        self._classes = None
+    
+    def _git(self, *args) -> str:
+        result = self.profiler.run(
+            ['git', *args],
+            cwd=self.project_root,
+            capture_output=True,
+            text=True
+        )
+        return result.stdout.strip() if result.returncode == 0 else ''
+    
+    def _in_roots(self, path: str) -> bool:
+        return path.endswith('.java') and any(
+            path.startswith(root + '/') for root in self.source_roots
+        )
+    
+    def _parse(self, path: str) -> dict:
+        """Parse one source file; None if it cannot be read."""
+        full_path = self.project_root / path
+        try:
+            mtime_ns = full_path.stat().st_mtime_ns
+            source = full_path.read_text(errors='replace')
+        except OSError:
+            return None
+        
+        package = self.PACKAGE_RE.search(source)
+        package = package.group(1) if package else ''
+        imports = []
+        for is_static, name in self.IMPORT_RE.findall(source):
+            if is_static:
+                # import static a.b.Util.method / a.b.Util.* -> a.b.Util
+                name = name.rsplit('.', 1)[0]
+            imports.append(name)
+        
+        body = self.NOISE_RE.sub(' ', source)
+        class_name = Path(path).stem
+        return {
+            "class": f"{package}.{class_name}" if package else class_name,
+            "mtime_ns": mtime_ns,
+            "imports": sorted(set(imports)),
+            "types": sorted(set(self.TYPE_RE.findall(body)) - {class_name}),
+        }
+    
+    def _walk_sources(self) -> list:
+        paths = []
+        for root in self.source_roots:
+            for java_file in (self.project_root / root).rglob("*.java"):
+                paths.append(java_file.relative_to(self.project_root).as_posix())
+        return paths
+    
+    def refresh(self, changed_files: list, known_files: list = ()):
+        """
+        Bring the graph up to date.
+        
+        Args:
+            changed_files: paths changed in the working tree
+            known_files: paths known to exist (e.g. from the test index);
+                any not yet in the graph are parsed
+        """
+        cached = {}
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'r') as f:
+                    cached = json.load(f)
+                if cached.get("version") != DEPENDENCY_GRAPH_VERSION:
+                    cached = {}
+            except (OSError, ValueError):
+                cached = {}
+        
+        head = self._git('rev-parse', 'HEAD')
+        self.files = cached.get("files", {})
+        
+        if not self.files:
+            dirty = set(self._walk_sources())
+        elif not head:
+            # No git to diff against: stat every source (only files whose
+            # mtime moved are re-parsed) and re-check cached ones for deletion
+            dirty = set(self._walk_sources()) | set(self.files)
+        else:
+            dirty = set(changed_files) | set(cached.get("changed", []))
+            if cached.get("head") != head:
+                diff = self._git('diff', '--name-only', cached.get("head", ''), head)
+                if diff or not cached.get("head"):
+                    dirty.update(diff.split('\n'))
+                else:
+                    dirty.update(self._walk_sources())
+            dirty.update(path for path in known_files if path not in self.files)
+        
+        updated = False
+        for path in dirty:
+            if not self._in_roots(path):
+                continue
+            entry = self.files.get(path)
+            full_path = self.project_root / path
+            if not full_path.exists():
+                if self.files.pop(path, None) is not None:
+                    updated = True
+                continue
+            if entry and entry["mtime_ns"] == full_path.stat().st_mtime_ns:
+                continue
+            entry = self._parse(path)
+            if entry is not None:
+                self.files[path] = entry
+                updated = True
+        
+        changed = sorted(path for path in changed_files if self._in_roots(path))
+        if updated or head != cached.get("head") or changed != cached.get("changed"):
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump({
+                    "version": DEPENDENCY_GRAPH_VERSION,
+                    "head": head,
+                    "changed": changed,
+                    "files": self.files,
+                }, f)
+            os.replace(tmp_file, self.cache_file)
+        
+        self._dependents = None
+    
+    def _build_reverse_edges(self):
+        """Resolve imports and references to build class -> dependents."""
+        classes = {entry["class"]: path for path, entry in self.files.items()}
+        packages = {}
+        for name in classes:
+            package, _, simple = name.rpartition('.')
+            packages.setdefault(package, {})[simple] = name
+        
+        dependents = {}
+        for path, entry in self.files.items():
+            package = entry["class"].rpartition('.')[0]
+            types = set(entry["types"])
+            deps = set()
+            
+            for name in entry["imports"]:
+                if name.endswith('.*'):
+                    members = packages.get(name[:-2], {})
+                    deps.update(members[t] for t in types if t in members)
+                    continue
+                # Nested class imports resolve to their outermost known class
+                while name and name not in classes:
+                    name = name.rpartition('.')[0]
+                if name:
+                    deps.add(name)
+            
+            same_package = packages.get(package, {})
+            deps.update(same_package[t] for t in types if t in same_package)
+            deps.discard(entry["class"])
+            
+            for dep in deps:
+                dependents.setdefault(dep, set()).add(path)
+        
+        self._classes = classes
+        self._dependents = dependents
+    
+    def class_of(self, path: str) -> str:
+        """Fully-qualified class name of a source path."""
+        entry = self.files.get(path)
+        if entry:
+            return entry["class"]
+        for root in self.source_roots:
+            if path.startswith(root + '/'):
+                path = path[len(root) + 1:]
+        return path[:-len('.java')].replace('/', '.') if path.endswith('.java') else path
+    
+    def dependents(self, path: str, depth: int) -> dict:
+        """
+        Files that depend on `path`, directly or transitively.
+        
+        Returns:
+            dependent file path -> number of hops (1 = direct dependency)
+        """
+        if self._dependents is None:
+            self._build_reverse_edges()
+        
+        found = {}
+        frontier = [self.class_of(path)]
+        for hops in range(1, depth + 1):
+            next_frontier = []
+            for name in frontier:
+                for dependent in self._dependents.get(name, ()):
+                    if dependent not in found and dependent != path:
+                        found[dependent] = hops
+                        next_frontier.append(self.files[dependent]["class"])
+            frontier = next_frontier
+        return found
+
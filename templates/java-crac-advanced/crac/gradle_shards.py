@@ -0,0 +1,124 @@
+# crac/gradle_shards.py
+# Concurrent Gradle test shards and JUnit XML result parsing
+
+import json
+import os
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from profiler import Profiler
+
+
+def to_class_filter(test_path: str) -> str:
+    """
+    Convert a test file path to the class name Gradle's --tests expects.
+    
+    src/test/java/com/example/FooTest.java -> com.example.FooTest
+    """
+    name = test_path.split('/test/java/', 1)[-1]
+    if name.endswith('.java'):
+        name = name[:-len('.java')]
+    return name.replace('/', '.')
+
+
+def shard_results_dir(project_root: Path, index: int) -> Path:
+    """JUnit XML directory of one shard (see -PtestShard in build.gradle)."""
+    return Path(project_root) / "build" / "test-results" / f"shard-{index}"
+
+
+def shard_result_cache(project_root: Path, index: int) -> Path:
+    """Result cache one shard's test task writes (see build.gradle)."""
+    return Path(project_root) / "build" / "cache" / f"test-results-shard-{index}.json"
+
+
+def merge_result_caches(project_root: Path, shards: int) -> dict:
+    """
+    Merge per-shard result caches into build/cache/test-results.json.
+    
+    Concurrent shards each write their own file, so none overwrites
+    another; the merged file is what a single `gradle test` run writes.
+    Shard files are removed once merged.
+    
+    Returns:
+        The merged cache
+    """
+    merged = {"version": 1, "timestamp": 0, "results": {}}
+    for index in range(shards):
+        shard_file = shard_result_cache(project_root, index)
+        try:
+            with open(shard_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        merged["results"].update(data.get("results", {}))
+        merged["timestamp"] = max(merged["timestamp"], data.get("timestamp", 0))
+        shard_file.unlink()
+    
+    cache_file = Path(project_root) / "build" / "cache" / "test-results.json"
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump(merged, f, indent=2)
+    os.replace(tmp_file, cache_file)
+    return merged
+
+
+def run_shards(buckets: list, project_root: Path, cache_dir: Path,
+               profiler: Profiler) -> list:
+    """
+    Run each bucket of tests as its own concurrent Gradle invocation.
+    
+    Each shard gets its own project cache, results directory and result
+    cache file so shards do not contend for locks or overwrite each
+    other. Test classes must already be compiled.
+    
+    Returns:
+        Gradle exit code per shard
+    """
+    def run_shard(index: int, bucket: list) -> int:
+        for stale in shard_results_dir(project_root, index).glob("*.xml"):
+            stale.unlink()
+        shard_result_cache(project_root, index).unlink(missing_ok=True)
+        cmd = [
+            './gradlew', 'test', f'-PtestShard={index}', '-q',
+            '--project-cache-dir', str(Path(cache_dir) / "shards" / str(index)),
+            '-x', 'compileJava', '-x', 'compileTestJava',
+            '-x', 'processResources', '-x', 'processTestResources',
+        ]
+        for test in bucket:
+            cmd += ['--tests', to_class_filter(test)]
+        return profiler.run(cmd, cwd=project_root).returncode
+    
+    with ThreadPoolExecutor(max_workers=max(1, len(buckets))) as pool:
+        return list(pool.map(run_shard, range(len(buckets)), buckets))
+
+
+def parse_junit_results(results_dir: Path, class_to_test: dict) -> dict:
+    """Aggregate JUnit XML reports to one result per test file."""
+    test_results = {}
+    for report in Path(results_dir).glob("TEST-*.xml"):
+        try:
+            suite = ET.parse(report).getroot()
+        except ET.ParseError as e:
+            print(f"Warning: Could not parse {report}: {e}")
+            continue
+        
+        test = class_to_test.get(suite.get("name"))
+        if test is None:
+            continue
+        
+        cases = int(suite.get("tests", 0))
+        broken = int(suite.get("failures", 0)) + int(suite.get("errors", 0))
+        if broken:
+            status = 'failed'
+        elif cases and int(suite.get("skipped", 0)) == cases:
+            status = 'skipped'
+        else:
+            status = 'passed'
+        
+        test_results[test] = {
+            "status": status,
+            "duration": float(suite.get("time", 0.0)),
+        }
+    return test_results
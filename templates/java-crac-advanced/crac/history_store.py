@@ -0,0 +1,172 @@
+# crac/history_store.py
+# SQLite store of test results for the predictive selector
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+
+class TestHistoryStore:
+    """
+    Append-only SQLite store of test results with per-test aggregates.
+    
+    Every recorded result is appended to `results`; `test_stats` keeps a
+    running aggregate per test (runs, failures, last failure, mean
+    duration, pass/fail flips) that is updated in the same transaction.
+    Recording costs O(new results), a lookup is one primary-key read, and
+    history is not truncated.
+    
+    Result values accepted by record_run():
+        "passed" / "failed" / "skipped"  (also SUCCESS, FAILURE, ...)
+        True / False
+        {"status": "...", "duration": <seconds>}
+    """
+    
+    __test__ = False  # a store, not a test case, despite the name
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            timestamp TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS results (
+            run_id INTEGER NOT NULL,
+            test TEXT NOT NULL,
+            status TEXT NOT NULL,
+            duration REAL
+        );
+        CREATE TABLE IF NOT EXISTS test_stats (
+            test TEXT PRIMARY KEY,
+            runs INTEGER NOT NULL,
+            failures INTEGER NOT NULL,
+            last_failure TEXT,
+            total_duration REAL NOT NULL,
+            timed_runs INTEGER NOT NULL,
+            last_status TEXT NOT NULL,
+            last_run TEXT NOT NULL,
+            flips INTEGER NOT NULL
+        );
+    """
+    
+    UPSERT_STATS = """
+        INSERT INTO test_stats (
+            test, runs, failures, last_failure, total_duration,
+            timed_runs, last_status, last_run, flips
+        )
+        VALUES (?, 1, ?, ?, ?, ?, ?, ?, 0)
+        ON CONFLICT(test) DO UPDATE SET
+            runs = runs + 1,
+            failures = failures + excluded.failures,
+            last_failure = COALESCE(excluded.last_failure, last_failure),
+            total_duration = total_duration + excluded.total_duration,
+            timed_runs = timed_runs + excluded.timed_runs,
+            flips = flips + (last_status != excluded.last_status),
+            last_status = excluded.last_status,
+            last_run = excluded.last_run
+    """
+    
+    STATUS_ALIASES = {
+        'passed': 'passed', 'pass': 'passed', 'success': 'passed',
+        'failed': 'failed', 'fail': 'failed', 'failure': 'failed', 'error': 'failed',
+    }
+    
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._conn = None
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open the database lazily so selector startup stays free."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+        return self._conn
+    
+    def close(self):
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    @classmethod
+    def _normalize(cls, result) -> tuple:
+        """Normalize a raw result to (status, duration_seconds or None)."""
+        duration = None
+        if isinstance(result, dict):
+            duration = result.get("duration")
+            if "status" in result:
+                result = result["status"]
+            else:
+                result = result.get("passed")
+        if isinstance(result, bool):
+            status = 'passed' if result else 'failed'
+        else:
+            status = cls.STATUS_ALIASES.get(str(result).lower(), 'skipped')
+        return status, float(duration) if duration is not None else None
+    
+    def record_run(self, test_results: dict, timestamp: str = None) -> int:
+        """Append one run of results and update per-test aggregates."""
+        timestamp = timestamp or datetime.now().isoformat()
+        rows = [(test, *self._normalize(result)) for test, result in test_results.items()]
+        
+        with self.conn:
+            run_id = self.conn.execute(
+                "INSERT INTO runs (timestamp) VALUES (?)", (timestamp,)
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT INTO results (run_id, test, status, duration) VALUES (?, ?, ?, ?)",
+                [(run_id, test, status, duration) for test, status, duration in rows]
+            )
+            self.conn.executemany(self.UPSERT_STATS, [
+                (
+                    test,
+                    int(status == 'failed'),
+                    timestamp if status == 'failed' else None,
+                    duration or 0.0,
+                    int(duration is not None),
+                    status,
+                    timestamp,
+                )
+                for test, status, duration in rows
+                if status != 'skipped'
+            ])
+        return run_id
+    
+    def failing_tests(self) -> list:
+        """Get tests whose most recent run failed."""
+        return [
+            row["test"] for row in self.conn.execute(
+                "SELECT test FROM test_stats WHERE last_status = 'failed'"
+            )
+        ]
+    
+    def get(self, test: str) -> dict:
+        """Get aggregated history for a test, or None if never run."""
+        row = self.conn.execute(
+            "SELECT * FROM test_stats WHERE test = ?", (test,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "runs": row["runs"],
+            "failures": row["failures"],
+            "last_failure": row["last_failure"],
+            "mean_duration": (
+                row["total_duration"] / row["timed_runs"] if row["timed_runs"] else None
+            ),
+            "last_status": row["last_status"],
+            "last_run": row["last_run"],
+            "flips": row["flips"],
+        }
+    
+    def import_json(self, json_file: Path):
+        """Import runs from the legacy test_history.json format."""
+        with open(json_file, 'r') as f:
+            history = json.load(f)
+        for run in history.get("runs", []):
+            self.record_run(run.get("tests", {}), run.get("timestamp"))
+
@@ -0,0 +1,50 @@
+# crac/package_trie.py
+# Package prefix tree for package-based test selection
+
+
+class PackageTrie:
+    """
+    Prefix tree of test files keyed by Java package segments.
+    
+    Finding the tests in a package and its subpackages walks one node per
+    segment, so a lookup costs O(depth + matches) instead of a scan over
+    every test path.
+    """
+    
+    def __init__(self):
+        self.children = {}
+        self.tests = []
+    
+    def insert(self, package: list, test: str):
+        """Add a test file under its package segments."""
+        node = self
+        for segment in package:
+            node = node.children.setdefault(segment, PackageTrie())
+        node.tests.append(test)
+    
+    def find(self, package: list) -> list:
+        """
+        Find tests in a package and its subpackages.
+        
+        Returns:
+            (test, distance) pairs, nearest first. Distance is the number of
+            package levels below the requested package (0 = same package).
+        """
+        node = self
+        for segment in package:
+            node = node.children.get(segment)
+            if node is None:
+                return []
+        
+        matches = []
+        level = [node]
+        distance = 0
+        while level:
+            next_level = []
+            for current in level:
+                matches.extend((test, distance) for test in current.tests)
+                next_level.extend(current.children[name] for name in sorted(current.children))
+            level = next_level
+            distance += 1
+        return matches
+
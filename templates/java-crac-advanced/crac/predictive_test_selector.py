@@ -3,14 +3,36 @@
 # Google JiGaSi-inspired predictive test selection
 # Uses heuristics to predict which tests will fail
 
-import os
 import sys
 import json
-import subprocess
-import hashlib
-from datetime import datetime
+import sqlite3
 from pathlib import Path
 
+from change_risk import ChangeAnalyzer
+from dependency_graph import DEFAULT_DEPENDENCY_DEPTH, DEPENDENCY_DECAY, DependencyGraph
+from gradle_shards import (
+    merge_result_caches,
+    parse_junit_results,
+    run_shards,
+    shard_results_dir,
+    to_class_filter,
+)
+from history_store import TestHistoryStore
+from package_trie import PackageTrie
+from profiler import Profiler, profiled
+from scheduler import (
+    DEFAULT_BUDGET_SECONDS,
+    expected_seconds,
+    failure_probability,
+    pack_tests,
+    shard_tests,
+)
+from selector_daemon import SelectorDaemon, query_daemon
+from suite_index import build_test_index, refresh_test_dirs
+
+PACKAGE_RISK = 0.2                # prior for a same-package test, halved per level
+
+
 class PredictiveTestSelector:
     """
     Predicts which tests are likely to fail based on code changes.
@@ -19,99 +41,52 @@ class PredictiveTestSelector:
     In production, this would use a trained ML model.
     """
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: str = ".",
+                 dependency_depth: int = DEFAULT_DEPENDENCY_DEPTH):
         self.project_root = Path(project_root)
+        self.dependency_depth = dependency_depth
+        self.profiler = Profiler()
         self.cache_dir = self.project_root / "build" / "cache" / "predictive"
-        self.test_history_file = self.cache_dir / "test_history.json"
+        self.test_history_file = self.cache_dir / "test_history.db"
+        self.legacy_history_file = self.cache_dir / "test_history.json"
         self.change_cache_file = self.cache_dir / "changes.json"
+        self.test_index_file = self.cache_dir / "test_index.json"
+        self.dependency_graph_file = self.cache_dir / "dep_graph.json"
+        self.test_root = Path("src") / "test" / "java"
+        self.source_roots = [Path("src") / "main" / "java", self.test_root]
         
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Load historical data
-        self.test_history = self._load_test_history()
-    
-    def _load_test_history(self) -> dict:
-        """Load historical test results."""
-        if self.test_history_file.exists():
-            with open(self.test_history_file, 'r') as f:
-                return json.load(f)
-        return {"runs": []}
-    
-    def _save_test_history(self):
-        """Save test history."""
-        with open(self.test_history_file, 'w') as f:
-            json.dump(self.test_history, f, indent=2)
-    
-    def _get_changed_files(self) -> list:
-        """Get list of changed files since last commit."""
-        try:
-            # Get staged files
-            result = subprocess.run(
-                ['git', 'diff', '--cached', '--name-only', '--diff-filter=ACM'],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True
-            )
-            staged = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            
-            # Get modified files
-            result = subprocess.run(
-                ['git', 'diff', '--name-only', '--diff-filter=ACM'],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True
-            )
-            modified = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            
-            return list(set(staged + modified))
-        except Exception as e:
-            print(f"Warning: Could not get changed files: {e}")
-            return []
-    
-    def _calculate_file_risk(self, file_path: str) -> float:
-        """
-        Calculate risk score for a file based on heuristics.
-        Returns 0.0 (low risk) to 1.0 (high risk).
-        """
-        risk = 0.0
-        
-        # High-risk patterns
-        high_risk_patterns = [
-            'controller', 'service', 'repository',
-            'security', 'auth', 'payment',
-            'transaction', 'workflow'
-        ]
-        
-        file_lower = file_path.lower()
+        # Historical data (opened lazily on first lookup or record)
+        self.history = TestHistoryStore(self.test_history_file)
+        self._migrate_legacy_history()
         
-        # Check for high-risk patterns
-        for pattern in high_risk_patterns:
-            if pattern in file_lower:
-                risk += 0.2
+        # Changed files and per-file risk, with file recency cached
+        self.changes = ChangeAnalyzer(self.project_root, self.profiler)
         
-        # File extension risk
-        if file_path.endswith('.java'):
-            risk += 0.1
+        # Test index, refreshed at most once per selector instance
+        self._test_index = None
+        self._package_trie = None
+        self._dependency_graph = None
         
-        # Recently modified files are higher risk
+        # Budget, estimated time and risk coverage of the last selection
+        self.last_report = {}
+    
+    @profiled("history")
+    def _migrate_legacy_history(self):
+        """One-time import of test_history.json into the SQLite store."""
+        if not self.legacy_history_file.exists():
+            return
         try:
-            result = subprocess.run(
-                ['git', 'log', '-1', '--format=%ai', '--', file_path],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True
+            self.history.import_json(self.legacy_history_file)
+            self.legacy_history_file.rename(
+                self.legacy_history_file.with_suffix('.json.migrated')
             )
-            if result.stdout.strip():
-                commit_date = datetime.fromisoformat(result.stdout.strip().split(' ')[0])
-                days_ago = (datetime.now() - commit_date).days
-                if days_ago < 7:
-                    risk += 0.1
-        except:
-            pass
-        
-        return min(risk, 1.0)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            print(f"Warning: Could not migrate test history: {e}")
     
+    @profiled("find_related_tests")
     def _find_related_tests(self, file_path: str) -> list:
         """Find tests related to a changed file."""
         tests = []
@@ -129,80 +104,157 @@ class PredictiveTestSelector:
                 test_path.replace('Test.java', 'IT.java'),
             ]
             
+            # Indexed test tree: dictionary lookup instead of filesystem probes
+            if test_path.startswith(self.test_root.as_posix() + '/'):
+                source_key = test_path[:-len('Test.java')]
+                indexed = set(self._get_test_index()["sources"].get(source_key, []))
+                return [alt for alt in alternatives if alt in indexed]
+            
             for alt in alternatives:
                 if Path(self.project_root / alt).exists():
                     tests.append(alt)
         
         return tests
     
-    def _select_tests(self, changed_files: list) -> list:
+    @profiled("find_dependent_tests")
+    def _find_dependent_tests(self, file_path: str, changed_files: list) -> dict:
+        """
+        Find tests that depend on a changed file through the import graph.
+        
+        Returns:
+            test path -> dependency hops, up to self.dependency_depth
+        """
+        if self.dependency_depth <= 0 or not file_path.endswith('.java'):
+            return {}
+        
+        graph = self._get_dependency_graph(changed_files)
+        known_tests = self._get_test_index()["test_set"]
+        return {
+            path: hops
+            for path, hops in graph.dependents(file_path, self.dependency_depth).items()
+            if path in known_tests
+        }
+    
+    @profiled("dependency_graph")
+    def _get_dependency_graph(self, changed_files: list) -> DependencyGraph:
+        """Refresh the dependency graph once per selector."""
+        if self._dependency_graph is None:
+            graph = DependencyGraph(
+                self.project_root,
+                self.dependency_graph_file,
+                self.source_roots,
+                self.profiler,
+            )
+            graph.refresh(changed_files, self._get_test_index()["tests"])
+            self._dependency_graph = graph
+        return self._dependency_graph
+    
+    def _select_tests(self, changed_files: list,
+                      budget_seconds: float = DEFAULT_BUDGET_SECONDS) -> list:
         """
         Select tests likely to fail based on changed files.
         
         Strategy:
         1. Calculate risk for each changed file
-        2. Find related tests
-        3. Prioritize high-risk tests
-        4. Limit to reasonable number (max 20% of total tests)
+        2. Find related tests by name and through reverse dependencies
+           (risk decays per hop), plus tests whose last run failed
+        3. Score each test by failure probability and expected duration
+        4. Fill the time budget with the most failures per second
         """
-        selected_tests = []
-        file_risks = []
+        candidates = {}
+        
+        # One git pass for all changed files instead of one per file
+        self.changes.load_recency(changed_files)
         
         for file_path in changed_files:
-            risk = self._calculate_file_risk(file_path)
+            risk = self.changes.file_risk(file_path)
             related_tests = self._find_related_tests(file_path)
             
             for test in related_tests:
-                file_risks.append((test, risk))
+                candidates[test] = max(risk, candidates.get(test, 0.0))
+            
+            for test, hops in self._find_dependent_tests(file_path, changed_files).items():
+                dependent_risk = risk * DEPENDENCY_DECAY ** hops
+                candidates[test] = max(dependent_risk, candidates.get(test, 0.0))
         
-        # Sort by risk (highest first)
-        file_risks.sort(key=lambda x: x[1], reverse=True)
+        # Broken tests stay candidates until they pass again
+        known_tests = self._get_test_index()["test_set"]
+        for test in self.history.failing_tests():
+            if test in known_tests:
+                candidates.setdefault(test, 0.0)
         
-        # Get all tests
-        all_tests = self._get_all_tests()
+        scored = []
+        for test, risk in candidates.items():
+            probability, seconds = self._score_test(test, risk)
+            if probability > 0:
+                scored.append((test, probability, seconds))
         
-        # Limit selection to 20% of total tests
-        max_tests = max(1, int(len(all_tests) * 0.2))
+        return self._pack_tests(scored, budget_seconds)
+    
+    def _score_test(self, test: str, file_risk: float) -> tuple:
+        """
+        Score a candidate test from its change risk and its history.
         
-        # Select tests
-        for test, risk in file_risks:
-            if len(selected_tests) >= max_tests:
-                break
-            if test not in selected_tests and risk > 0:
-                selected_tests.append(test)
+        Returns:
+            (failure probability 0.0-1.0, expected duration in seconds)
+        """
+        history = self._get_test_result_history(test)
+        return failure_probability(file_risk, history), expected_seconds(test, history)
+    
+    @profiled("pack_tests")
+    def _pack_tests(self, scored: list, budget_seconds: float) -> list:
+        """
+        Pack (test, probability, seconds) tuples into the time budget.
         
-        return selected_tests
+        The outcome is stored in self.last_report; see scheduler.pack_tests.
+        """
+        selected, self.last_report = pack_tests(scored, budget_seconds)
+        return selected
     
+    @profiled("get_all_tests")
     def _get_all_tests(self) -> list:
         """Get list of all test files."""
-        test_dir = self.project_root / "src" / "test" / "java"
-        if not test_dir.exists():
-            return []
-        
-        tests = []
-        for java_file in test_dir.rglob("*Test.java"):
-            tests.append(str(java_file.relative_to(self.project_root)))
+        return [
+            test for test in self._get_test_index()["tests"]
+            if test.endswith('Test.java')
+        ]
+    
+    @profiled("test_index")
+    def _get_test_index(self) -> dict:
+        """
+        Get the test index, refreshing the on-disk copy on first use.
         
-        return tests
+        See suite_index.build_test_index for the returned tables.
+        """
+        if self._test_index is None:
+            self._test_index = build_test_index(
+                refresh_test_dirs(self.project_root, self.test_root, self.test_index_file)
+            )
+        return self._test_index
     
+    @profiled("history")
     def _get_test_result_history(self, test_name: str) -> dict:
-        """Get historical results for a test."""
-        for run in reversed(self.test_history.get("runs", [])):
-            if test_name in run.get("tests", {}):
-                return run["tests"][test_name]
-        return None
+        """Get aggregated historical results for a test."""
+        return self.history.get(test_name)
     
-    def select(self) -> list:
+    def select(self, budget_seconds: float = DEFAULT_BUDGET_SECONDS,
+               changed_files: list = None) -> list:
         """
         Main method: Select tests likely to fail.
         
+        Args:
+            budget_seconds: expected test time the selection may use
+            changed_files: changed paths, read from git when omitted
+        
         Returns:
             List of test class names to run
         """
         print("Analyzing changes...")
+        self.last_report = {}
         
         # Get changed files
-        changed_files = self._get_changed_files()
+        if changed_files is None:
+            changed_files = self.changes.changed_files()
         print(f"Changed files: {len(changed_files)}")
         
         if not changed_files:
@@ -210,52 +262,119 @@ class PredictiveTestSelector:
             return self._get_all_tests()
         
         # Calculate risks and select tests
-        selected = self._select_tests(changed_files)
+        selected = self._select_tests(changed_files, budget_seconds)
         
         # If no related tests found, run tests for changed packages
         if not selected:
             print("No direct test matches, using package-based selection")
-            selected = self._select_by_package(changed_files)
+            selected = self._select_by_package(changed_files, budget_seconds)
         
         print(f"Selected {len(selected)} tests for execution")
+        if self.last_report:
+            print(
+                f"  Estimated time: {self.last_report['estimated_seconds']}s "
+                f"of {self.last_report['budget_seconds']}s budget, "
+                f"risk coverage: {self.last_report['risk_coverage']:.0%}"
+            )
         
         if selected:
             print(f"  First 5: {selected[:5]}")
         
         return selected
     
-    def _select_by_package(self, changed_files: list) -> list:
-        """Select tests by package of changed files."""
-        selected = []
-        all_tests = self._get_all_tests()
+    @profiled("select_by_package")
+    def _select_by_package(self, changed_files: list,
+                           budget_seconds: float = DEFAULT_BUDGET_SECONDS) -> list:
+        """
+        Select tests by package of changed files.
+        
+        Tests in the same package get PACKAGE_RISK as their prior, halved
+        for each level of nesting below the changed package; each test keeps
+        its closest distance to any changed file. The scored tests are then
+        packed into the time budget like direct matches.
+        """
+        trie = self._get_package_trie()
+        distances = {}
         
         for file_path in changed_files:
             # Extract package from main source
-            if '/main/' in file_path:
-                parts = file_path.split('/main/java/')[-1].replace('/', '.').replace('.java', '')
-            else:
+            if '/main/java/' not in file_path:
                 continue
+            package = file_path.split('/main/java/')[-1].split('/')[:-1]
             
             # Find tests in same package or subpackages
-            for test in all_tests:
-                if parts in test or any(part in test for part in parts.split('.')):
-                    if test not in selected:
-                        selected.append(test)
+            for test, distance in trie.find(package):
+                if distance < distances.get(test, distance + 1):
+                    distances[test] = distance
+        
+        scored = []
+        for test, distance in distances.items():
+            probability, seconds = self._score_test(test, PACKAGE_RISK * 0.5 ** distance)
+            scored.append((test, probability, seconds))
         
-        return selected[:20]  # Limit to 20 tests
+        return self._pack_tests(scored, budget_seconds)
     
-    def record_results(self, test_results: dict):
-        """Record test results for future predictions."""
-        self.test_history["runs"].append({
-            "timestamp": datetime.now().isoformat(),
-            "tests": test_results
-        })
+    def _get_package_trie(self) -> PackageTrie:
+        """Build the package trie over all tests once per selector."""
+        if self._package_trie is None:
+            root = self.test_root.as_posix() + '/'
+            self._package_trie = PackageTrie()
+            for test in self._get_all_tests():
+                if test.startswith(root):
+                    package = test[len(root):].split('/')[:-1]
+                    self._package_trie.insert(package, test)
+        return self._package_trie
+    
+    def _shard_tests(self, tests: list, shards: int) -> list:
+        """Split tests into shards balanced by expected duration."""
+        timed = [
+            (test, expected_seconds(test, self._get_test_result_history(test)))
+            for test in tests
+        ]
+        return shard_tests(timed, shards)
+    
+    def run_tests(self, tests: list, shards: int = 1) -> int:
+        """
+        Run tests as concurrent Gradle shards and record their results.
+        
+        Test classes are compiled once, then each shard runs in its own
+        Gradle invocation (see gradle_shards.run_shards). The shards' result
+        caches are merged into build/cache/test-results.json, and their JUnit
+        XML reports are merged and fed back into record_results.
+        
+        Returns:
+            0 if every shard succeeded, otherwise the first non-zero exit code
+        """
+        if not tests:
+            return 0
+        
+        compile_cmd = ['./gradlew', 'testClasses', '-q']
+        result = self.profiler.run(compile_cmd, cwd=self.project_root)
+        if result.returncode != 0:
+            return result.returncode
+        
+        buckets = self._shard_tests(tests, shards)
+        class_to_test = {to_class_filter(test): test for test in tests}
+        print(f"Running {len(tests)} tests in {len(buckets)} shard(s)...")
+        exit_codes = run_shards(buckets, self.project_root, self.cache_dir, self.profiler)
+        merge_result_caches(self.project_root, len(buckets))
+        
+        test_results = {}
+        for index in range(len(buckets)):
+            results_dir = shard_results_dir(self.project_root, index)
+            test_results.update(parse_junit_results(results_dir, class_to_test))
+        if test_results:
+            self.record_results(test_results)
         
-        # Keep only last 100 runs
-        if len(self.test_history["runs"]) > 100:
-            self.test_history["runs"] = self.test_history["runs"][-100:]
+        failed = sum(1 for r in test_results.values() if r["status"] == 'failed')
+        print(f"Recorded {len(test_results)} test results ({failed} failed)")
         
-        self._save_test_history()
+        return next((code for code in exit_codes if code != 0), 0)
+    
+    @profiled("record_results")
+    def record_results(self, test_results: dict):
+        """Record test results for future predictions."""
+        self.history.record_run(test_results)
 
 
 def main():
@@ -279,11 +398,77 @@ def main():
         action='store_true',
         help='Run selected tests immediately'
     )
+    parser.add_argument(
+        '--budget-seconds', '-b',
+        type=float,
+        default=DEFAULT_BUDGET_SECONDS,
+        help='Expected test time budget to pack selected tests into'
+    )
+    parser.add_argument(
+        '--shards', '-j',
+        type=int,
+        default=1,
+        help='Number of concurrent Gradle shards for --run'
+    )
+    parser.add_argument(
+        '--depth', '-d',
+        type=int,
+        default=DEFAULT_DEPENDENCY_DEPTH,
+        help='Reverse-dependency hops to follow from changed files (0 disables)'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='-',
+        metavar='FILE',
+        help='Emit per-phase timings and subprocess counts as JSON (stdout by default)'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Run as a daemon that keeps state in memory and answers queries'
+    )
+    parser.add_argument(
+        '--no-daemon',
+        action='store_true',
+        help='Select in-process even if a --watch daemon is running'
+    )
     
     args = parser.parse_args()
     
-    selector = PredictiveTestSelector(args.project)
-    selected_tests = selector.select()
+    cache_dir = Path(args.project) / "build" / "cache" / "predictive"
+    
+    if args.watch:
+        SelectorDaemon(PredictiveTestSelector(args.project, args.depth)).serve()
+        return []
+    
+    response = None
+    if not args.no_daemon and not args.profile:
+        response = query_daemon(
+            cache_dir, {"budget_seconds": args.budget_seconds, "depth": args.depth}
+        )
+    
+    if response is not None and "tests" in response:
+        selector = None
+        selected_tests = response["tests"]
+        print(f"Selected {len(selected_tests)} tests via daemon "
+              f"in {response['elapsed_ms']} ms")
+    else:
+        selector = PredictiveTestSelector(args.project, args.depth)
+        selected_tests = selector.select(budget_seconds=args.budget_seconds)
+    
+    if args.profile:
+        profile = {
+            "selected": len(selected_tests),
+            "report": selector.last_report,
+            **selector.profiler.to_dict(),
+        }
+        if args.profile == '-':
+            print(json.dumps(profile, indent=2))
+        else:
+            with open(args.profile, 'w') as f:
+                json.dump(profile, f, indent=2)
+            print(f"Profile written to {args.profile}")
     
     if args.output:
         with open(args.output, 'w') as f:
@@ -292,8 +477,11 @@ def main():
     
     if args.run:
         print("Running selected tests...")
-        cmd = ['./gradlew', 'test', '--tests', ' '.join(selected_tests)]
-        subprocess.run(cmd, cwd=args.project)
+        if selector is None:
+            selector = PredictiveTestSelector(args.project, args.depth)
+        exit_code = selector.run_tests(selected_tests, shards=args.shards)
+        if exit_code != 0:
+            sys.exit(exit_code)
     
     return selected_tests
 
@@ -0,0 +1,72 @@
+# crac/profiler.py
+# Per-phase timings and subprocess counts for the predictive selector
+
+import functools
+import subprocess
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class Profiler:
+    """
+    Per-phase wall-clock timings and subprocess counts.
+    
+    Phases nest, so a phase's time includes any phases it calls. All
+    subprocesses the selector starts go through run()/popen() so they
+    are counted by command (e.g. "git log").
+    """
+    
+    def __init__(self):
+        self.phases = {}
+        self.subprocesses = {}
+    
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block of work under a phase name."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats = self.phases.setdefault(name, {"calls": 0, "seconds": 0.0})
+            stats["calls"] += 1
+            stats["seconds"] += time.perf_counter() - started
+    
+    def _count(self, cmd: list):
+        name = Path(cmd[0]).name
+        if name == 'git' and len(cmd) > 1:
+            name = f"git {cmd[1]}"
+        self.subprocesses[name] = self.subprocesses.get(name, 0) + 1
+    
+    def run(self, cmd: list, **kwargs) -> subprocess.CompletedProcess:
+        """Counted subprocess.run."""
+        self._count(cmd)
+        return subprocess.run(cmd, **kwargs)
+    
+    def popen(self, cmd: list, **kwargs) -> subprocess.Popen:
+        """Counted subprocess.Popen."""
+        self._count(cmd)
+        return subprocess.Popen(cmd, **kwargs)
+    
+    def to_dict(self) -> dict:
+        """Timings in milliseconds plus subprocess counts, JSON-ready."""
+        return {
+            "phases": {
+                name: {"calls": stats["calls"], "ms": round(stats["seconds"] * 1000, 3)}
+                for name, stats in self.phases.items()
+            },
+            "subprocesses": dict(self.subprocesses),
+            "subprocess_total": sum(self.subprocesses.values()),
+        }
+
+
+def profiled(phase: str):
+    """Record a method's time under `phase` in its object's profiler."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.profiler.phase(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
@@ -0,0 +1,157 @@
+# crac/scheduler.py
+# Failure scoring, time-budget packing and shard balancing for selected tests
+
+import heapq
+from datetime import datetime
+
+# Scoring model: expected test time budget and history weighting
+DEFAULT_BUDGET_SECONDS = 30.0
+DEFAULT_TEST_SECONDS = 1.0        # unit test with no recorded duration
+DEFAULT_IT_SECONDS = 20.0         # *IT.java with no recorded duration
+FAILURE_HALF_LIFE_DAYS = 7.0      # weight of a past failure halves weekly
+FAILURE_RATE_WEIGHT = 0.5
+FAILURE_RECENCY_WEIGHT = 0.5
+FLAKY_DISCOUNT = 0.5              # max discount for tests that flip every run
+KNAPSACK_SLOTS = 200              # time resolution of the budget packer
+
+
+def expected_seconds(test: str, history: dict = None) -> float:
+    """Expected duration of a test: recorded mean, else a per-kind default."""
+    if history and history["mean_duration"] is not None:
+        return history["mean_duration"]
+    if test.endswith('IT.java'):
+        return DEFAULT_IT_SECONDS
+    return DEFAULT_TEST_SECONDS
+
+
+def failure_probability(file_risk: float, history: dict = None,
+                        now: datetime = None) -> float:
+    """
+    Score a candidate test from its change risk and its history.
+
+    The historical signal mixes failure frequency with an exponentially
+    decaying weight on the last failure, and is discounted for flaky
+    tests whose outcome flips between runs regardless of changes.
+
+    Args:
+        file_risk: risk of the change that made the test a candidate
+        history: aggregates from TestHistoryStore.get(), or None
+        now: reference time for failure recency (default: now)
+
+    Returns:
+        Failure probability 0.0-1.0
+    """
+    if not history or not history["runs"]:
+        return file_risk
+
+    failure_rate = history["failures"] / history["runs"]
+
+    recency = 0.0
+    if history["last_failure"]:
+        last_failure = datetime.fromisoformat(history["last_failure"])
+        now = now or datetime.now()
+        days_ago = max(0.0, (now - last_failure).total_seconds() / 86400)
+        recency = 0.5 ** (days_ago / FAILURE_HALF_LIFE_DAYS)
+
+    flakiness = history["flips"] / max(1, history["runs"] - 1)
+
+    historical = (
+        FAILURE_RATE_WEIGHT * failure_rate + FAILURE_RECENCY_WEIGHT * recency
+    ) * (1 - FLAKY_DISCOUNT * min(flakiness, 1.0))
+
+    probability = 1 - (1 - file_risk) * (1 - historical)
+    return min(probability, 1.0)
+
+
+def pack_tests(scored: list, budget_seconds: float) -> tuple:
+    """
+    Pick the tests with the highest expected failures that fit the budget.
+
+    0/1 knapsack over expected durations rounded up to KNAPSACK_SLOTS
+    time slots, so the result never exceeds the budget. The greedy
+    failures-per-second fill is kept as a fallback and the better of
+    the two wins.
+
+    Args:
+        scored: (test, probability, seconds) tuples
+        budget_seconds: total expected test time allowed
+
+    Returns:
+        (selected tests highest failure probability first, report dict)
+    """
+    items = [item for item in scored if item[2] <= budget_seconds]
+
+    # Greedy: highest failure probability per second first
+    greedy = []
+    remaining = budget_seconds
+    for item in sorted(items, key=lambda i: i[1] / max(i[2], 1e-3), reverse=True):
+        if item[2] <= remaining:
+            greedy.append(item)
+            remaining -= item[2]
+
+    chosen = greedy
+    if len(greedy) < len(items):
+        packed = knapsack(items, budget_seconds)
+        if sum(i[1] for i in packed) > sum(i[1] for i in chosen):
+            chosen = packed
+
+    chosen.sort(key=lambda item: item[1], reverse=True)
+
+    total_risk = sum(item[1] for item in scored)
+    selected_risk = sum(item[1] for item in chosen)
+    report = {
+        "budget_seconds": budget_seconds,
+        "estimated_seconds": round(sum(item[2] for item in chosen), 3),
+        "candidates": len(scored),
+        "selected": len(chosen),
+        "expected_failures": round(selected_risk, 3),
+        "risk_coverage": round(selected_risk / total_risk, 3) if total_risk else 1.0,
+    }
+
+    return [item[0] for item in chosen], report
+
+
+def knapsack(items: list, budget_seconds: float) -> list:
+    """Exact 0/1 knapsack on (test, probability, seconds) items."""
+    slot = max(budget_seconds, 1e-3) / KNAPSACK_SLOTS
+    weights = [int(-(-item[2] // slot)) for item in items]
+
+    best = [0.0] * (KNAPSACK_SLOTS + 1)
+    taken = []
+    for item, weight in zip(items, weights):
+        took = bytearray(KNAPSACK_SLOTS + 1)
+        value = item[1]
+        for capacity in range(KNAPSACK_SLOTS, weight - 1, -1):
+            candidate = best[capacity - weight] + value
+            if candidate > best[capacity]:
+                best[capacity] = candidate
+                took[capacity] = 1
+        taken.append(took)
+
+    chosen = []
+    capacity = KNAPSACK_SLOTS
+    for index in range(len(items) - 1, -1, -1):
+        if taken[index][capacity]:
+            chosen.append(items[index])
+            capacity -= weights[index]
+    return chosen
+
+
+def shard_tests(timed: list, shards: int) -> list:
+    """
+    Split (test, seconds) pairs into shards balanced by expected duration.
+
+    Longest-processing-time first: each test, slowest first, goes to
+    the shard with the least expected time so far.
+
+    Returns:
+        One list of tests per shard
+    """
+    shards = max(1, min(shards, len(timed)))
+    heap = [(0.0, index) for index in range(shards)]
+    buckets = [[] for _ in range(shards)]
+    for test, seconds in sorted(timed, key=lambda pair: (pair[1], pair[0]), reverse=True):
+        load, index = heapq.heappop(heap)
+        buckets[index].append(test)
+        heapq.heappush(heap, (load + seconds, index))
+    return buckets
@@ -0,0 +1,316 @@
+# crac/selector_daemon.py
+# Long-lived predictive selector answering queries over a Unix socket
+
+import errno
+import hashlib
+import json
+import os
+import selectors
+import socket
+import struct
+import tempfile
+import time
+from pathlib import Path
+
+from scheduler import DEFAULT_BUDGET_SECONDS
+
+# Directories the daemon never watches: VCS internals and build output,
+# which the selector and Gradle write to on every run
+WATCH_EXCLUDE = ('.git', '.gradle', 'build')
+CLIENT_TIMEOUT = 2.0              # seconds a client may take to send its request
+
+
+class InotifyWatcher:
+    """
+    Recursive inotify watcher over a set of directories (Linux, via ctypes).
+    
+    read_events() drains pending events without blocking and returns the
+    changed paths; directories created later are watched automatically.
+    Directories named in `exclude` are skipped when recursing. Running out
+    of watches (ENOSPC) raises OSError instead of leaving directories
+    silently unwatched.
+    """
+    
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    
+    MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+            | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+    EVENT_HEADER = struct.Struct('iIII')
+    
+    def __init__(self, exclude: tuple = ()):
+        import ctypes
+        import ctypes.util
+        
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._get_errno = ctypes.get_errno
+        self.fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._paths = {}
+        self.exclude = frozenset(exclude)
+    
+    def watch(self, directory: Path, recursive: bool = True):
+        """Watch a directory, and its subdirectories when recursive."""
+        pending = [Path(directory)]
+        while pending:
+            path = pending.pop()
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+            if wd < 0:
+                error = self._get_errno()
+                if error in (errno.ENOENT, errno.ENOTDIR):
+                    continue  # removed before we got to it
+                raise OSError(error, f"inotify_add_watch failed for {path}: "
+                                     f"{os.strerror(error)}")
+            self._paths[wd] = path
+            if recursive:
+                try:
+                    with os.scandir(path) as it:
+                        pending.extend(
+                            Path(e.path) for e in it
+                            if e.is_dir(follow_symlinks=False) and e.name not in self.exclude
+                        )
+                except OSError:
+                    pass
+    
+    def read_events(self) -> list:
+        """Drain pending events and return the paths they touched."""
+        changed = []
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                
+                parent = self._paths.get(wd)
+                if parent is None:
+                    continue
+                path = parent / os.fsdecode(name) if name else parent
+                changed.append(path)
+                if (mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO)
+                        and path.name not in self.exclude):
+                    self.watch(path)
+                if mask & self.IN_DELETE_SELF:
+                    self._paths.pop(wd, None)
+    
+    def close(self):
+        """Stop watching."""
+        os.close(self.fd)
+
+
+class SelectorDaemon:
+    """
+    Long-lived predictive selector answering queries over a Unix socket.
+    
+    The test index, package trie and history connection stay in memory.
+    inotify events anywhere in the project (except WATCH_EXCLUDE) and on
+    .git/ itself mark the cached change set or test index stale, so a
+    query with no intervening edits is answered without any git
+    subprocess or filesystem walk. Without inotify, or once it runs out
+    of watches, every query drops all cached state and re-scans.
+    
+    Protocol: one JSON request per connection, one JSON line back. A
+    client that sends nothing for CLIENT_TIMEOUT seconds is dropped.
+        {"budget_seconds": 5, "depth": 2}
+                               -> {"tests": [...], "report": {...}, "elapsed_ms": 1.2}
+        {"command": "ping"}    -> {"ok": true}
+        {"command": "shutdown"}
+    """
+    
+    def __init__(self, selector):
+        self.selector = selector
+        self.socket_path = daemon_socket_path(selector.cache_dir)
+        self._changed_files = None
+        self._default_depth = selector.dependency_depth
+        self._running = False
+        self._events = None
+        try:
+            self.watcher = InotifyWatcher(exclude=WATCH_EXCLUDE)
+        except (OSError, AttributeError, TypeError) as e:
+            print(f"Warning: inotify unavailable, re-scanning on every query: {e}")
+            self.watcher = None
+    
+    def _on_changes(self, paths: list):
+        """Invalidate cached state touched by file changes."""
+        if not paths:
+            return
+        self._changed_files = None
+        
+        project_root = self.selector.project_root
+        test_root = (project_root / self.selector.test_root).resolve()
+        source_roots = [(project_root / root).resolve() for root in self.selector.source_roots]
+        git_dir = (project_root / '.git').resolve()
+        for path in paths:
+            path = Path(path).resolve()
+            # Only source edits touch the import graph; anything else would
+            # just force a full re-read of dep_graph.json
+            if any(path == root or root in path.parents or path in root.parents
+                   for root in source_roots):
+                if path.suffix == '.java' or not path.suffix:
+                    self.selector._dependency_graph = None
+            if path == test_root or test_root in path.parents:
+                self.selector._test_index = None
+                self.selector._package_trie = None
+            elif path == git_dir or git_dir in path.parents:
+                # Commits and checkouts move file recency
+                self.selector.changes.recency.clear()
+    
+    def _invalidate_all(self):
+        """Drop every cached structure; used when nothing tells us what changed."""
+        self._changed_files = None
+        self.selector._dependency_graph = None
+        self.selector._test_index = None
+        self.selector._package_trie = None
+        self.selector.changes.recency.clear()
+    
+    def _read_changes(self):
+        """Apply pending watcher events, or invalidate everything without a watcher."""
+        if self.watcher is not None:
+            try:
+                self._on_changes(self.watcher.read_events())
+                return
+            except OSError as e:
+                self._stop_watching(e)
+        self._invalidate_all()
+    
+    def _stop_watching(self, error: OSError):
+        """Switch to re-scanning on every query once inotify can't keep up."""
+        print(f"Warning: inotify watch failed, re-scanning on every query: {error}")
+        if self._events is not None:
+            self._events.unregister(self.watcher.fd)
+        self.watcher.close()
+        self.watcher = None
+    
+    def _handle(self, request: dict) -> dict:
+        """Answer a single client request."""
+        command = request.get("command", "select")
+        if command == "ping":
+            return {"ok": True}
+        if command == "shutdown":
+            self._running = False
+            return {"ok": True}
+        
+        started = time.perf_counter()
+        self._read_changes()
+        
+        if self._changed_files is None:
+            self._changed_files = self.selector.changes.changed_files()
+        self.selector.dependency_depth = int(request.get("depth", self._default_depth))
+        tests = self.selector.select(
+            budget_seconds=float(request.get("budget_seconds", DEFAULT_BUDGET_SECONDS)),
+            changed_files=list(self._changed_files),
+        )
+        return {
+            "tests": tests,
+            "report": self.selector.last_report,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+    
+    def watch_project(self):
+        """Watch the whole project tree, plus .git/ itself for commits and staging."""
+        if self.watcher is None:
+            return
+        try:
+            self.watcher.watch(self.selector.project_root)
+            git_dir = self.selector.project_root / ".git"
+            if git_dir.is_dir():
+                self.watcher.watch(git_dir, recursive=False)
+        except OSError as e:
+            self._stop_watching(e)
+    
+    def serve(self):
+        """Watch the project and answer queries until shut down."""
+        self.watch_project()
+        
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(self.socket_path))
+        server.listen(16)
+        
+        events = self._events = selectors.DefaultSelector()
+        events.register(server, selectors.EVENT_READ, "client")
+        if self.watcher is not None:
+            events.register(self.watcher.fd, selectors.EVENT_READ, "watch")
+        
+        # Warm the index and history before the first query
+        self.selector._get_package_trie()
+        
+        print(f"Predictive selector daemon listening on {self.socket_path}")
+        self._running = True
+        try:
+            while self._running:
+                for key, _ in events.select():
+                    if key.data == "watch":
+                        self._read_changes()
+                        continue
+                    conn, _ = server.accept()
+                    with conn:
+                        conn.settimeout(CLIENT_TIMEOUT)
+                        try:
+                            line = conn.makefile('r').readline()
+                        except OSError:
+                            # Idle or vanished client: drop it, keep serving
+                            continue
+                        try:
+                            response = self._handle(json.loads(line or '{}'))
+                        except Exception as e:
+                            response = {"error": str(e)}
+                        try:
+                            conn.sendall(json.dumps(response).encode() + b'\n')
+                        except OSError:
+                            pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            events.close()
+            self._events = None
+            server.close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+            if self.watcher is not None:
+                self.watcher.close()
+
+
+def daemon_socket_path(cache_dir: Path) -> Path:
+    """
+    Socket path for a project's daemon.
+    
+    AF_UNIX paths are limited to ~108 bytes, so deep project paths fall
+    back to a hashed name in the temp directory.
+    """
+    path = Path(cache_dir).resolve() / "selector.sock"
+    if len(str(path)) < 100:
+        return path
+    digest = hashlib.sha1(str(path).encode()).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"predictive-{digest}.sock"
+
+
+def query_daemon(cache_dir: Path, request: dict, timeout: float = 5.0) -> dict:
+    """Send a request to a running daemon; None if no daemon is listening."""
+    socket_path = daemon_socket_path(cache_dir)
+    if not socket_path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(socket_path))
+            client.sendall(json.dumps(request).encode() + b'\n')
+            return json.loads(client.makefile('r').readline())
+    except (OSError, ValueError):
+        return None
+
@@ -0,0 +1,96 @@
+# crac/suite_index.py
+# Persistent, incrementally refreshed index of the test source tree
+
+import json
+import os
+from pathlib import Path
+
+# Test class naming variants, most specific first (FooIT before FooTest)
+TEST_SUFFIXES = ('Tests.java', 'Test.java', 'IT.java')
+TEST_INDEX_VERSION = 1
+
+
+def refresh_test_dirs(project_root: Path, test_root: Path, index_file: Path) -> dict:
+    """
+    Incrementally refresh the persistent test directory index.
+    
+    Each directory under test_root is cached with its mtime, its
+    subdirectories and its test files. Adding, removing or renaming a
+    file bumps the mtime of its parent directory, so unchanged
+    directories are revalidated with a single stat() and only changed
+    subtrees are listed again.
+    
+    Returns:
+        directory (relative to project_root) -> {"mtime_ns", "subdirs", "tests"}
+    """
+    project_root, index_file = Path(project_root), Path(index_file)
+    cached = {}
+    if index_file.exists():
+        try:
+            with open(index_file, 'r') as f:
+                data = json.load(f)
+            if data.get("version") == TEST_INDEX_VERSION:
+                cached = data.get("dirs", {})
+        except (OSError, ValueError):
+            cached = {}
+    
+    dirs = {}
+    dirty = False
+    pending = [Path(test_root).as_posix()]
+    while pending:
+        rel = pending.pop()
+        path = project_root / rel
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        
+        entry = cached.get(rel)
+        if entry is None or entry["mtime_ns"] != mtime_ns:
+            entry = {"mtime_ns": mtime_ns, "subdirs": [], "tests": []}
+            try:
+                with os.scandir(path) as it:
+                    for child in it:
+                        if child.is_dir(follow_symlinks=False):
+                            entry["subdirs"].append(child.name)
+                        elif child.name.endswith(TEST_SUFFIXES):
+                            entry["tests"].append(child.name)
+            except OSError:
+                continue
+            entry["subdirs"].sort()
+            entry["tests"].sort()
+            dirty = True
+        
+        dirs[rel] = entry
+        pending.extend(f"{rel}/{name}" for name in entry["subdirs"])
+    
+    if dirty or dirs.keys() != cached.keys():
+        tmp_file = index_file.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump({"version": TEST_INDEX_VERSION, "dirs": dirs}, f)
+        os.replace(tmp_file, index_file)
+    
+    return dirs
+
+
+def build_test_index(dirs: dict) -> dict:
+    """
+    Build lookup tables from refresh_test_dirs() output.
+    
+    Returns a dict with:
+        tests:    every test file path, sorted
+        test_set: the same paths as a set, for membership checks
+        sources:  source key (src/test/java/com/example/Foo) -> test paths
+    """
+    tests = sorted(
+        f"{rel}/{name}"
+        for rel, entry in dirs.items()
+        for name in entry["tests"]
+    )
+    sources = {}
+    for test in tests:
+        for suffix in TEST_SUFFIXES:
+            if test.endswith(suffix):
+                sources.setdefault(test[:-len(suffix)], []).append(test)
+                break
+    return {"tests": tests, "test_set": set(tests), "sources": sources}
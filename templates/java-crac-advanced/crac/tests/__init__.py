@@ -0,0 +1,3 @@
+# crac/tests/__init__.py
+# Unit tests for the predictive test selector modules
+#   python3 -m unittest discover -s crac/tests -t crac
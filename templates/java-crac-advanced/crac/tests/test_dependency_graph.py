@@ -0,0 +1,118 @@
+# crac/tests/test_dependency_graph.py
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from dependency_graph import DependencyGraph
+
+MAIN = "src/main/java"
+TEST = "src/test/java"
+
+SOURCES = {
+    f"{MAIN}/com/acme/core/Money.java": """
+        package com.acme.core;
+        public class Money { }
+    """,
+    f"{MAIN}/com/acme/core/Ledger.java": """
+        package com.acme.core;
+        // Uses Money from its own package, no import needed
+        public class Ledger { private Money total; }
+    """,
+    f"{MAIN}/com/acme/web/Api.java": """
+        package com.acme.web;
+        import com.acme.core.*;
+        public class Api { Ledger ledger; String s = "Money"; }
+    """,
+    f"{MAIN}/com/acme/util/Strings.java": """
+        package com.acme.util;
+        /* Money is only mentioned in a comment */
+        public class Strings { public static String trim(String s) { return s; } }
+    """,
+    f"{TEST}/com/acme/web/ApiTest.java": """
+        package com.acme.web;
+        import static com.acme.util.Strings.trim;
+        public class ApiTest { Api api; }
+    """,
+}
+
+
+class DependencyGraphTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        for path, source in SOURCES.items():
+            self.write(path, source)
+        self.cache_file = self.root / "dep_graph.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, path, source):
+        full_path = self.root / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(source)
+
+    def graph(self, changed_files=()):
+        graph = DependencyGraph(self.root, self.cache_file, [MAIN, TEST])
+        graph.refresh(list(changed_files))
+        return graph
+
+    def test_same_package_reference(self):
+        dependents = self.graph().dependents(f"{MAIN}/com/acme/core/Money.java", 1)
+        self.assertEqual(dependents, {f"{MAIN}/com/acme/core/Ledger.java": 1})
+
+    def test_wildcard_import_and_transitive_hops(self):
+        dependents = self.graph().dependents(f"{MAIN}/com/acme/core/Ledger.java", 3)
+        self.assertEqual(dependents, {
+            f"{MAIN}/com/acme/web/Api.java": 1,
+            f"{TEST}/com/acme/web/ApiTest.java": 2,
+        })
+
+    def test_depth_limits_hops(self):
+        dependents = self.graph().dependents(f"{MAIN}/com/acme/core/Money.java", 2)
+        self.assertNotIn(f"{TEST}/com/acme/web/ApiTest.java", dependents)
+
+    def test_static_import_resolves_to_class(self):
+        dependents = self.graph().dependents(f"{MAIN}/com/acme/util/Strings.java", 1)
+        self.assertEqual(set(dependents), {f"{TEST}/com/acme/web/ApiTest.java"})
+
+    def test_comments_and_strings_are_not_references(self):
+        dependents = self.graph().dependents(f"{MAIN}/com/acme/core/Money.java", 1)
+        self.assertNotIn(f"{MAIN}/com/acme/util/Strings.java", dependents)
+        self.assertNotIn(f"{MAIN}/com/acme/web/Api.java", dependents)
+
+    def test_cache_is_reused_and_changed_files_reparsed(self):
+        self.graph()
+        cached = json.loads(self.cache_file.read_text())
+        self.assertEqual(len(cached["files"]), len(SOURCES))
+
+        strings = f"{MAIN}/com/acme/util/Strings.java"
+        self.write(strings, "package com.acme.util;\nimport com.acme.core.Money;\nclass Strings { }\n")
+        graph = self.graph([strings])
+        self.assertIn(strings, graph.dependents(f"{MAIN}/com/acme/core/Money.java", 1))
+
+    def test_deleted_files_leave_the_graph(self):
+        self.graph()
+        api = f"{MAIN}/com/acme/web/Api.java"
+        (self.root / api).unlink()
+        graph = self.graph([api])
+        self.assertNotIn(api, graph.files)
+
+    def test_new_files_are_found_outside_git(self):
+        self.graph()
+        audit = f"{MAIN}/com/acme/core/Audit.java"
+        self.write(audit, "package com.acme.core;\nclass Audit { Ledger ledger; }\n")
+        graph = self.graph()
+        self.assertIn(audit, graph.dependents(f"{MAIN}/com/acme/core/Ledger.java", 1))
+
+    def test_deleted_files_leave_the_graph_outside_git(self):
+        self.graph()
+        api = f"{MAIN}/com/acme/web/Api.java"
+        (self.root / api).unlink()
+        self.assertNotIn(api, self.graph().files)
+
+
+if __name__ == "__main__":
+    unittest.main()
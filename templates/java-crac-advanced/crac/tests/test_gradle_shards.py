@@ -0,0 +1,124 @@
+# crac/tests/test_gradle_shards.py
+
+import contextlib
+import io
+import json
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from gradle_shards import (
+    merge_result_caches,
+    parse_junit_results,
+    run_shards,
+    shard_result_cache,
+    to_class_filter,
+)
+
+REPORT = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuite name="{name}" tests="{tests}" skipped="{skipped}"
+           failures="{failures}" errors="0" time="{time}"/>
+"""
+
+
+class GradleShardsTest(unittest.TestCase):
+    def test_class_filter(self):
+        self.assertEqual(
+            to_class_filter("src/test/java/com/example/FooTest.java"), "com.example.FooTest"
+        )
+
+    def test_parse_junit_results(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            results_dir = Path(tmp)
+            suites = {
+                "com.example.PassTest": dict(tests=2, skipped=0, failures=0, time=1.5),
+                "com.example.FailTest": dict(tests=2, skipped=0, failures=1, time=0.5),
+                "com.example.SkipTest": dict(tests=1, skipped=1, failures=0, time=0.0),
+                "com.example.UnknownTest": dict(tests=1, skipped=0, failures=0, time=0.1),
+            }
+            for name, attrs in suites.items():
+                (results_dir / f"TEST-{name}.xml").write_text(REPORT.format(name=name, **attrs))
+            (results_dir / "TEST-broken.xml").write_text("<testsuite")
+
+            class_to_test = {
+                name: f"src/test/java/{name.replace('.', '/')}.java"
+                for name in suites if name != "com.example.UnknownTest"
+            }
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                results = parse_junit_results(results_dir, class_to_test)
+
+        self.assertIn("Could not parse", output.getvalue())
+
+        self.assertEqual(results, {
+            "src/test/java/com/example/PassTest.java": {"status": "passed", "duration": 1.5},
+            "src/test/java/com/example/FailTest.java": {"status": "failed", "duration": 0.5},
+            "src/test/java/com/example/SkipTest.java": {"status": "skipped", "duration": 0.0},
+        })
+
+
+class FakeGradle:
+    """Stands in for the profiler: each `gradle test` writes its shard's cache."""
+
+    def __init__(self, project_root):
+        self.project_root = project_root
+
+    def run(self, cmd, cwd):
+        shard = next(arg for arg in cmd if arg.startswith('-PtestShard='))
+        index = int(shard.split('=')[1])
+        classes = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == '--tests']
+        cache = shard_result_cache(self.project_root, index)
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        cache.write_text(json.dumps({
+            "version": 1,
+            "timestamp": 1000 + index,
+            "results": {name: {"status": "SUCCESS", "duration": 1} for name in classes},
+        }))
+        return subprocess.CompletedProcess(cmd, 0)
+
+
+class ShardResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_concurrent_shards_keep_every_result(self):
+        buckets = [
+            ["src/test/java/a/ATest.java", "src/test/java/a/BTest.java"],
+            ["src/test/java/c/CTest.java"],
+            ["src/test/java/d/DTest.java"],
+        ]
+        gradle = FakeGradle(self.root)
+        codes = run_shards(buckets, self.root, self.root / "cache", gradle)
+        merged = merge_result_caches(self.root, len(buckets))
+
+        self.assertEqual(codes, [0, 0, 0])
+        self.assertEqual(
+            sorted(merged["results"]), ["a.ATest", "a.BTest", "c.CTest", "d.DTest"]
+        )
+        self.assertEqual(merged["timestamp"], 1002)
+        on_disk = json.loads((self.root / "build" / "cache" / "test-results.json").read_text())
+        self.assertEqual(on_disk, merged)
+        self.assertFalse(any(shard_result_cache(self.root, i).exists() for i in range(3)))
+
+    def test_stale_shard_cache_is_cleared_before_a_run(self):
+        stale = shard_result_cache(self.root, 0)
+        stale.parent.mkdir(parents=True)
+        stale.write_text(json.dumps({"results": {"old.StaleTest": {}}}))
+
+        class FailingGradle(FakeGradle):
+            def run(self, cmd, cwd):
+                return subprocess.CompletedProcess(cmd, 1)
+
+        bucket = ["src/test/java/a/ATest.java"]
+        codes = run_shards([bucket], self.root, self.root, FailingGradle(self.root))
+        merged = merge_result_caches(self.root, 1)
+        self.assertEqual(codes, [1])
+        self.assertEqual(merged["results"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# crac/tests/test_history_store.py
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from history_store import TestHistoryStore
+
+
+class HistoryStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = TestHistoryStore(Path(self.tmp.name) / "history.db")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_unknown_test_has_no_history(self):
+        self.assertIsNone(self.store.get("FooTest.java"))
+
+    def test_aggregates_runs_failures_and_durations(self):
+        runs = [
+            ({"status": "passed", "duration": 1.0}, "2026-01-01T00:00:00"),
+            ({"status": "FAILURE", "duration": 3.0}, "2026-01-02T00:00:00"),
+            (True, "2026-01-03T00:00:00"),
+        ]
+        for result, timestamp in runs:
+            self.store.record_run({"FooTest.java": result}, timestamp)
+
+        history = self.store.get("FooTest.java")
+        self.assertEqual(history["runs"], 3)
+        self.assertEqual(history["failures"], 1)
+        self.assertEqual(history["last_failure"], "2026-01-02T00:00:00")
+        self.assertEqual(history["mean_duration"], 2.0)
+        self.assertEqual(history["last_status"], "passed")
+        self.assertEqual(history["flips"], 2)
+
+    def test_skipped_results_do_not_count_as_runs(self):
+        self.store.record_run({"FooTest.java": "skipped"})
+        self.assertIsNone(self.store.get("FooTest.java"))
+
+    def test_failing_tests_are_those_whose_last_run_failed(self):
+        self.store.record_run({"A.java": False, "B.java": False})
+        self.store.record_run({"A.java": True})
+        self.assertEqual(self.store.failing_tests(), ["B.java"])
+
+    def test_import_json_replays_legacy_runs(self):
+        legacy = Path(self.tmp.name) / "test_history.json"
+        legacy.write_text(json.dumps({"runs": [
+            {"timestamp": "2026-01-01T00:00:00", "tests": {"A.java": "fail"}},
+            {"timestamp": "2026-01-02T00:00:00", "tests": {"A.java": "pass"}},
+        ]}))
+        self.store.import_json(legacy)
+        history = self.store.get("A.java")
+        self.assertEqual((history["runs"], history["failures"]), (2, 1))
+
+    def test_history_persists_across_connections(self):
+        self.store.record_run({"A.java": False})
+        self.store.close()
+        reopened = TestHistoryStore(self.store.db_path)
+        try:
+            self.assertEqual(reopened.get("A.java")["failures"], 1)
+        finally:
+            reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
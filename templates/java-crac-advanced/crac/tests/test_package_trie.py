@@ -0,0 +1,35 @@
+# crac/tests/test_package_trie.py
+
+import unittest
+
+from package_trie import PackageTrie
+
+
+class PackageTrieTest(unittest.TestCase):
+    def setUp(self):
+        self.trie = PackageTrie()
+        self.trie.insert(["com", "example"], "ExampleTest.java")
+        self.trie.insert(["com", "example", "web"], "WebTest.java")
+        self.trie.insert(["com", "example", "web", "api"], "ApiTest.java")
+        self.trie.insert(["com", "other"], "OtherTest.java")
+
+    def test_finds_package_and_subpackages_nearest_first(self):
+        self.assertEqual(
+            self.trie.find(["com", "example"]),
+            [("ExampleTest.java", 0), ("WebTest.java", 1), ("ApiTest.java", 2)],
+        )
+
+    def test_leaf_package_has_distance_zero(self):
+        self.assertEqual(
+            self.trie.find(["com", "example", "web", "api"]), [("ApiTest.java", 0)]
+        )
+
+    def test_unknown_package_finds_nothing(self):
+        self.assertEqual(self.trie.find(["com", "missing"]), [])
+
+    def test_root_finds_everything(self):
+        self.assertEqual(len(self.trie.find([])), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# crac/tests/test_scheduler.py
+
+import unittest
+from datetime import datetime
+
+from scheduler import (
+    DEFAULT_IT_SECONDS,
+    DEFAULT_TEST_SECONDS,
+    expected_seconds,
+    failure_probability,
+    knapsack,
+    pack_tests,
+    shard_tests,
+)
+
+
+def history(runs=4, failures=0, last_failure=None, flips=0, mean_duration=None):
+    return {
+        "runs": runs, "failures": failures, "last_failure": last_failure,
+        "flips": flips, "mean_duration": mean_duration,
+    }
+
+
+class ScoringTest(unittest.TestCase):
+    NOW = datetime(2026, 3, 15)
+
+    def test_without_history_probability_is_file_risk(self):
+        self.assertEqual(failure_probability(0.3, None), 0.3)
+
+    def test_recent_failure_raises_probability(self):
+        stable = failure_probability(0.1, history(), self.NOW)
+        failed = failure_probability(
+            0.1, history(failures=1, last_failure="2026-03-15T00:00:00"), self.NOW
+        )
+        self.assertAlmostEqual(stable, 0.1)
+        self.assertGreater(failed, 0.5)
+
+    def test_failure_weight_halves_after_half_life(self):
+        def failed_on(day):
+            return failure_probability(
+                0.0, history(runs=1, failures=1, last_failure=day), self.NOW
+            )
+        self.assertAlmostEqual(failed_on("2026-03-15T00:00:00"), 1.0)
+        self.assertAlmostEqual(failed_on("2026-03-08T00:00:00"), 0.75)
+
+    def test_flaky_tests_are_discounted(self):
+        steady = history(runs=5, failures=2, last_failure="2026-03-01T00:00:00")
+        flaky = dict(steady, flips=4)
+        self.assertLess(
+            failure_probability(0.0, flaky, self.NOW), failure_probability(0.0, steady, self.NOW)
+        )
+
+    def test_expected_seconds_defaults_by_kind(self):
+        self.assertEqual(expected_seconds("FooTest.java"), DEFAULT_TEST_SECONDS)
+        self.assertEqual(expected_seconds("FooIT.java"), DEFAULT_IT_SECONDS)
+        self.assertEqual(expected_seconds("FooIT.java", history(mean_duration=2.5)), 2.5)
+
+
+class PackingTest(unittest.TestCase):
+    def test_everything_fits(self):
+        selected, report = pack_tests([("a", 0.2, 1.0), ("b", 0.9, 1.0)], 10.0)
+        self.assertEqual(selected, ["b", "a"])
+        self.assertEqual(report["risk_coverage"], 1.0)
+        self.assertEqual(report["estimated_seconds"], 2.0)
+
+    def test_knapsack_beats_greedy_ratio(self):
+        # Greedy by probability/second takes "fast" first and then cannot fit
+        # either slow test; the knapsack takes both slow ones.
+        scored = [("fast", 0.2, 1.0), ("slow1", 0.9, 5.0), ("slow2", 0.9, 5.0)]
+        selected, report = pack_tests(scored, 10.0)
+        self.assertEqual(sorted(selected), ["slow1", "slow2"])
+        self.assertLessEqual(report["estimated_seconds"], 10.0)
+        self.assertEqual(report["expected_failures"], 1.8)
+
+    def test_tests_over_budget_are_never_selected(self):
+        selected, report = pack_tests([("huge", 1.0, 60.0), ("small", 0.1, 1.0)], 30.0)
+        self.assertEqual(selected, ["small"])
+        self.assertAlmostEqual(report["risk_coverage"], round(0.1 / 1.1, 3))
+
+    def test_knapsack_respects_capacity(self):
+        items = [(f"t{i}", 0.1 * (i % 7 + 1), 0.5 + i % 5) for i in range(40)]
+        chosen = knapsack(items, 12.0)
+        self.assertLessEqual(sum(item[2] for item in chosen), 12.0)
+        self.assertTrue(chosen)
+
+
+class ShardingTest(unittest.TestCase):
+    def test_balances_by_duration(self):
+        timed = [("a", 8.0), ("b", 4.0), ("c", 4.0), ("d", 1.0), ("e", 1.0)]
+        buckets = shard_tests(timed, 2)
+        loads = sorted(sum(dict(timed)[test] for test in bucket) for bucket in buckets)
+        self.assertEqual(loads, [9.0, 9.0])
+
+    def test_never_more_shards_than_tests(self):
+        self.assertEqual(shard_tests([("a", 1.0)], 8), [["a"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+# crac/tests/test_selector_daemon.py
+
+import contextlib
+import errno
+import io
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import selector_daemon
+from predictive_test_selector import PredictiveTestSelector
+from selector_daemon import InotifyWatcher, SelectorDaemon, daemon_socket_path, query_daemon
+
+
+class SocketPathTest(unittest.TestCase):
+    def test_short_paths_live_in_the_cache_dir(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(daemon_socket_path(Path(tmp)), Path(tmp).resolve() / "selector.sock")
+
+    def test_long_paths_fall_back_to_a_hashed_temp_name(self):
+        path = daemon_socket_path(Path("/" + "x" * 120))
+        self.assertLess(len(str(path)), 100)
+        self.assertTrue(path.name.startswith("predictive-"))
+
+    def test_query_without_daemon_returns_none(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(query_daemon(Path(tmp), {"command": "ping"}))
+
+
+class DaemonStateTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "src" / "test" / "java").mkdir(parents=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.daemon = SelectorDaemon(PredictiveTestSelector(str(self.root)))
+
+    def tearDown(self):
+        if self.daemon.watcher is not None:
+            self.daemon.watcher.close()
+        self.daemon.selector.history.close()
+        self.tmp.cleanup()
+
+    def test_ping(self):
+        self.assertEqual(self.daemon._handle({"command": "ping"}), {"ok": True})
+
+    def test_test_tree_changes_drop_the_test_index(self):
+        selector = self.daemon.selector
+        selector._get_package_trie()
+        self.daemon._changed_files = ["src/main/java/Foo.java"]
+        self.daemon._on_changes([self.root / "src" / "test" / "java" / "FooTest.java"])
+        self.assertIsNone(selector._test_index)
+        self.assertIsNone(selector._package_trie)
+        self.assertIsNone(self.daemon._changed_files)
+
+    def test_only_source_changes_drop_the_dependency_graph(self):
+        selector = self.daemon.selector
+        graph = object()
+        for path in [".git/index", "build.gradle", "src/main/resources/app.yml"]:
+            selector._dependency_graph = graph
+            self.daemon._on_changes([self.root / path])
+            self.assertIs(selector._dependency_graph, graph, path)
+
+        for path in ["src/main/java/com/acme/Foo.java", "src/main/java/com/acme", "."]:
+            selector._dependency_graph = graph
+            self.daemon._on_changes([self.root / path])
+            self.assertIsNone(selector._dependency_graph, path)
+
+    def test_without_watcher_every_query_drops_all_state(self):
+        selector = self.daemon.selector
+        if self.daemon.watcher is not None:
+            self.daemon.watcher.close()
+            self.daemon.watcher = None
+        selector._get_package_trie()
+        selector._dependency_graph = object()
+        selector.changes.recency["src/main/java/Foo.java"] = 1.0
+        self.daemon._changed_files = []
+
+        self.daemon._read_changes()
+        self.assertIsNone(selector._test_index)
+        self.assertIsNone(selector._package_trie)
+        self.assertIsNone(selector._dependency_graph)
+        self.assertEqual(selector.changes.recency, {})
+        self.assertIsNone(self.daemon._changed_files)
+
+    def test_new_test_is_indexed_without_watcher(self):
+        selector = self.daemon.selector
+        if self.daemon.watcher is not None:
+            self.daemon.watcher.close()
+            self.daemon.watcher = None
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.daemon._handle({"budget_seconds": 5})
+            new_test = self.root / "src" / "test" / "java" / "FooTest.java"
+            new_test.write_text("class FooTest {}\n")
+            self.daemon._handle({"budget_seconds": 5})
+        self.assertIn("src/test/java/FooTest.java", selector._get_test_index()["test_set"])
+
+    def test_running_out_of_watches_falls_back_to_rescan(self):
+        if self.daemon.watcher is None:
+            self.skipTest("inotify unavailable")
+
+        def exhausted(directory, recursive=True):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        self.daemon.watcher.watch = exhausted
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.daemon.watch_project()
+        self.assertIsNone(self.daemon.watcher)
+        self.assertIn("re-scanning", output.getvalue())
+
+    def test_request_depth_applies_per_query(self):
+        selector = self.daemon.selector
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.daemon._handle({"budget_seconds": 5, "depth": 0})
+            self.assertEqual(selector.dependency_depth, 0)
+            self.daemon._handle({"budget_seconds": 5})
+        self.assertEqual(selector.dependency_depth, 2)
+
+
+class InotifyWatcherTest(unittest.TestCase):
+    def setUp(self):
+        try:
+            self.watcher = InotifyWatcher()
+        except (OSError, AttributeError, TypeError):
+            self.skipTest("inotify unavailable")
+
+    def tearDown(self):
+        self.watcher.close()
+
+    def test_watch_limit_raises_instead_of_skipping(self):
+        class Libc:
+            def inotify_add_watch(self, fd, path, mask):
+                return -1
+
+        self.watcher._libc = Libc()
+        self.watcher._get_errno = lambda: errno.ENOSPC
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(OSError) as raised:
+                self.watcher.watch(Path(tmp))
+        self.assertEqual(raised.exception.errno, errno.ENOSPC)
+
+    def test_vanished_directories_are_skipped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.watcher.watch(Path(tmp) / "gone")
+        self.assertEqual(self.watcher._paths, {})
+
+
+@unittest.skipIf(not hasattr(socket, "AF_UNIX"), "needs Unix sockets")
+class DaemonServeTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "src" / "test" / "java").mkdir(parents=True)
+        (self.root / "config").mkdir()
+        self.output = io.StringIO()
+        with contextlib.redirect_stdout(self.output):
+            self.daemon = SelectorDaemon(PredictiveTestSelector(str(self.root)))
+
+    def tearDown(self):
+        self.daemon.selector.history.close()
+        self.tmp.cleanup()
+
+    def test_watch_covers_the_tree_but_not_build_output(self):
+        if self.daemon.watcher is None:
+            self.skipTest("inotify unavailable")
+        try:
+            self.daemon.watch_project()
+            (self.daemon.selector.cache_dir / "test_index.json").write_text("{}")
+            self.assertEqual(self.daemon.watcher.read_events(), [])
+
+            self.daemon._changed_files = []
+            (self.root / "config" / "app.yml").write_text("x: 1\n")
+            events = self.daemon.watcher.read_events()
+            self.assertIn(self.root / "config" / "app.yml", events)
+            self.daemon._on_changes(events)
+            self.assertIsNone(self.daemon._changed_files)
+        finally:
+            self.daemon.watcher.close()
+
+    def test_idle_client_does_not_block_others(self):
+        cache_dir = self.daemon.selector.cache_dir
+        original_timeout = selector_daemon.CLIENT_TIMEOUT
+        selector_daemon.CLIENT_TIMEOUT = 0.2
+        server = threading.Thread(target=self.serve, daemon=True)
+        server.start()
+        try:
+            deadline = time.monotonic() + 5
+            while query_daemon(cache_dir, {"command": "ping"}) is None:
+                self.assertLess(time.monotonic(), deadline, "daemon did not start")
+                time.sleep(0.05)
+
+            idle = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            idle.connect(str(self.daemon.socket_path))
+            try:
+                started = time.monotonic()
+                self.assertEqual(query_daemon(cache_dir, {"command": "ping"}), {"ok": True})
+                self.assertLess(time.monotonic() - started, 2.0)
+            finally:
+                idle.close()
+        finally:
+            query_daemon(cache_dir, {"command": "shutdown"})
+            server.join(5)
+            selector_daemon.CLIENT_TIMEOUT = original_timeout
+        self.assertFalse(server.is_alive())
+
+    def serve(self):
+        with contextlib.redirect_stdout(self.output):
+            self.daemon.serve()
+
+
+if __name__ == "__main__":
+    unittest.main()
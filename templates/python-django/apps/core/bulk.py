@@ -0,0 +1,116 @@
+"""apps/core/bulk.py"""
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .cache import invalidate_items
+from .models import Item
+from .serializers import ItemSerializer
+
+
+def batch_size():
+    return getattr(settings, "ITEMS_BULK_BATCH_SIZE", 1000)
+
+
+def _validate(rows, partial=False):
+    """
+    Validate rows one at a time with ItemSerializer.
+
+    Returns (validated data by row index, per-row errors). Invalid rows do
+    not stop the valid ones: each row goes through run_validation exactly
+    once, as ListSerializer does, and the failures are reported by index.
+    """
+    child = ItemSerializer(partial=partial)
+    valid, errors = {}, []
+    for i, row in enumerate(rows):
+        try:
+            valid[i] = child.run_validation(row)
+        except ValidationError as exc:
+            errors.append({"index": i, "errors": exc.detail})
+    return valid, errors
+
+
+def _row_ids(rows):
+    """Map row index -> integer id, plus errors for rows without one."""
+    ids, errors = {}, []
+    for i, row in enumerate(rows):
+        value = row.get("id") if isinstance(row, dict) else row
+        if isinstance(value, int) and not isinstance(value, bool):
+            ids[i] = value
+        else:
+            errors.append({"index": i, "errors": {"id": ["A valid integer id is required."]}})
+    return ids, errors
+
+
+def bulk_create(rows, size=None):
+    """Insert all valid rows with bulk_create in one transaction."""
+    valid, errors = _validate(rows)
+    objs = [Item(**valid[i]) for i in sorted(valid)]
+    with transaction.atomic():
+        Item.objects.bulk_create(objs, batch_size=size or batch_size())
+        transaction.on_commit(invalidate_items)
+    return {"created": len(objs), "ids": [obj.pk for obj in objs], "errors": errors}
+
+
+def bulk_update(rows, size=None):
+    """Apply partial updates to existing items with bulk_update in one transaction."""
+    ids, errors = _row_ids(rows)
+    valid, validation_errors = _validate([rows[i] for i in sorted(ids)], partial=True)
+    # _validate indexes into the id-bearing subset; map back to request rows
+    positions = sorted(ids)
+    errors += [
+        {"index": positions[e["index"]], "errors": e["errors"]} for e in validation_errors
+    ]
+
+    with transaction.atomic():
+        found = Item.objects.select_for_update().in_bulk(
+            [ids[positions[j]] for j in valid]
+        )
+        now = timezone.now()
+        objs, fields = [], {"updated_at"}
+        for j, attrs in sorted(valid.items()):
+            index = positions[j]
+            obj = found.get(ids[index])
+            if obj is None:
+                errors.append({"index": index, "errors": {"id": ["Not found."]}})
+                continue
+            for name, value in attrs.items():
+                setattr(obj, name, value)
+            # bulk_update skips auto_now, so stamp it here
+            obj.updated_at = now
+            fields.update(attrs)
+            objs.append(obj)
+        if objs:
+            Item.objects.bulk_update(objs, sorted(fields), batch_size=size or batch_size())
+            transaction.on_commit(invalidate_items)
+
+    errors.sort(key=lambda e: e["index"])
+    return {"updated": len(objs), "errors": errors}
+
+
+def bulk_delete(rows, size=None):
+    """
+    Delete items by id (bare ids or {"id": ...} rows) in batches, one transaction.
+
+    Each batch goes through QuerySet.delete(), so cascades and the
+    post_delete cache receiver run as for any other delete; the receiver
+    invalidates the cache on commit.
+    """
+    ids, errors = _row_ids(rows)
+    wanted = list(dict.fromkeys(ids.values()))
+    size = size or batch_size()
+    deleted = 0
+    with transaction.atomic():
+        existing = set()
+        for start in range(0, len(wanted), size):
+            queryset = Item.objects.filter(pk__in=wanted[start:start + size])
+            existing.update(queryset.values_list("pk", flat=True))
+            deleted += queryset.delete()[1].get(Item._meta.label, 0)
+    errors += [
+        {"index": i, "errors": {"id": ["Not found."]}}
+        for i, pk in ids.items() if pk not in existing
+    ]
+    errors.sort(key=lambda e: e["index"])
+    return {"deleted": deleted, "errors": errors}
@@ -0,0 +1,97 @@
+"""apps/core/cache.py"""
+
+import hashlib
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .renderers import ItemJSONRenderer
+
+# Bumped after every committed Item write; cache keys embed it, so one
+# increment invalidates every cached item response at once. A read that
+# raced a write stores under the old generation, where nobody looks any
+# more. The counter lives in CACHES["default"]: with the per-process
+# LocMemCache a write only invalidates its own worker, and other workers
+# serve stale responses until ITEMS_CACHE_TIMEOUT. Multi-worker
+# deployments need a shared backend (see checks.py).
+GENERATION_KEY = "items:generation"
+
+
+def timeout():
+    return getattr(settings, "ITEMS_CACHE_TIMEOUT", 300)
+
+
+class CacheStats:
+    """Hit/miss counters for item response caching (per worker process)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.not_modified = 0
+
+    def record(self, hit, not_modified=False):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if not_modified:
+                self.not_modified += 1
+
+    def as_dict(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+stats = CacheStats()
+
+
+def generation():
+    value = cache.get(GENERATION_KEY)
+    if value is None:
+        cache.add(GENERATION_KEY, 1, timeout=None)
+        value = cache.get(GENERATION_KEY, 1)
+    return value
+
+
+def invalidate_items():
+    """
+    Drop every cached item response in this cache backend.
+
+    Call it after writes that skip signals, from transaction.on_commit.
+    """
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.add(GENERATION_KEY, 2, timeout=None)
+
+
+def cached_payload(name, build):
+    """
+    Return (data, etag, hit) for a cached response.
+
+    `build` produces serializer data or a pre-rendered RawJSON body on a
+    miss; the ETag is a hash of its JSON rendering and is stored with it.
+    """
+    key = f"items:{generation()}:{name}"
+    entry = cache.get(key)
+    if entry is not None:
+        return entry["data"], entry["etag"], True
+
+    data = build()
+    digest = hashlib.blake2b(ItemJSONRenderer().render(data), digest_size=16).hexdigest()
+    etag = f'"{digest}"'
+    cache.set(key, {"data": data, "etag": etag}, timeout())
+    return data, etag, False
@@ -0,0 +1,30 @@
+"""apps/core/checks.py"""
+
+from django.conf import settings
+from django.core.checks import Warning, register
+
+# Backends whose contents, including the item cache generation, are private
+# to one process
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@register(deploy=True)
+def check_item_cache_backend(app_configs, **kwargs):
+    """Warn when item cache invalidation cannot reach other workers."""
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Warning(
+            "The item response cache uses a process-local backend.",
+            hint=(
+                "Item writes only invalidate the worker that made them; other "
+                "workers serve stale responses until ITEMS_CACHE_TIMEOUT. Set "
+                "DJANGO_CACHE_DIR or point CACHES['default'] at a shared backend."
+            ),
+            id="core.W001",
+        )
+    ]
@@ -0,0 +1,62 @@
+"""apps/core/management/commands/bench_serializers.py"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.models import Item
+from apps.core.serializers import ITEM_FIELDS, ItemSerializer, serialize_item_rows
+
+
+class Rollback(Exception):
+    """Raised to discard the benchmark rows."""
+
+
+class Command(BaseCommand):
+    help = "Compare ItemSerializer with the values_list fast path (rows are rolled back)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+        parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+
+    def handle(self, *args, **options):
+        sizes = sorted(options["rows"])
+        try:
+            with transaction.atomic():
+                Item.objects.bulk_create(
+                    (Item(name=f"item-{i}", description="benchmark row " * 4)
+                     for i in range(sizes[-1])),
+                    batch_size=5_000,
+                )
+                self.stdout.write(
+                    f"{'rows':>8} {'drf rows/s':>12} {'fast rows/s':>12} {'speedup':>8}"
+                )
+                for size in sizes:
+                    drf = self._best(options["repeat"], lambda n=size: self._drf(n))
+                    fast = self._best(options["repeat"], lambda n=size: self._fast(n))
+                    self.stdout.write(
+                        f"{size:>8} {size / drf:>12,.0f} {size / fast:>12,.0f} {drf / fast:>7.1f}x"
+                    )
+                raise Rollback
+        except Rollback:
+            pass
+
+    @staticmethod
+    def _best(repeat, run):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    @staticmethod
+    def _drf(size):
+        data = ItemSerializer(Item.objects.all()[:size], many=True).data
+        return JSONRenderer().render(data)
+
+    @staticmethod
+    def _fast(size):
+        return serialize_item_rows(Item.objects.values_list(*ITEM_FIELDS)[:size])
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Item',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-created_at', '-id'],
+                # Matches `ordering`, so lists, `recent` and keyset pages read
+                # the index in order instead of sorting. It holds the key
+                # columns only; rows are fetched from the table.
+                'indexes': [models.Index(fields=['-created_at', '-id'], name='item_created_at_id_idx')],
+            },
+        ),
+    ]
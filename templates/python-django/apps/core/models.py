@@ -12,7 +12,15 @@ class Item(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ["-created_at"]
+        # id breaks created_at ties so pages and `recent` are deterministic
+        ordering = ["-created_at", "-id"]
+        indexes = [
+            # Serves the default ordering, `recent` and keyset page seeks
+            # without a sort. Key columns only: SQLite ignores INCLUDE
+            # (models.W040), and copying the unbounded `description` into
+            # a PostgreSQL index would bloat it and cap the row size.
+            models.Index(fields=["-created_at", "-id"], name="item_created_at_id_idx"),
+        ]
 
     def __str__(self):
         return self.name
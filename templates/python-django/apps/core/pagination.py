@@ -0,0 +1,115 @@
+"""apps/core/pagination.py"""
+
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from .serializers import RawJSON, json_separators
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination on a unique, descending column tuple.
+
+    The cursor holds the last row's ordering values, and the next page is
+    fetched with a `WHERE (a, b) < (x, y)` style filter instead of an
+    OFFSET, so every page costs the same index seek however deep it is.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        fields = [name.lstrip("-") for name in self.ordering]
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request, queryset.model, fields)
+        if position is not None:
+            queryset = queryset.filter(self.seek_filter(fields, position))
+
+        # One extra row tells us whether there is a next page
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        self.next_position = (
+            [getattr(self.page[-1], name) for name in fields] if self.has_next else None
+        )
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def seek_filter(self, fields, position):
+        """Rows strictly after `position` in descending tuple order"""
+        condition = Q()
+        for i, name in enumerate(fields):
+            step = Q(**{f"{name}__lt": position[i]})
+            for prior, value in zip(fields[:i], position[:i], strict=True):
+                step &= Q(**{prior: value})
+            condition |= step
+        return condition
+
+    def encode_cursor(self, position):
+        payload = json.dumps(
+            [value.isoformat() if hasattr(value, "isoformat") else value for value in position]
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request, model, fields):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if not isinstance(raw, list) or len(raw) != len(fields):
+                raise ValueError(raw)
+            return [
+                model._meta.get_field(name).to_python(value)
+                for name, value in zip(fields, raw, strict=True)
+            ]
+        except (TypeError, ValueError, ValidationError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        cursor = self.encode_cursor(self.next_position)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        if isinstance(data, RawJSON):
+            # Same bytes JSONRenderer would produce for the dict below
+            next_link = JSONRenderer().render(self.get_next_link()).decode() or "null"
+            comma, colon = json_separators()
+            head = f'{{"next"{colon}{next_link}{comma}"results"{colon}'.encode()
+            return Response(RawJSON(head + data + b"}"))
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
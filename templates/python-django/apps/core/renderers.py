@@ -0,0 +1,19 @@
+"""apps/core/renderers.py"""
+
+import json
+
+from rest_framework.renderers import JSONRenderer
+
+from .serializers import RawJSON
+
+
+class ItemJSONRenderer(JSONRenderer):
+    """JSONRenderer that sends pre-rendered RawJSON bodies unchanged."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, RawJSON):
+            if self.get_indent(accepted_media_type, renderer_context or {}) is None:
+                return bytes(data)
+            # Indented output (browsable API, ?indent) re-renders normally
+            data = json.loads(data)
+        return super().render(data, accepted_media_type, renderer_context)
@@ -1,8 +1,19 @@
 """apps/core/serializers.py"""
 
+import datetime
+from json.encoder import encode_basestring, encode_basestring_ascii
+
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import ISO_8601, api_settings
+
 from .models import Item
 
+# Column order of the fast read path; matches ItemSerializer.Meta.fields
+ITEM_FIELDS = ("id", "name", "description", "created_at", "updated_at")
+
 
 class ItemSerializer(serializers.ModelSerializer):
     """Serializer for Item model."""
@@ -11,3 +22,65 @@ class ItemSerializer(serializers.ModelSerializer):
         model = Item
         fields = ["id", "name", "description", "created_at", "updated_at"]
         read_only_fields = ["id", "created_at", "updated_at"]
+
+
+class RawJSON(bytes):
+    """Pre-rendered JSON body; ItemJSONRenderer passes it through as-is."""
+
+
+def _formatters():
+    """
+    (datetime, string) JSON formatters matching DRF's DateTimeField and
+    JSONRenderer for the current settings: ISO 8601 with a trailing Z for
+    UTC, or DATETIME_FORMAT via strftime, in the current time zone.
+    """
+    output_format = api_settings.DATETIME_FORMAT or ISO_8601
+    iso = output_format.lower() == ISO_8601
+    tz = timezone.get_current_timezone() if settings.USE_TZ else None
+    quote = encode_basestring_ascii if JSONRenderer.ensure_ascii else encode_basestring
+
+    def when(value):
+        if tz is not None:
+            value = timezone.make_aware(value, tz) if value.tzinfo is None else value.astimezone(tz)
+        elif value.tzinfo is not None:
+            value = timezone.make_naive(value, datetime.UTC)
+        if not iso:
+            return quote(value.strftime(output_format))
+        text = value.isoformat()
+        if text.endswith("+00:00"):
+            text = text[:-6] + "Z"
+        return quote(text)
+
+    return when, quote
+
+
+def json_separators():
+    """(item, key) separators JSONRenderer uses: compact unless COMPACT_JSON is off."""
+    return (",", ":") if JSONRenderer.compact else (", ", ": ")
+
+
+def item_row_lines(rows):
+    """
+    JSON text per `values_list(*ITEM_FIELDS)` row, byte-identical to
+    JSONRenderer().render(ItemSerializer(item).data) without DRF's per-field
+    to_representation calls.
+    """
+    when, quote = _formatters()
+    comma, colon = json_separators()
+    # The template has no other commas or colons, so swapping them is safe
+    row = (
+        '{{"id":{},"name":{},"description":{},"created_at":{},"updated_at":{}}}'
+        .replace(",", comma).replace(":", colon)
+        .format
+    )
+    return [
+        row(pk, quote(name), quote(description), when(created_at), when(updated_at))
+        .replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+        for pk, name, description, created_at, updated_at in rows
+    ]
+
+
+def serialize_item_rows(rows):
+    """A JSON array of rows, identical to rendering ItemSerializer(many=True).data."""
+    comma, _ = json_separators()
+    return RawJSON(("[" + comma.join(item_row_lines(rows)) + "]").encode())
@@ -0,0 +1,20 @@
+"""apps/core/signals.py"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_items
+from .models import Item
+
+
+@receiver(post_save, sender=Item, dispatch_uid="items_cache_post_save")
+@receiver(post_delete, sender=Item, dispatch_uid="items_cache_post_delete")
+def invalidate_item_cache(sender, using, **kwargs):
+    """
+    Invalidate cached item responses once an Item write commits.
+
+    Bumping inside the transaction would let a concurrent read cache the
+    pre-commit rows under the new generation; a rollback skips it.
+    """
+    transaction.on_commit(invalidate_items, using=using)
@@ -0,0 +1,15 @@
+"""apps/core/tests/integration/conftest.py - integration fixtures"""
+
+import pytest
+from django.core.cache import cache as django_cache
+
+from apps.core import cache
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Start every test with an empty item cache and fresh hit counters."""
+    django_cache.clear()
+    cache.stats.reset()
+    yield
+    django_cache.clear()
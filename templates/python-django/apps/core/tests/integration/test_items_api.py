@@ -0,0 +1,123 @@
+"""apps/core/tests/integration/test_items_api.py - API tests (DB required)"""
+
+import json
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.core.models import Item
+from apps.core.serializers import ItemSerializer
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+def make_items(count, ties=1):
+    """Create `count` items, `ties` of them sharing each created_at value."""
+    items = Item.objects.bulk_create(Item(name=f"item-{i}") for i in range(count))
+    base = timezone.now()
+    for i, item in enumerate(items):
+        item.created_at = base - timedelta(seconds=i // ties)
+    Item.objects.bulk_update(items, ["created_at"])
+    return items
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    """Cursor pagination on (created_at, id)."""
+
+    def test_walks_every_item_once_in_order(self, client):
+        """Test following `next` visits all rows, ties included, newest first."""
+        make_items(10, ties=3)
+        expected = list(Item.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+
+        seen, url = [], "/api/items/?page_size=4"
+        while url:
+            body = client.get(url).json()
+            seen.extend(row["id"] for row in body["results"])
+            url = body["next"]
+
+        assert seen == expected
+
+    def test_last_page_has_no_next(self, client):
+        """Test a short table fits one page without a cursor."""
+        make_items(3)
+        body = client.get("/api/items/").json()
+        assert body["next"] is None
+        assert len(body["results"]) == 3
+
+    def test_invalid_cursor(self, client):
+        """Test a garbled cursor is rejected."""
+        assert client.get("/api/items/?cursor=not-a-cursor").status_code == 404
+
+
+@pytest.mark.django_db
+class TestStreamingList:
+    """NDJSON streaming list."""
+
+    def test_stream_yields_one_line_per_item(self, client):
+        """Test every item arrives as its own JSON line, newest first."""
+        make_items(5)
+        response = client.get("/api/items/stream/")
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = b"".join(response.streaming_content).splitlines()
+        rows = [json.loads(line) for line in lines]
+        expected = list(Item.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+        assert [row["id"] for row in rows] == expected
+
+
+@pytest.mark.django_db
+class TestFastReadPathContract:
+    """list, recent and stream bytes equal the ItemSerializer rendering."""
+
+    def make_awkward_items(self):
+        names = ["plain", 'quote " \\ slash', "é 漢字 🙂", "nl\ntab\t", "\u2028\u2029"]
+        return make_items(len(names)), names
+
+    def test_list(self, client):
+        """Test a page is byte-identical to the DRF serializer output."""
+        items, names = self.make_awkward_items()
+        Item.objects.bulk_update(
+            [
+                Item(pk=item.pk, name=name, description=name)
+                for item, name in zip(items, names, strict=True)
+            ],
+            ["name", "description"],
+        )
+        response = client.get("/api/items/")
+        expected = JSONRenderer().render({
+            "next": None,
+            "results": ItemSerializer(Item.objects.all(), many=True).data,
+        })
+        assert response.content == expected
+
+    def test_list_non_compact_json(self, client, monkeypatch):
+        """Test a page follows COMPACT_JSON off like JSONRenderer does."""
+        monkeypatch.setattr(JSONRenderer, "compact", False)
+        make_items(3)
+        response = client.get("/api/items/?page_size=2")
+        expected = JSONRenderer().render({
+            "next": response.json()["next"],
+            "results": ItemSerializer(Item.objects.all()[:2], many=True).data,
+        })
+        assert response.content == expected
+
+    def test_recent(self, client):
+        """Test `recent` is byte-identical to the DRF serializer output."""
+        make_items(12)
+        response = client.get("/api/items/recent/")
+        expected = JSONRenderer().render(ItemSerializer(Item.objects.all()[:10], many=True).data)
+        assert response.content == expected
+
+    def test_stream(self, client):
+        """Test every NDJSON line equals the DRF rendering of its item."""
+        make_items(3)
+        lines = b"".join(client.get("/api/items/stream/").streaming_content).splitlines()
+        expected = [JSONRenderer().render(ItemSerializer(item).data) for item in Item.objects.all()]
+        assert lines == expected
@@ -0,0 +1,129 @@
+"""apps/core/tests/integration/test_items_bulk.py - bulk endpoint tests (DB required)"""
+
+import json
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.core.models import Item
+from apps.core.serializers import ItemSerializer
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+@pytest.mark.django_db
+class TestBulkCreate:
+    """POST /api/items/bulk/"""
+
+    def test_json_array_in_batches(self, client, django_assert_max_num_queries):
+        """Test rows are inserted a batch per statement, not one per row."""
+        rows = [{"name": f"item-{i}"} for i in range(25)]
+        with django_assert_max_num_queries(11):
+            response = client.post("/api/items/bulk/?batch_size=10", rows, format="json")
+
+        assert response.status_code == 201
+        assert response.json()["created"] == 25
+        assert Item.objects.count() == 25
+        assert set(response.json()["ids"]) == set(Item.objects.values_list("id", flat=True))
+
+    def test_ndjson_body(self, client):
+        """Test NDJSON is accepted as well as JSON arrays."""
+        body = "\n".join(json.dumps({"name": f"n{i}"}) for i in range(3)) + "\n"
+        response = client.post(
+            "/api/items/bulk/", body, content_type="application/x-ndjson"
+        )
+        assert response.status_code == 201
+        assert Item.objects.count() == 3
+
+    def test_invalid_rows_reported_valid_rows_written(self, client):
+        """Test per-row errors do not block the rest of the batch."""
+        rows = [{"name": "ok"}, {"description": "no name"}, {"name": "x" * 101}, {"name": "ok2"}]
+        response = client.post("/api/items/bulk/", rows, format="json")
+
+        body = response.json()
+        assert response.status_code == 201
+        assert body["created"] == 2
+        assert [e["index"] for e in body["errors"]] == [1, 2]
+        assert "name" in body["errors"][0]["errors"]
+        assert sorted(Item.objects.values_list("name", flat=True)) == ["ok", "ok2"]
+
+    def test_each_row_validated_once(self, client, monkeypatch):
+        """Test an invalid row does not make every row validate twice."""
+        calls = []
+        run_validation = ItemSerializer.run_validation
+
+        def counting(self, data):
+            calls.append(data)
+            return run_validation(self, data)
+
+        monkeypatch.setattr(ItemSerializer, "run_validation", counting)
+        rows = [{"name": "ok"}, {"description": "no name"}, {"name": "ok2"}]
+        assert client.post("/api/items/bulk/", rows, format="json").json()["created"] == 2
+        assert calls == rows
+
+    def test_rejects_non_list(self, client):
+        """Test a single object is not a bulk payload."""
+        response = client.post("/api/items/bulk/", {"name": "a"}, format="json")
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+class TestBulkUpdateDelete:
+    """PATCH and DELETE /api/items/bulk/"""
+
+    def test_update(self, client):
+        """Test partial updates apply, and missing ids are reported."""
+        a, b = Item.objects.create(name="a"), Item.objects.create(name="b")
+        rows = [{"id": a.pk, "name": "a2"}, {"id": 999999, "name": "z"}, {"name": "no id"},
+                {"id": b.pk, "description": "d"}]
+        response = client.patch("/api/items/bulk/", rows, format="json")
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body["updated"] == 2
+        assert [e["index"] for e in body["errors"]] == [1, 2]
+        a.refresh_from_db()
+        b.refresh_from_db()
+        assert (a.name, b.name, b.description) == ("a2", "b", "d")
+        assert a.updated_at > a.created_at
+
+    def test_delete(self, client):
+        """Test ids are deleted and unknown ids reported."""
+        items = [Item.objects.create(name=str(i)) for i in range(3)]
+        response = client.delete(
+            "/api/items/bulk/", [items[0].pk, {"id": items[1].pk}, 999999], format="json"
+        )
+
+        body = response.json()
+        assert body["deleted"] == 2
+        assert [e["index"] for e in body["errors"]] == [2]
+        assert list(Item.objects.values_list("pk", flat=True)) == [items[2].pk]
+
+    def test_delete_goes_through_signals_per_batch(
+        self, client, django_assert_max_num_queries, django_capture_on_commit_callbacks
+    ):
+        """Test batched deletes send post_delete and refresh `recent` on commit."""
+        items = Item.objects.bulk_create(Item(name=str(i)) for i in range(25))
+        client.get("/api/items/recent/")
+        # Per batch: one SELECT for not-found reporting, the collector's
+        # SELECT and one DELETE
+        with (
+            django_capture_on_commit_callbacks(execute=True) as callbacks,
+            django_assert_max_num_queries(11),
+        ):
+            response = client.delete(
+                "/api/items/bulk/?batch_size=10", [i.pk for i in items], format="json"
+            )
+        assert response.json()["deleted"] == 25
+        assert len(callbacks) == 25
+        assert client.get("/api/items/recent/").json() == []
+
+    def test_bulk_writes_invalidate_recent(self, client, django_capture_on_commit_callbacks):
+        """Test bulk_create, which sends no signals, still refreshes `recent`."""
+        client.get("/api/items/recent/")
+        with django_capture_on_commit_callbacks(execute=True):
+            client.post("/api/items/bulk/", [{"name": "new"}], format="json")
+        assert [row["name"] for row in client.get("/api/items/recent/").json()] == ["new"]
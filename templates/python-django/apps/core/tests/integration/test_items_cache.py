@@ -0,0 +1,86 @@
+"""apps/core/tests/integration/test_items_cache.py - response cache tests (DB required)"""
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.core.models import Item
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+@pytest.mark.django_db
+class TestRecentCache:
+    """`recent` is served from cache until an Item write."""
+
+    def test_second_call_skips_the_database(self, client, django_assert_num_queries):
+        """Test a warm `recent` runs no queries."""
+        Item.objects.create(name="a")
+        client.get("/api/items/recent/")
+        with django_assert_num_queries(0):
+            response = client.get("/api/items/recent/")
+        assert [row["name"] for row in response.json()] == ["a"]
+
+    def test_save_and_delete_invalidate(self, client, django_capture_on_commit_callbacks):
+        """Test committed saves and deletes refresh the cached list."""
+        item = Item.objects.create(name="a")
+        assert len(client.get("/api/items/recent/").json()) == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Item.objects.create(name="b")
+        assert len(client.get("/api/items/recent/").json()) == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            item.delete()
+        assert [row["name"] for row in client.get("/api/items/recent/").json()] == ["b"]
+
+    def test_invalidation_waits_for_commit(self, client, django_capture_on_commit_callbacks):
+        """Test a write still inside its transaction leaves the cache alone."""
+        Item.objects.create(name="a")
+        client.get("/api/items/recent/")
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            Item.objects.create(name="b")
+            assert len(client.get("/api/items/recent/").json()) == 1
+        assert len(callbacks) == 1
+
+    def test_if_none_match_returns_304(self, client, django_capture_on_commit_callbacks):
+        """Test a matching ETag gets 304 with no body, a stale one gets 200."""
+        Item.objects.create(name="a")
+        etag = client.get("/api/items/recent/")["ETag"]
+
+        response = client.get("/api/items/recent/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response.content == b""
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Item.objects.create(name="b")
+        response = client.get("/api/items/recent/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_hit_ratio(self, client):
+        """Test the stats endpoint reports hits and misses."""
+        Item.objects.create(name="a")
+        for _ in range(4):
+            client.get("/api/items/recent/")
+        stats = client.get("/api/items/cache-stats/").json()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.75
+
+
+@pytest.mark.django_db
+class TestDetailCache:
+    """Detail responses are cached per item."""
+
+    def test_update_invalidates_detail(self, client, django_capture_on_commit_callbacks):
+        """Test a PATCH is visible on the next GET."""
+        item = Item.objects.create(name="a")
+        assert client.get(f"/api/items/{item.pk}/").json()["name"] == "a"
+
+        with django_capture_on_commit_callbacks(execute=True):
+            client.patch(f"/api/items/{item.pk}/", {"name": "b"}, format="json")
+        assert client.get(f"/api/items/{item.pk}/").json()["name"] == "b"
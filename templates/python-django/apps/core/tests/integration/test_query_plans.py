@@ -0,0 +1,50 @@
+"""apps/core/tests/integration/test_query_plans.py - SQLite query plans (DB required)"""
+
+import pytest
+from django.db import connection
+from django.test.client import RequestFactory
+from rest_framework.request import Request
+
+from apps.core.models import Item
+from apps.core.pagination import KeysetPagination
+
+INDEX = "item_created_at_id_idx"
+
+
+def assert_uses_index(queryset):
+    """EXPLAIN QUERY PLAN names the index and has no sort step."""
+    text = queryset.explain()
+    assert INDEX in text, text
+    assert "TEMP B-TREE" not in text, text
+
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite plan format"),
+]
+
+
+class TestItemQueryPlans:
+    """Default ordering, `recent` and keyset seeks use the index, no sort."""
+
+    def test_default_ordering(self):
+        """Test the full ordered list scans the index."""
+        assert_uses_index(Item.objects.all())
+
+    def test_recent(self):
+        """Test `recent`'s LIMIT 10 reads the index head."""
+        assert_uses_index(Item.objects.all()[:10])
+
+    def test_keyset_page(self):
+        """Test a cursor page seeks into the index."""
+        Item.objects.create(name="seed")
+        paginator = KeysetPagination()
+        item = Item.objects.get()
+        cursor = paginator.encode_cursor([item.created_at, item.id])
+        request = Request(RequestFactory().get("/api/items/", {"cursor": cursor}))
+
+        position = paginator.decode_cursor(request, Item, ["created_at", "id"])
+        queryset = Item.objects.filter(
+            paginator.seek_filter(["created_at", "id"], position)
+        ).order_by(*paginator.ordering)[:51]
+        assert_uses_index(queryset)
@@ -29,8 +29,14 @@ class TestItemModel:
         # Test Meta class exists with ordering
         from apps.core.models import Item
         
-        assert hasattr(Item.Meta, 'ordering')
-        assert Item.Meta.ordering == ["-created_at"]
+        assert Item._meta.ordering == ["-created_at", "-id"]
+
+    def test_item_ordering_index(self):
+        """Test the default ordering is backed by an index."""
+        from apps.core.models import Item
+
+        fields = [index.fields for index in Item._meta.indexes]
+        assert ["-created_at", "-id"] in fields
 
 
 class TestSerializers:
@@ -0,0 +1,93 @@
+"""apps/core/tests/unit/test_serializer_contract.py - fast path == ItemSerializer (no DB)"""
+
+from datetime import UTC, datetime
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone as django_timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.models import Item
+from apps.core.renderers import ItemJSONRenderer
+from apps.core.serializers import ITEM_FIELDS, ItemSerializer, item_row_lines, serialize_item_rows
+
+NAMES = [
+    "plain",
+    "quotes \" and \\ backslash",
+    "unicode é ü 漢字 🙂",
+    "line\nbreak\ttab \x00 \x1f control",
+    "js separators \u2028 \u2029",
+    "",
+]
+
+
+def make_items():
+    """Unsaved items covering awkward strings and timestamps."""
+    stamps = [
+        datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=UTC),
+        datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+    ]
+    return [
+        Item(
+            id=i + 1,
+            name=name,
+            description=NAMES[-1 - i],
+            created_at=stamps[i % 2],
+            updated_at=stamps[(i + 1) % 2],
+        )
+        for i, name in enumerate(NAMES)
+    ]
+
+
+def rows(items):
+    return [tuple(getattr(item, field) for field in ITEM_FIELDS) for item in items]
+
+
+class TestFastSerializerContract:
+    """serialize_item_rows must be byte-identical to the DRF path."""
+
+    def test_list_bytes_match(self):
+        """Test a list renders exactly like ItemSerializer(many=True)."""
+        items = make_items()
+        expected = JSONRenderer().render(ItemSerializer(items, many=True).data)
+        assert bytes(serialize_item_rows(rows(items))) == expected
+
+    def test_each_row_matches(self):
+        """Test per-row lines render exactly like ItemSerializer(item)."""
+        items = make_items()
+        for item, line in zip(items, item_row_lines(rows(items)), strict=True):
+            assert line.encode() == JSONRenderer().render(ItemSerializer(item).data)
+
+    def test_empty_list(self):
+        """Test no rows renders as []."""
+        expected = JSONRenderer().render(ItemSerializer([], many=True).data)
+        assert bytes(serialize_item_rows([])) == expected
+
+    @pytest.mark.parametrize("zone", ["Europe/Paris", "America/New_York"])
+    def test_current_time_zone(self, zone):
+        """Test datetimes follow the active time zone like DateTimeField."""
+        items = make_items()
+        with django_timezone.override(zone):
+            expected = JSONRenderer().render(ItemSerializer(items, many=True).data)
+            assert bytes(serialize_item_rows(rows(items))) == expected
+
+    def test_custom_datetime_format(self):
+        """Test a strftime DATETIME_FORMAT is honoured."""
+        items = make_items()
+        rest_framework = {"DATETIME_FORMAT": "%Y-%m-%d %H:%M"}
+        with override_settings(REST_FRAMEWORK=rest_framework):
+            expected = JSONRenderer().render(ItemSerializer(items, many=True).data)
+            assert bytes(serialize_item_rows(rows(items))) == expected
+
+    def test_non_compact_json(self, monkeypatch):
+        """Test COMPACT_JSON off (JSONRenderer.compact) spaces the fast path too."""
+        monkeypatch.setattr(JSONRenderer, "compact", False)
+        items = make_items()
+        expected = JSONRenderer().render(ItemSerializer(items, many=True).data)
+        assert b", " in expected
+        assert bytes(serialize_item_rows(rows(items))) == expected
+
+    def test_renderer_passes_raw_json_through(self):
+        """Test ItemJSONRenderer returns pre-rendered bodies unchanged."""
+        body = serialize_item_rows(rows(make_items()))
+        assert ItemJSONRenderer().render(body) == bytes(body)
@@ -1,11 +1,28 @@
 """apps/core/views.py"""
 
-from rest_framework import viewsets
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 
+from . import bulk, cache
 from .models import Item
-from .serializers import ItemSerializer
+from .pagination import KeysetPagination
+from .parsers import NDJSONParser
+from .renderers import ItemJSONRenderer
+from .serializers import ITEM_FIELDS, ItemSerializer, item_row_lines, serialize_item_rows
+
+# Rows fetched per database round trip by the streaming list
+STREAM_CHUNK_SIZE = 2000
+# Upper bound for the ?batch_size= of bulk writes
+MAX_BULK_BATCH_SIZE = 10000
 
 
 class ItemViewSet(viewsets.ModelViewSet):
@@ -13,10 +30,98 @@ class ItemViewSet(viewsets.ModelViewSet):
 
     queryset = Item.objects.all()
     serializer_class = ItemSerializer
+    renderer_classes = [ItemJSONRenderer, BrowsableAPIRenderer]
+    # Keyset pagination on (created_at, id) - constant cost per page at any depth
+    pagination_class = KeysetPagination
+
+    def list(self, request, *args, **kwargs):
+        """List items through the values_list fast path."""
+        queryset = self.filter_queryset(self.get_queryset()).values_list(*ITEM_FIELDS, named=True)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serialize_item_rows(page))
+        return Response(serialize_item_rows(queryset))
+
+    def retrieve(self, request, *args, **kwargs):
+        """Get one item, cached until the next Item write."""
+        return self._cached_response(
+            request,
+            f"detail:{kwargs[self.lookup_field]}",
+            lambda: super(ItemViewSet, self).retrieve(request, *args, **kwargs).data,
+        )
 
     @action(detail=False, methods=["get"])
     def recent(self, request):
         """Get recently created items."""
-        recent_items = self.get_queryset()[:10]
-        serializer = self.get_serializer(recent_items, many=True)
-        return Response(serializer.data)
+        return self._cached_response(
+            request,
+            "recent",
+            lambda: serialize_item_rows(self.get_queryset().values_list(*ITEM_FIELDS)[:10]),
+        )
+
+    @action(
+        detail=False,
+        methods=["post", "patch", "delete"],
+        parser_classes=[JSONParser, NDJSONParser],
+    )
+    def bulk(self, request):
+        """
+        Bulk create (POST), update (PATCH, rows need "id") or delete (DELETE,
+        ids) items from a JSON array or NDJSON body. Valid rows are written
+        in batches inside one transaction; invalid rows are reported by index.
+        """
+        rows = request.data
+        if not isinstance(rows, list):
+            raise ValidationError({"non_field_errors": ["Expected a list of items."]})
+        size = self._bulk_batch_size(request)
+
+        if request.method == "POST":
+            report = bulk.bulk_create(rows, size)
+            ok = report["created"] or not rows
+            return Response(report, status.HTTP_201_CREATED if ok else status.HTTP_400_BAD_REQUEST)
+        if request.method == "PATCH":
+            report = bulk.bulk_update(rows, size)
+            ok = report["updated"] or not report["errors"]
+        else:
+            report = bulk.bulk_delete(rows, size)
+            ok = report["deleted"] or not report["errors"]
+        return Response(report, status.HTTP_200_OK if ok else status.HTTP_400_BAD_REQUEST)
+
+    def _bulk_batch_size(self, request):
+        try:
+            size = int(request.query_params["batch_size"])
+        except KeyError:
+            return None
+        except ValueError as exc:
+            raise ValidationError({"batch_size": ["A valid integer is required."]}) from exc
+        return max(1, min(size, MAX_BULK_BATCH_SIZE))
+
+    @action(detail=False, methods=["get"], url_path="cache-stats")
+    def cache_stats(self, request):
+        """Hit ratio of the item response cache in this worker."""
+        return Response(cache.stats.as_dict())
+
+    def _cached_response(self, request, name, build):
+        """Serve from the item cache, answering If-None-Match with 304."""
+        data, etag, hit = cache.cached_payload(name, build)
+        client_etags = parse_etags(request.headers.get("If-None-Match", ""))
+        not_modified = etag in client_etags or "*" in client_etags
+        cache.stats.record(hit, not_modified)
+
+        response = Response(status=status.HTTP_304_NOT_MODIFIED) if not_modified else Response(data)
+        response["ETag"] = etag
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    @action(detail=False, methods=["get"])
+    def stream(self, request):
+        """Stream every item as NDJSON, one server-side chunk at a time."""
+        queryset = self.filter_queryset(self.get_queryset()).order_by(*KeysetPagination.ordering)
+        rows = queryset.values_list(*ITEM_FIELDS).iterator(chunk_size=STREAM_CHUNK_SIZE)
+        return StreamingHttpResponse(
+            self._ndjson(rows), content_type="application/x-ndjson"
+        )
+
+    def _ndjson(self, rows):
+        while chunk := list(islice(rows, STREAM_CHUNK_SIZE)):
+            yield ("\n".join(item_row_lines(chunk)) + "\n").encode()
@@ -95,6 +95,27 @@ STATIC_URL = "static/"
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Cache - local memory per worker; set DJANGO_CACHE_DIR to share a file cache.
+# Item cache invalidation only reaches other workers through a shared backend
+# (`manage.py check --deploy` warns otherwise).
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "python-django",
+    }
+}
+if os.environ.get("DJANGO_CACHE_DIR"):
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ["DJANGO_CACHE_DIR"],
+    }
+
+# Seconds a cached item response lives; writes invalidate it sooner
+ITEMS_CACHE_TIMEOUT = int(os.environ.get("DJANGO_ITEMS_CACHE_TIMEOUT", "300"))
+
+# Rows per INSERT/UPDATE statement for /api/items/bulk/ (?batch_size= overrides)
+ITEMS_BULK_BATCH_SIZE = 1000
+
 # REST Framework settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
@@ -15,11 +15,12 @@ def pytest_configure(config):
     """Configure pytest with Django."""
     from django.conf import settings
     
-    # Use in-memory SQLite for tests
-    settings.DATABASES["default"] = {
+    # Use in-memory SQLite for tests (update in place: the connection
+    # handler has already filled in defaults such as ATOMIC_REQUESTS)
+    settings.DATABASES["default"].update({
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
-    }
+    })
 
 
 def pytest_collection_modifyitems(config, items):
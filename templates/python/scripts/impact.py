@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# scripts/impact.py
+"""
+Test impact index - run only the tests a change can affect (testmon-style).
+
+    python scripts/impact.py [TIER|PATH ...] [-- PYTEST_ARGS]
+    python scripts/impact.py --all [TIER|PATH ...]     # run everything, rebuild
+    python -S scripts/testd.py run --affected [TIER]   # same, in the warm daemon
+
+While tests run, a profile hook records which `app` functions each test
+calls. The index (.impact.json) stores, per test, the ids of those
+functions plus the `app` modules it depends on, and an AST fingerprint of
+every function and of each module's top-level code. Before the next run
+the fingerprints are recomputed: tests that called a changed function, or
+that depend on a module whose top-level code changed (directly or through
+an import), are selected, together with tests that are new, live in a
+changed test file, or failed last time. The index is updated after every
+run for the tests that ran.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import sys
+import threading
+from typing import Any
+
+from testd import app_imports, pytest_args
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+INDEX_PATH = os.path.join(ROOT, ".impact.json")
+INDEX_VERSION = 1
+MODULE_BLOCK = "<module>"
+# pytest.ExitCode.NO_TESTS_COLLECTED, without importing pytest at module level
+NO_TESTS_COLLECTED = 5
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def fingerprint(source: str) -> dict[str, str]:
+    """
+    Checksums of one module: every def by qualname, plus MODULE_BLOCK.
+
+    Checksums hash the AST dump, so comment and formatting edits do not
+    count as changes. MODULE_BLOCK covers everything outside def bodies
+    (imports, constants, class attributes, decorators, signatures).
+    """
+    tree = ast.parse(source)
+    blocks: dict[str, str] = {}
+
+    def visit(node: ast.AST, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                qualname = f"{prefix}{child.name}"
+                blocks[qualname] = _digest(ast.dump(child))
+                visit(child, f"{qualname}.<locals>.")
+            elif isinstance(child, ast.ClassDef):
+                visit(child, f"{prefix}{child.name}.")
+            else:
+                visit(child, prefix)
+
+    visit(tree, "")
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            node.body = [ast.Pass()]
+    blocks[MODULE_BLOCK] = _digest(ast.dump(tree))
+    return blocks
+
+
+def _app_files() -> dict[str, str]:
+    """Module name -> path for every `app` source file"""
+    files = {}
+    for directory, _dirs, names in os.walk(os.path.join(SRC, "app")):
+        for name in names:
+            if name.endswith(".py"):
+                path = os.path.join(directory, name)
+                module = os.path.relpath(path, SRC)[:-3].replace(os.sep, ".")
+                files[module.removesuffix(".__init__")] = path
+    return files
+
+
+def _file_digest(path: str) -> str | None:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+    except OSError:
+        return None
+
+
+class ImpactIndex:
+    """
+    Persistent test -> app code map.
+
+    Blocks are interned as "module:qualname" strings in one table and
+    tests refer to them by position, which keeps the file small.
+    """
+
+    def __init__(self, path: str = INDEX_PATH) -> None:
+        self.path = path
+        self.blocks: list[str] = []
+        self.fingerprints: dict[str, dict[str, str]] = {}
+        self.tests: dict[str, dict[str, list]] = {}
+        self.test_files: dict[str, str | None] = {}
+        self.failed: set[str] = set()
+        self._block_ids: dict[str, int] = {}
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.blocks = data["blocks"]
+        self.fingerprints = data["fingerprints"]
+        self.tests = data["tests"]
+        self.test_files = data["test_files"]
+        self.failed = set(data["failed"])
+        self._block_ids = {block: i for i, block in enumerate(self.blocks)}
+
+    def save(self) -> None:
+        data = {
+            "version": INDEX_VERSION,
+            "blocks": self.blocks,
+            "fingerprints": self.fingerprints,
+            "tests": self.tests,
+            "test_files": self.test_files,
+            "failed": sorted(self.failed),
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    def block_id(self, block: str) -> int:
+        if block not in self._block_ids:
+            self._block_ids[block] = len(self.blocks)
+            self.blocks.append(block)
+        return self._block_ids[block]
+
+    def changes(self) -> tuple[set[str], set[str]]:
+        """
+        Compare stored fingerprints with the working tree.
+
+        Returns (changed blocks as "module:qualname", modules whose top-level
+        code changed, extended to every app module importing them).
+        """
+        files = _app_files()
+        changed_blocks: set[str] = set()
+        changed_modules: set[str] = set()
+
+        for module in set(files) | set(self.fingerprints):
+            old = self.fingerprints.get(module)
+            if old is None:
+                continue
+            try:
+                with open(files[module], encoding="utf-8") as f:
+                    new = fingerprint(f.read())
+            except (KeyError, OSError, SyntaxError):
+                changed_modules.add(module)
+                continue
+            for qualname in set(old) | set(new):
+                if old.get(qualname) != new.get(qualname):
+                    if qualname == MODULE_BLOCK:
+                        changed_modules.add(module)
+                    else:
+                        changed_blocks.add(f"{module}:{qualname}")
+
+        importers: dict[str, set[str]] = {}
+        for module, path in files.items():
+            for imported in app_imports(module, path):
+                importers.setdefault(imported, set()).add(module)
+        pending = list(changed_modules)
+        while pending:
+            for importer in importers.get(pending.pop(), ()):
+                if importer not in changed_modules:
+                    changed_modules.add(importer)
+                    pending.append(importer)
+        return changed_blocks, changed_modules
+
+    def affected(self, nodeids: list[str]) -> set[str]:
+        """Subset of collected node ids that must run"""
+        changed_blocks, changed_modules = self.changes()
+        changed_ids = {self._block_ids[b] for b in changed_blocks if b in self._block_ids}
+        digests: dict[str, str | None] = {}
+
+        selected = set()
+        for nodeid in nodeids:
+            entry = self.tests.get(nodeid)
+            test_file = nodeid.split("::")[0]
+            if test_file not in digests:
+                digests[test_file] = _file_digest(os.path.join(ROOT, test_file))
+            if (
+                entry is None
+                or nodeid in self.failed
+                or self.test_files.get(test_file) != digests[test_file]
+                or changed_ids.intersection(entry["blocks"])
+                or changed_modules.intersection(entry["modules"])
+            ):
+                selected.add(nodeid)
+        return selected
+
+    def update(self, results: dict[str, tuple[set[str], set[str], bool]]) -> None:
+        """
+        Store fresh dependencies for the tests that ran.
+
+        results maps node id -> (blocks called, modules depended on, passed).
+        A module's fingerprint is refreshed only when every indexed test
+        affected by its changes ran now; otherwise it is left stale so the
+        tests that did not run stay selected.
+        """
+        changed_blocks, changed_modules = self.changes()
+        ran = set(results)
+
+        for nodeid, (blocks, modules, passed) in results.items():
+            self.tests[nodeid] = {
+                "blocks": sorted(self.block_id(block) for block in blocks),
+                "modules": sorted(modules),
+            }
+            if passed:
+                self.failed.discard(nodeid)
+            else:
+                self.failed.add(nodeid)
+            test_file = nodeid.split("::")[0]
+            self.test_files[test_file] = _file_digest(os.path.join(ROOT, test_file))
+
+        for nodeid in list(self.tests):
+            if not os.path.exists(os.path.join(ROOT, nodeid.split("::")[0])):
+                del self.tests[nodeid]
+                self.failed.discard(nodeid)
+
+        for module, path in _app_files().items():
+            module_blocks = {
+                self._block_ids[b] for b in changed_blocks
+                if b.startswith(f"{module}:") and b in self._block_ids
+            }
+            stale_tests = {
+                nodeid for nodeid, entry in self.tests.items()
+                if nodeid not in ran and (
+                    module_blocks.intersection(entry["blocks"])
+                    or (module in changed_modules and module in entry["modules"])
+                )
+            }
+            if stale_tests and module in self.fingerprints:
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.fingerprints[module] = fingerprint(f.read())
+            except (OSError, SyntaxError):
+                self.fingerprints.pop(module, None)
+
+
+class ImpactPlugin:
+    """
+    Pytest plugin: deselect unaffected tests, record what the rest call.
+
+    A sys.setprofile hook sees every Python call while a test runs; calls
+    into `app` code are mapped to the enclosing def's block. Tests also
+    depend on the `app` modules their test file imports.
+    """
+
+    def __init__(self, select: bool = True, index_path: str = INDEX_PATH) -> None:
+        self.select = select
+        self.index = ImpactIndex(index_path)
+        self._prefix = os.path.join(SRC, "app") + os.sep
+        self._known: dict[str, dict[str, str]] = {}
+        self._code_blocks: dict[Any, str | None] = {}
+        self._current: set[str] = set()
+        self._results: dict[str, tuple[set[str], set[str], bool]] = {}
+        self._test_imports: dict[str, set[str]] = {}
+        self.deselected = 0
+
+    def _block_for(self, code: Any) -> str | None:
+        filename = code.co_filename
+        if not filename.startswith(self._prefix):
+            return None
+        module = os.path.relpath(filename, SRC)[:-3].replace(os.sep, ".")
+        module = module.removesuffix(".__init__")
+        if module not in self._known:
+            try:
+                with open(filename, encoding="utf-8") as f:
+                    self._known[module] = fingerprint(f.read())
+            except (OSError, SyntaxError):
+                self._known[module] = {}
+        blocks = self._known[module]
+        qualname = code.co_qualname
+        # Lambdas and comprehensions belong to the def that contains them
+        while qualname not in blocks and ".<locals>." in qualname:
+            qualname = qualname.rsplit(".<locals>.", 1)[0]
+        if qualname not in blocks:
+            qualname = MODULE_BLOCK
+        return f"{module}:{qualname}"
+
+    def _profile(self, frame: Any, event: str, arg: Any) -> None:
+        if event != "call":
+            return
+        code = frame.f_code
+        try:
+            block = self._code_blocks[code]
+        except KeyError:
+            block = self._code_blocks[code] = self._block_for(code)
+        if block is not None:
+            self._current.add(block)
+
+    def _modules_for(self, test_path: str) -> set[str]:
+        if test_path not in self._test_imports:
+            self._test_imports[test_path] = app_imports("tests.module", test_path)
+        return self._test_imports[test_path]
+
+    def pytest_collection_modifyitems(self, session, config, items) -> None:  # type: ignore[no-untyped-def]
+        if not self.select or not self.index.tests:
+            return
+        affected = self.index.affected([item.nodeid for item in items])
+        keep = [item for item in items if item.nodeid in affected]
+        dropped = [item for item in items if item.nodeid not in affected]
+        if dropped:
+            config.hook.pytest_deselected(items=dropped)
+            items[:] = keep
+        self.deselected = len(dropped)
+
+    def pytest_runtest_protocol(self, item, nextitem):  # type: ignore[no-untyped-def]
+        self._current = set()
+        sys.setprofile(self._profile)
+        threading.setprofile(self._profile)
+
+    def pytest_runtest_logreport(self, report) -> None:  # type: ignore[no-untyped-def]
+        if report.when == "teardown":
+            sys.setprofile(None)
+            threading.setprofile(None)  # type: ignore[arg-type]
+        blocks, modules, passed = self._results.get(report.nodeid, (set(), set(), True))
+        blocks = blocks | self._current
+        modules = modules | {block.split(":")[0] for block in blocks}
+        modules |= self._modules_for(os.path.join(ROOT, report.fspath))
+        self._results[report.nodeid] = (blocks, modules, passed and not report.failed)
+
+    def pytest_sessionfinish(self, session, exitstatus) -> None:  # type: ignore[no-untyped-def]
+        sys.setprofile(None)
+        # Nothing affected is a pass, not pytest's "no tests collected"
+        if exitstatus == NO_TESTS_COLLECTED and self.deselected:
+            session.exitstatus = 0
+        if self._results:
+            self.index.update(self._results)
+            self.index.save()
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:  # type: ignore[no-untyped-def]
+        if self.select:
+            terminalreporter.write_line(
+                f"impact: {len(self._results)} affected, {self.deselected} skipped as unaffected"
+            )
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    select = "--all" not in argv
+    argv = [arg for arg in argv if arg != "--all"]
+
+    import pytest
+
+    os.chdir(ROOT)
+    return int(pytest.main(pytest_args(argv), plugins=[ImpactPlugin(select)]))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# scripts/testd.py
+"""
+Persistent test runner - a warm pytest daemon for the agent loop.
+
+    python scripts/testd.py serve            # start once, keep running
+    python scripts/testd.py run [--affected] [TIER|PATH ...] [-- PYTEST_ARGS]
+    python scripts/testd.py cold [--affected] [TIER|PATH ...]   # no daemon
+
+The daemon keeps one interpreter with pytest and `app` imported and runs
+pytest.main() in-process per request. Before each run it checks source
+mtimes and drops only the changed `app` modules (plus the app modules that
+import them) from sys.modules; test modules are always re-collected. The
+client is stdlib-only and passes its stdout/stderr descriptors, so output
+streams straight to the caller's terminal. With no daemon listening, `run`
+falls back to a cold pytest run in a child interpreter started without -S,
+so the fast `python -S` client still finds pytest in site-packages. The
+socket plumbing - private runtime dir, owner checks and request framing -
+is app/ipc.py, shared with the forkserver.
+
+Tiers: unit, contract, integration, fast (= unit + contract, the default).
+--affected runs only the tests the impact index selects (see impact.py).
+"""
+
+import os
+import socket
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from app.ipc import bind_private, connect_owned, receive_request, send_request  # noqa: E402
+from app.ipc import socket_path as _socket_path  # noqa: E402
+
+SOCKET_ENV = "APP_TESTD_SOCKET"
+
+TIERS = {
+    "unit": ["tests/unit"],
+    "contract": ["tests/contract"],
+    "integration": ["tests/integration"],
+    "fast": ["tests/unit", "tests/contract"],
+}
+# Pytest options for warm runs: no cache plugin writing between requests
+DAEMON_ARGS = ["-p", "no:cacheprovider", "-q"]
+SLOWEST = 10
+
+
+def socket_path() -> str:
+    """Daemon socket: $APP_TESTD_SOCKET, else the per-user runtime dir"""
+    return _socket_path(SOCKET_ENV, "testd.sock")
+
+
+def pytest_args(targets: list[str]) -> list[str]:
+    """Expand tier names to test paths; other arguments pass through"""
+    if "--" in targets:
+        split = targets.index("--")
+        targets, extra = targets[:split], targets[split + 1:]
+    else:
+        extra = []
+    paths: list[str] = []
+    for target in targets or ["fast"]:
+        paths.extend(TIERS.get(target, [target]))
+    return paths + extra
+
+
+# -----------------------------------------------------------------------------
+# Server side
+# -----------------------------------------------------------------------------
+
+def _module_files(prefixes: tuple[str, ...]) -> dict[str, str]:
+    """Loaded modules under the given prefixes -> source file"""
+    files = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and name.split(".")[0] in prefixes:
+            files[name] = path
+    return files
+
+
+def app_imports(name: str, path: str) -> set[str]:
+    """`app` modules imported by one module's source (relative or absolute)"""
+    import ast
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+    except (OSError, SyntaxError):
+        return set()
+
+    package = name if path.endswith("__init__.py") else name.rpartition(".")[0]
+    imported = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parts = package.split(".")
+                parent = ".".join(parts[: len(parts) - node.level + 1])
+                base = f"{parent}.{base}" if base else parent
+            imported.add(base)
+            imported.update(f"{base}.{alias.name}" for alias in node.names)
+    return {module for module in imported if module.split(".")[0] == "app"}
+
+
+class ModuleReloader:
+    """Tracks `app` source mtimes and evicts stale modules before a run"""
+
+    def __init__(self) -> None:
+        self._mtimes: dict[str, float] = {}
+
+    def _snapshot(self, files: dict[str, str]) -> None:
+        for path in files.values():
+            try:
+                self._mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                self._mtimes.pop(path, None)
+
+    def stale(self) -> set[str]:
+        """Changed app modules plus every loaded app module importing them"""
+        files = _module_files(("app",))
+        changed = set()
+        for name, path in files.items():
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                changed.add(name)
+                continue
+            if self._mtimes.get(path, mtime) != mtime:
+                changed.add(name)
+        if not changed:
+            return changed
+
+        importers: dict[str, set[str]] = {}
+        for name, path in files.items():
+            for imported in app_imports(name, path):
+                importers.setdefault(imported, set()).add(name)
+
+        stale, pending = set(changed), list(changed)
+        while pending:
+            for importer in importers.get(pending.pop(), ()):
+                if importer not in stale:
+                    stale.add(importer)
+                    pending.append(importer)
+        return stale
+
+    def prepare(self) -> list[str]:
+        """Evict stale app modules and all test modules; returns evicted app modules"""
+        stale = sorted(self.stale())
+        for name in stale:
+            sys.modules.pop(name, None)
+        for name in _module_files(("tests",)):
+            sys.modules.pop(name, None)
+        return stale
+
+    def record(self) -> None:
+        """Remember mtimes of everything loaded after a run"""
+        self._snapshot(_module_files(("app",)))
+
+
+class TimingPlugin:
+    """Collects setup+call+teardown time per test and prints the slowest"""
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report) -> None:  # type: ignore[no-untyped-def]
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:  # type: ignore[no-untyped-def]
+        if not self.durations:
+            return
+        terminalreporter.section("per-test timings")
+        ranked = sorted(self.durations.items(), key=lambda item: item[1], reverse=True)
+        for nodeid, seconds in ranked[:SLOWEST]:
+            terminalreporter.write_line(f"{seconds * 1000:9.2f} ms  {nodeid}")
+        total = sum(self.durations.values())
+        terminalreporter.write_line(f"{total * 1000:9.2f} ms  total in {len(ranked)} tests")
+
+
+def run_pytest(args: list[str], reloader: ModuleReloader | None = None) -> int:
+    """One in-process pytest run from the project root; returns its exit code"""
+    import time
+
+    import pytest
+
+    plugins: list[object] = [TimingPlugin()]
+    if "--affected" in args:
+        args = [arg for arg in args if arg != "--affected"]
+        scripts_dir = os.path.dirname(os.path.abspath(__file__))
+        if scripts_dir not in sys.path:
+            sys.path.insert(0, scripts_dir)
+        from impact import ImpactPlugin
+
+        plugins.append(ImpactPlugin())
+
+    os.chdir(ROOT)
+    if reloader is not None:
+        evicted = reloader.prepare()
+        if evicted:
+            print(f"testd: reloading {', '.join(evicted)}", flush=True)
+
+    started = time.perf_counter()
+    code = int(pytest.main([*DAEMON_ARGS, *args], plugins=plugins))
+    print(f"testd: {(time.perf_counter() - started) * 1000:.0f} ms wall", flush=True)
+
+    if reloader is not None:
+        reloader.record()
+    return code
+
+
+def _handle(conn: socket.socket, reloader: ModuleReloader) -> None:
+    """Run one request with the client's stdout/stderr as fds 1 and 2"""
+    args, fds = receive_request(conn, 2)
+    saved = [os.dup(1), os.dup(2)]
+    code = 3
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for target, fd in zip((1, 2), fds):
+            os.dup2(fd, target)
+        try:
+            code = run_pytest(pytest_args(args), reloader)
+        except Exception:
+            import traceback
+
+            traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for target, fd in zip((1, 2), saved):
+            os.dup2(fd, target)
+            os.close(fd)
+        for fd in fds:
+            os.close(fd)
+    conn.sendall(f"{code}\n".encode())
+
+
+def serve(path: str | None = None) -> None:
+    """Import pytest and app once, then serve run requests until interrupted"""
+    import importlib
+
+    import pytest  # noqa: F401 - warm the import
+
+    path = path or socket_path()
+    os.chdir(ROOT)
+    for name in ("app.models", "app.services"):
+        importlib.import_module(name)
+    reloader = ModuleReloader()
+    reloader.record()
+
+    listener = bind_private(path, 8)
+    print(f"testd listening on {path}", flush=True)
+
+    try:
+        while True:
+            conn, _ = listener.accept()
+            with conn:
+                try:
+                    _handle(conn, reloader)
+                except (OSError, ValueError, SyntaxError) as e:
+                    print(f"testd: bad request: {e}", file=sys.stderr, flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+# -----------------------------------------------------------------------------
+# Client side
+# -----------------------------------------------------------------------------
+
+def run_cold(args: list[str]) -> int:
+    """
+    Cold run in a child interpreter with site-packages enabled.
+
+    The client is meant to start with `python -S`, where pytest is not
+    importable, so the fallback cannot run pytest in-process.
+    """
+    import subprocess
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    return subprocess.call([sys.executable, os.path.abspath(__file__), "cold", *args])
+
+
+def run(args: list[str]) -> int:
+    """Send a run request to the daemon; cold run in a child if none is up"""
+    try:
+        sock = connect_owned(socket_path())
+    except PermissionError as e:
+        print(f"testd: not using the daemon: {e}", file=sys.stderr)
+        return run_cold(args)
+    except OSError:
+        return run_cold(args)
+
+    with sock:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        send_request(sock, args, [1, 2])
+        status = sock.makefile("rb").readline()
+    return int(status) if status.strip() else 3
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "run"
+    if command == "serve":
+        serve(argv[1] if len(argv) > 1 else None)
+        return 0
+    if command == "run":
+        return run(argv[1:])
+    if command == "cold":
+        return run_pytest(pytest_args(argv[1:]))
+    print(__doc__, file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
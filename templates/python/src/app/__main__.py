@@ -0,0 +1,6 @@
+# src/app/__main__.py
+"""`python -m app` - same entrypoint as app.main"""
+
+from .main import main
+
+main()
@@ -0,0 +1,143 @@
+# src/app/async_services.py
+"""Asyncio services - bounded concurrency for I/O-bound enrichment"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Protocol
+
+from .models import User, UserResult
+
+DEFAULT_CONCURRENCY = 1000
+DEFAULT_POOL_SIZE = 100
+
+
+class Connection(Protocol):
+    """A pooled connection that can enrich a user"""
+
+    async def enrich(self, user: User) -> dict[str, Any]: ...
+
+
+class StubConnection:
+    """Local stand-in for a network lookup - sleeps for `latency` seconds"""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.calls = 0
+
+    async def enrich(self, user: User) -> dict[str, Any]:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return {"name": user.name, "verified": user.email is not None}
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool shared by all in-flight requests.
+
+    acquire() waits for a free connection, so the pool size caps
+    concurrent lookups independently of how many users are in flight.
+    """
+
+    def __init__(self, connections: Iterable[Connection]) -> None:
+        self._idle: asyncio.Queue[Connection] = asyncio.Queue()
+        for connection in connections:
+            self._idle.put_nowait(connection)
+        self.size = self._idle.qsize()
+        if self.size == 0:
+            raise ValueError("pool needs at least one connection")
+
+    @classmethod
+    def stub(cls, size: int = DEFAULT_POOL_SIZE, latency: float = 0.0) -> "ConnectionPool":
+        """Pool of StubConnections"""
+        return cls(StubConnection(latency) for _ in range(size))
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Connection]:
+        connection = await self._idle.get()
+        try:
+            yield connection
+        finally:
+            self._idle.put_nowait(connection)
+
+
+class AsyncDataService:
+    """
+    Async counterpart of DataService - same User/UserResult contract.
+
+    A semaphore bounds how many users are being processed at once, and
+    process_stream only pulls the next user when a slot frees up, so a
+    fast producer cannot outrun the lookups (backpressure).
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.pool = pool or ConnectionPool.stub()
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._processed = 0
+
+    async def process(self, user: User) -> UserResult:
+        """Enrich and process one user"""
+        async with self._semaphore:
+            async with self.pool.acquire() as connection:
+                await connection.enrich(user)
+        self._processed += 1
+        return UserResult(
+            user=user,
+            processed=True,
+            timestamp=datetime.utcnow().isoformat(),
+        )
+
+    async def process_stream(
+        self,
+        users: Iterable[User] | AsyncIterable[User],
+        ordered: bool = True,
+    ) -> AsyncIterator[UserResult]:
+        """
+        Process a (sync or async) stream with at most `concurrency` in flight.
+
+        Results are yielded in input order by default; with ordered=False
+        they are yielded as soon as each finishes.
+        """
+        in_flight: deque[asyncio.Task[UserResult]] = deque()
+
+        async def drain_one() -> UserResult:
+            if ordered:
+                return await in_flight.popleft()
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            task = done.pop()
+            in_flight.remove(task)
+            return task.result()
+
+        try:
+            async for user in _aiter(users):
+                if len(in_flight) >= self.concurrency:
+                    yield await drain_one()
+                in_flight.append(asyncio.create_task(self.process(user)))
+            while in_flight:
+                yield await drain_one()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    def get_processed_count(self) -> int:
+        """Get count of processed users"""
+        return self._processed
+
+
+async def _aiter(users: Iterable[User] | AsyncIterable[User]) -> AsyncIterator[User]:
+    """Iterate sync and async sources alike"""
+    if isinstance(users, AsyncIterable):
+        async for user in users:
+            yield user
+    else:
+        for user in users:
+            yield user
@@ -0,0 +1,186 @@
+# src/app/cache.py
+"""Result cache - LRU/TTL memoization for DataService, optional file backing"""
+
+import os
+import sys
+import time
+from collections import OrderedDict
+from typing import Any
+
+from .models import User, UserResult, user_to_dict
+
+# Rough per-entry cost of an OrderedDict slot plus the (result, stored_at) tuple
+ENTRY_OVERHEAD_BYTES = 150
+CACHE_FILE_VERSION = 3
+
+
+def user_key(user: User) -> str:
+    """
+    Stable key from a user's fields - identical across processes and runs.
+
+    repr() of the field tuple quotes each string and keeps None apart from
+    "None", so distinct users never share a key. It is used as-is rather
+    than hashed: services imports this module at start-up, and hashlib
+    alone would cost ~3 ms there.
+    """
+    return repr((user.name, user.email, user.active))
+
+
+class ResultCache:
+    """
+    Bounded memo table from user key to the finished UserResult.
+
+    Entries are evicted least-recently-used first once max_entries or
+    max_bytes (an estimate) is exceeded, and expire ttl seconds after
+    they were stored. With a path, the table is loaded on construction
+    and written back by save(), so unchanged users stay cached across
+    daily runs.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        path: str | None = None,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.path = path
+        self._entries: OrderedDict[str, tuple[UserResult, float]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    @staticmethod
+    def _entry_size(key: str, result: UserResult) -> int:
+        return (
+            sys.getsizeof(key)
+            + sys.getsizeof(result)
+            + sys.getsizeof(result.user)
+            + sys.getsizeof(result.timestamp)
+            + ENTRY_OVERHEAD_BYTES
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimated memory held by cached entries"""
+        return self._bytes
+
+    def get(self, key: str) -> UserResult | None:
+        """Return a live cached value (marking it recently used), else None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, stored_at = entry
+        if self.ttl is not None and time.time() - stored_at > self.ttl:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: UserResult, stored_at: float | None = None) -> None:
+        """Store a value, evicting least-recently-used entries over the limits"""
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, time.time() if stored_at is None else stored_at)
+        self._bytes += self._entry_size(key, value)
+        self._evict()
+
+    def get_or_put(self, key: str, value: UserResult) -> UserResult:
+        """Cached value for key; on a miss store and return value"""
+        cached = self.get(key)
+        if cached is None:
+            self.put(key, value)
+            return value
+        return cached
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._bytes -= self._entry_size(key, value)
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry; metrics are kept"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss metrics and current size"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def load(self, path: str) -> int:
+        """Merge entries from a cache file; returns entries loaded"""
+        import json
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CACHE_FILE_VERSION:
+            return 0
+
+        now = time.time()
+        loaded = 0
+        # Stored oldest-used first, so replaying puts rebuilds the LRU order
+        for key, fields, timestamp, stored_at in data.get("entries", []):
+            if self.ttl is not None and now - stored_at > self.ttl:
+                continue
+            result = UserResult(user=User(**fields), processed=True, timestamp=timestamp)
+            self.put(key, result, stored_at)
+            loaded += 1
+        return loaded
+
+    def save(self, path: str | None = None) -> None:
+        """Write entries to path (default: the constructor's path) atomically"""
+        import json
+
+        path = path or self.path
+        if not path:
+            raise ValueError("no cache file path")
+        entries = [
+            [key, user_to_dict(result.user), result.timestamp, stored_at]
+            for key, (result, stored_at) in self._entries.items()
+        ]
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_FILE_VERSION, "entries": entries}, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,62 @@
+# src/app/client.py
+"""
+Thin forkserver client - forwards argv, cwd, env and stdio, returns the exit code.
+
+Standard library only and no package imports, so it can be started as
+`python -S src/app/client.py ...` for the cheapest possible launch. Falls
+back to running the CLI in-process when no forkserver is listening, or when
+the socket belongs to another user - the request carries this process's
+environment and stdio.
+"""
+
+import os
+import sys
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    # Run as a script, src/ is not on the path yet
+    sys.path.insert(0, SRC_DIR)
+
+from app.ipc import connect_owned, send_request  # noqa: E402
+from app.ipc import socket_path as _socket_path  # noqa: E402
+
+SOCKET_ENV = "APP_FORKSERVER_SOCKET"
+
+
+def socket_path() -> str:
+    """Forkserver socket: $APP_FORKSERVER_SOCKET, else the per-user runtime dir"""
+    return _socket_path(SOCKET_ENV, "forkserver.sock")
+
+
+def _run_in_process(argv: list[str]) -> int:
+    from app.main import main as app_main
+
+    sys.argv = ["app", *argv]
+    try:
+        app_main()
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        sock = connect_owned(socket_path())
+    except PermissionError as e:
+        print(f"app: not using forkserver: {e}", file=sys.stderr)
+        return _run_in_process(argv)
+    except OSError:
+        return _run_in_process(argv)
+
+    with sock:
+        request = {"argv": ["app", *argv], "cwd": os.getcwd(), "env": dict(os.environ)}
+        sys.stdout.flush()
+        sys.stderr.flush()
+        send_request(sock, request, [0, 1, 2])
+        status = sock.makefile("rb").readline()
+    return int(status) if status.strip() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+# src/app/forkserver.py
+"""
+Pre-warmed forkserver - import once, fork per request.
+
+The server imports the package up front, then forks a child per client
+connection. The child adopts the client's stdin/stdout/stderr (passed as
+file descriptors), cwd, env and argv, runs app.main, and reports the exit
+code back. Each request skips interpreter start-up and module imports -
+the same checkpoint idea CRaC applies to the JVM.
+"""
+
+import importlib
+import os
+import signal
+import socket
+import sys
+import traceback
+from typing import Any
+
+from .client import socket_path
+from .ipc import bind_private, receive_request
+
+# Modules imported before the first fork
+PRELOAD = ("app.main", "app.models", "app.services", "app.ingest")
+
+
+def _exit_code(code: Any) -> int:
+    if code is None:
+        return 0
+    return code if isinstance(code, int) else 1
+
+
+def _run_child(conn: socket.socket) -> None:
+    """In the forked child: become the client's process and run the CLI"""
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    code = 1
+    try:
+        request, fds = receive_request(conn, 3)
+        for target, fd in zip((0, 1, 2), fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        sys.argv = request["argv"]
+
+        from .main import main
+
+        try:
+            main()
+            code = 0
+        except SystemExit as e:
+            code = _exit_code(e.code)
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            conn.sendall(f"{code}\n".encode())
+        finally:
+            os._exit(code)
+
+
+def serve(path: str | None = None) -> None:
+    """Preload the package and fork a child per connection until interrupted"""
+    path = path or socket_path()
+    for name in PRELOAD:
+        importlib.import_module(name)
+
+    listener = bind_private(path, 64)
+
+    # Children are reaped by the kernel; nobody waits on them here
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    print(f"forkserver listening on {path}", flush=True)
+
+    try:
+        while True:
+            conn, _ = listener.accept()
+            if os.fork() == 0:
+                listener.close()
+                _run_child(conn)
+            conn.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def main(argv: list[str]) -> dict[str, Any]:
+    """CLI: --serve [--socket PATH]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="app --serve", description=__doc__)
+    parser.add_argument("--socket", help="Unix socket path (default: $APP_FORKSERVER_SOCKET)")
+    args = parser.parse_args(argv)
+    serve(args.socket)
+    return {"status": "stopped"}
@@ -0,0 +1,176 @@
+# src/app/ingest.py
+"""Streaming JSON-lines ingestion - constant memory, bulk writes"""
+
+import json
+import mmap
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from typing import IO, Any
+
+from .models import User, UserResult, user_to_dict
+from .services import DEFAULT_CHUNK_SIZE, DataService
+
+WRITE_BUFFER_SIZE = 1 << 20
+# Bounds for the --cache file: ~50 MB of results, dropped a week after
+# they were stored, so a cache reused across daily runs stays bounded
+CACHE_MAX_ENTRIES = 100_000
+CACHE_TTL_SECONDS = 7 * 24 * 3600.0
+
+
+def parse_users(lines: Iterable[bytes | str]) -> Iterator[User]:
+    """Parse JSON lines into Users, skipping blank lines"""
+    loads = json.loads
+    for line in lines:
+        if not line.strip():
+            continue
+        record = loads(line)
+        yield User(
+            name=record["name"],
+            email=record.get("email"),
+            active=record.get("active", True),
+        )
+
+
+def format_result(result: UserResult) -> str:
+    """Serialize one result as a JSON line (without the newline)"""
+    return json.dumps({
+        "user": user_to_dict(result.user),
+        "processed": result.processed,
+        "timestamp": result.timestamp,
+    })
+
+
+def ingest_stream(
+    lines: Iterable[bytes | str],
+    out: IO[str],
+    service: DataService | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+) -> int:
+    """
+    Stream lines through DataService and write JSON-line results.
+
+    Results are joined and written once per chunk, so memory stays
+    bounded by chunk_size and the output sees few, large writes. With
+    workers > 1, parsing, processing and serialization of each chunk
+    run on a process pool and chunks are written back in input order.
+    """
+    if workers > 1:
+        from .parallel import ParallelProcessor
+
+        count = 0
+        for written, text in ParallelProcessor(workers, chunk_size).ingest(lines):
+            out.write(text)
+            count += written
+        return count
+
+    service = service or DataService()
+    buffer: list[str] = []
+    count = 0
+
+    for result in service.process_many(parse_users(lines), chunk_size):
+        buffer.append(format_result(result))
+        if len(buffer) >= chunk_size:
+            out.write("\n".join(buffer) + "\n")
+            count += len(buffer)
+            buffer.clear()
+
+    if buffer:
+        out.write("\n".join(buffer) + "\n")
+        count += len(buffer)
+    return count
+
+
+def _read_lines(source: IO[bytes], use_mmap: bool) -> Iterator[bytes]:
+    """Iterate input lines, through a read-only memory map when possible"""
+    if use_mmap:
+        try:
+            mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files, pipes and stdin cannot be mapped
+            mapped = None
+        if mapped is not None:
+            with mapped:
+                yield from iter(mapped.readline, b"")
+            return
+    yield from source
+
+
+def run_ingest(
+    in_path: str,
+    out_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_mmap: bool = True,
+    workers: int = 1,
+    cache_path: str | None = None,
+    cache_max_entries: int = CACHE_MAX_ENTRIES,
+    cache_ttl: float = CACHE_TTL_SECONDS,
+) -> int:
+    """
+    Ingest a JSON-lines file ("-" for stdin/stdout); returns records written.
+
+    With cache_path, results are memoized in a ResultCache backed by that
+    file, which is loaded first and saved after a successful run. The cache
+    keeps at most cache_max_entries results, each for cache_ttl seconds.
+    """
+    service = None
+    if cache_path:
+        from .cache import ResultCache
+
+        cache = ResultCache(max_entries=cache_max_entries, ttl=cache_ttl, path=cache_path)
+        service = DataService(cache=cache)
+    with ExitStack() as stack:
+        source = (
+            sys.stdin.buffer if in_path == "-"
+            else stack.enter_context(open(in_path, "rb"))
+        )
+        out = (
+            sys.stdout if out_path == "-"
+            else stack.enter_context(
+                open(out_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+            )
+        )
+        count = ingest_stream(
+            _read_lines(source, use_mmap), out, service, chunk_size=chunk_size, workers=workers
+        )
+
+    if service is not None and service.cache is not None:
+        service.cache.save()
+    return count
+
+
+def main(argv: list[str]) -> dict[str, Any]:
+    """CLI: ingest --in users.jsonl --out results.jsonl"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="app ingest", description=__doc__)
+    parser.add_argument("--in", dest="in_path", default="-", help="Input JSON lines (- = stdin)")
+    parser.add_argument(
+        "--out", dest="out_path", default="-", help="Output JSON lines (- = stdout)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--no-mmap", action="store_true", help="Read input without mmap")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (1 = in-process)")
+    parser.add_argument("--cache", dest="cache_path", help="Result cache file (in-process only)")
+    parser.add_argument(
+        "--cache-max-entries", type=int, default=CACHE_MAX_ENTRIES,
+        help=f"Results kept in the cache file (default: {CACHE_MAX_ENTRIES})",
+    )
+    parser.add_argument(
+        "--cache-ttl", type=float, default=CACHE_TTL_SECONDS,
+        help=f"Seconds a cached result stays valid (default: {CACHE_TTL_SECONDS:g})",
+    )
+    args = parser.parse_args(argv)
+    if args.cache_path and args.workers > 1:
+        parser.error("--cache cannot be combined with --workers")
+    if args.cache_max_entries < 1:
+        parser.error("--cache-max-entries must be at least 1")
+    if args.cache_ttl <= 0:
+        parser.error("--cache-ttl must be positive")
+
+    count = run_ingest(
+        args.in_path, args.out_path, args.chunk_size, not args.no_mmap, args.workers,
+        args.cache_path, args.cache_max_entries, args.cache_ttl,
+    )
+    return {"status": "success", "ingested": count}
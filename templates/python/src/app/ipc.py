@@ -0,0 +1,132 @@
+# src/app/ipc.py
+"""
+Unix-socket plumbing shared by the forkserver and the warm test daemon.
+
+Standard library only and no package imports, so the `python -S` clients
+can use it. Sockets live in a per-user 0700 directory, servers only replace
+sockets they own, and clients refuse a socket (or a peer) that belongs to
+another user - the request carries the caller's environment and stdio.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import stat
+import struct
+
+TYPE_CHECKING = False  # typing itself costs the -S clients ~5 ms to import
+if TYPE_CHECKING:
+    from typing import Any
+
+HEADER = struct.Struct("!I")
+PEERCRED = struct.Struct("3i")  # struct ucred: pid, uid, gid
+
+
+def runtime_dir() -> str:
+    """
+    Per-user 0700 socket directory, created on first use.
+
+    Under $XDG_RUNTIME_DIR when set, else $TMPDIR or /tmp with the uid in
+    the name. An existing directory must be ours and closed to others.
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    name = "python-boilerplate" if base else f"python-boilerplate-{os.getuid()}"
+    path = os.path.join(base or os.environ.get("TMPDIR", "/tmp"), name)
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"{path} is not a directory owned by this user")
+    if stat.S_IMODE(info.st_mode) & 0o077:
+        raise PermissionError(f"{path} is accessible to other users")
+    return path
+
+
+def socket_path(env_var: str, name: str) -> str:
+    """Socket path: $env_var if set, else `name` in runtime_dir()"""
+    return os.environ.get(env_var) or os.path.join(runtime_dir(), name)
+
+
+def _check_owner(path: str) -> None:
+    info = os.stat(path)
+    if not stat.S_ISSOCK(info.st_mode):
+        raise PermissionError(f"{path} is not a socket")
+    if info.st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by uid {info.st_uid}, not this user")
+
+
+def bind_private(path: str, backlog: int) -> socket.socket:
+    """
+    Listen on path with an owner-only socket.
+
+    A stale socket of ours is replaced; anything else at path is refused
+    rather than unlinked. The umask makes the socket 0600 at bind time,
+    leaving no window for a chmod race.
+    """
+    if os.path.lexists(path):
+        _check_owner(path)
+        os.unlink(path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    previous_umask = os.umask(0o177)
+    try:
+        listener.bind(path)
+    except BaseException:
+        listener.close()
+        raise
+    finally:
+        os.umask(previous_umask)
+    listener.listen(backlog)
+    return listener
+
+
+def connect_owned(path: str) -> socket.socket:
+    """
+    Connect to a server socket owned by this user.
+
+    Raises FileNotFoundError/ConnectionError when nothing listens, and
+    PermissionError when the socket or, where the kernel reports it, the
+    listening process belongs to someone else.
+    """
+    _check_owner(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        if hasattr(socket, "SO_PEERCRED"):
+            creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, PEERCRED.size)
+            _pid, uid, _gid = PEERCRED.unpack(creds)
+            if uid != os.getuid():
+                raise PermissionError(f"{path} is served by uid {uid}, not this user")
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def send_request(sock: socket.socket, request: object, fds: list[int]) -> None:
+    """Send a repr()-encoded request, length-prefixed, with file descriptors"""
+    # repr() rather than json: importing json costs more than the round trip
+    payload = repr(request).encode()
+    socket.send_fds(sock, [HEADER.pack(len(payload)) + payload], fds)
+
+
+def receive_request(conn: socket.socket, max_fds: int) -> tuple[Any, list[int]]:
+    """Read a send_request() payload and the descriptors passed with it"""
+    import ast
+
+    data, fds, _flags, _addr = socket.recv_fds(conn, 1 << 16, max_fds)
+    while len(data) < HEADER.size:
+        chunk = conn.recv(1 << 16)
+        if not chunk:
+            raise ConnectionError("client closed before sending the request")
+        data += chunk
+    (length,) = HEADER.unpack_from(data)
+    data = data[HEADER.size:]
+    while len(data) < length:
+        chunk = conn.recv(1 << 16)
+        if not chunk:
+            raise ConnectionError("client closed before sending the request")
+        data += chunk
+    return ast.literal_eval(data.decode()), fds
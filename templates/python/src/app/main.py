@@ -19,6 +19,21 @@ def main() -> dict[str, Any] | None:
         print(f"python-boilerplate {VERSION}")
         return None
 
+    if len(sys.argv) > 1 and sys.argv[1] == "ingest":
+        from .ingest import main as ingest_main
+
+        return ingest_main(sys.argv[2:])
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--startup-profile":
+        from .startup import main as startup_main
+
+        return startup_main(sys.argv[2:])
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--serve":
+        from .forkserver import main as serve_main
+
+        return serve_main(sys.argv[2:])
+
     # Lazy imports - load only when needed
     from .models import create_default_user
     from .services import DataService
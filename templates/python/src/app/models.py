@@ -1,11 +1,12 @@
 # src/app/models.py
 """Pure Python models - no database or ORM dependencies"""
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from typing import NotRequired, TypedDict
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Simple user model - pure Python, no ORM"""
     name: str
@@ -13,7 +14,7 @@ class User:
     active: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class UserResult:
     """Result of user processing"""
     user: User
@@ -28,6 +29,67 @@ class UserDict(TypedDict):
     active: bool
 
 
+class UserBatch:
+    """
+    Columnar user container - parallel arrays, no per-user objects.
+
+    Names and emails live in two lists and active flags in a bytearray,
+    so holding millions of users costs a few pointers and one byte each
+    instead of a User instance apiece. Rows and JSON lines are produced
+    straight from the columns; User objects are only built on request.
+    """
+
+    __slots__ = ("names", "emails", "active")
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.emails: list[str | None] = []
+        self.active = bytearray()
+
+    @classmethod
+    def from_users(cls, users: Iterable[User]) -> "UserBatch":
+        """Build a batch from User objects"""
+        batch = cls()
+        for user in users:
+            batch.append(user.name, user.email, user.active)
+        return batch
+
+    def append(self, name: str, email: str | None = None, active: bool = True) -> None:
+        """Add one user's fields"""
+        self.names.append(name)
+        self.emails.append(email)
+        self.active.append(active)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> User:
+        """Materialize a single User"""
+        return User(
+            name=self.names[index],
+            email=self.emails[index],
+            active=bool(self.active[index]),
+        )
+
+    def users(self) -> Iterator[User]:
+        """Materialize Users lazily, one at a time"""
+        for name, email, active in zip(self.names, self.emails, self.active):
+            yield User(name=name, email=email, active=bool(active))
+
+    def rows(self) -> Iterator[UserDict]:
+        """Serialize to user_to_dict rows without building Users"""
+        for name, email, active in zip(self.names, self.emails, self.active):
+            yield {"name": name, "email": email, "active": bool(active)}
+
+    def iter_json(self) -> Iterator[str]:
+        """Serialize to JSON lines without building Users"""
+        import json  # lazy: keeps json off the default startup path
+
+        dumps = json.dumps
+        for row in self.rows():
+            yield dumps(row) + "\n"
+
+
 def create_default_user() -> User:
     """Factory function for default user"""
     return User(name="default", email=None, active=True)
@@ -0,0 +1,113 @@
+# src/app/parallel.py
+"""Multi-core processing - process pool with one DataService per worker"""
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, TypeVar
+
+from .models import User, UserResult
+from .services import DEFAULT_CHUNK_SIZE, DataService
+
+T = TypeVar("T")
+
+# Long-lived service for the current worker process
+_worker_service: DataService | None = None
+
+
+def _init_worker() -> None:
+    """Create the worker's DataService once, at pool start-up"""
+    global _worker_service
+    _worker_service = DataService()
+
+
+def _service() -> DataService:
+    assert _worker_service is not None, "called outside a pool worker"
+    return _worker_service
+
+
+def _process_chunk(users: list[User]) -> tuple[int, int, list[UserResult]]:
+    """Process one chunk in a worker; returns (pid, worker total, results)"""
+    service = _service()
+    results = list(service.process_many(users, chunk_size=len(users)))
+    return os.getpid(), service.get_processed_count(), results
+
+
+def _ingest_chunk(lines: list[bytes | str]) -> tuple[int, int, tuple[int, str]]:
+    """Parse, process and serialize raw JSON lines in a worker"""
+    from .ingest import format_result, parse_users
+
+    service = _service()
+    results = list(service.process_many(parse_users(lines), chunk_size=len(lines)))
+    text = "".join(format_result(result) + "\n" for result in results)
+    return os.getpid(), service.get_processed_count(), (len(results), text)
+
+
+class ParallelProcessor:
+    """
+    Spread chunks of work across a process pool.
+
+    Each worker keeps one DataService for its lifetime. At most
+    `workers * prefetch` chunks are in flight, so unbounded inputs stream
+    through in bounded memory, and results come back in input order.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        prefetch: int = 2,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.prefetch = max(1, prefetch)
+        self.worker_counts: dict[int, int] = {}
+
+    def get_processed_count(self) -> int:
+        """Users processed across all workers"""
+        return sum(self.worker_counts.values())
+
+    def _map(
+        self,
+        func: Callable[[list[Any]], tuple[int, int, T]],
+        items: Iterable[Any],
+    ) -> Iterator[T]:
+        """Run func over chunks of items on the pool, in order"""
+        iterator = iter(items)
+        pending: deque[Future[tuple[int, int, T]]] = deque()
+        max_pending = self.workers * self.prefetch
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as pool:
+            while True:
+                while len(pending) < max_pending:
+                    chunk = list(islice(iterator, self.chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(pool.submit(func, chunk))
+                if not pending:
+                    return
+                pid, worker_total, payload = pending.popleft().result()
+                self.worker_counts[pid] = max(worker_total, self.worker_counts.get(pid, 0))
+                yield payload
+
+    def process(self, users: Iterable[User]) -> Iterator[UserResult]:
+        """Process users on the pool, yielding results in input order"""
+        for results in self._map(_process_chunk, users):
+            yield from results
+
+    def ingest(self, lines: Iterable[bytes | str]) -> Iterator[tuple[int, str]]:
+        """Ingest raw JSON lines on the pool; yields (records, JSON-lines text) per chunk"""
+        yield from self._map(_ingest_chunk, lines)
+
+
+def process_data_parallel(
+    users: Iterable[User],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[UserResult]:
+    """Standalone function - process all users on every core"""
+    return list(ParallelProcessor(workers, chunk_size).process(users))
@@ -1,32 +1,97 @@
 # src/app/services.py
 """Business logic services - pure Python, no framework"""
 
+from collections.abc import Iterable, Iterator
 from datetime import datetime
-from typing import Any
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
+from .cache import user_key
 from .models import User, UserResult, user_to_dict
 
+if TYPE_CHECKING:
+    from .cache import ResultCache
+
+DEFAULT_CHUNK_SIZE = 1000
+
 
 class DataService:
-    """Simple data service - no Spring/Flask/Django"""
+    """
+    Simple data service - no Spring/Flask/Django
+
+    With a ResultCache, users whose fields are unchanged since they were
+    last processed get their original result back instead of a new one.
+    """
 
-    def __init__(self) -> None:
-        self._processed: list[str] = []
+    def __init__(self, cache: "ResultCache | None" = None) -> None:
+        self._processed = 0
+        self._cache = cache
 
     def process(self, user: User) -> UserResult:
         """Process a user - pure business logic"""
-        timestamp = datetime.utcnow().isoformat()
-        self._processed.append(user.name)
+        self._processed += 1
+        if self._cache is not None:
+            return self._cached(self._cache, user)
 
         return UserResult(
             user=user,
             processed=True,
-            timestamp=timestamp,
+            timestamp=datetime.utcnow().isoformat(),
         )
 
+    def process_many(
+        self, users: Iterable[User], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[UserResult]:
+        """
+        Process a stream of users lazily, one chunk at a time.
+
+        Each chunk shares a single timestamp, and at most one chunk of
+        results is held in memory, so arbitrarily large inputs run in
+        constant memory.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        iterator = iter(users)
+        while chunk := list(islice(iterator, chunk_size)):
+            timestamp = datetime.utcnow().isoformat()
+            if self._cache is None:
+                results = [
+                    UserResult(user=user, processed=True, timestamp=timestamp) for user in chunk
+                ]
+            else:
+                cache = self._cache
+                results = [self._cached(cache, user, timestamp) for user in chunk]
+            self._processed += len(results)
+            yield from results
+
+    @staticmethod
+    def _cached(cache: "ResultCache", user: User, timestamp: str | None = None) -> UserResult:
+        """
+        Cached result for user; on a miss build, store and return a new one.
+
+        The lookup comes first, so a hit costs one hash and one dict probe -
+        no clock read and no new UserResult.
+        """
+        key = user_key(user)
+        result = cache.get(key)
+        if result is None:
+            result = UserResult(
+                user=user,
+                processed=True,
+                timestamp=timestamp or datetime.utcnow().isoformat(),
+            )
+            cache.put(key, result)
+        return result
+
+    @property
+    def cache(self) -> "ResultCache | None":
+        """Result cache in use, if any"""
+        return self._cache
+
     def get_processed_count(self) -> int:
         """Get count of processed users"""
-        return len(self._processed)
+        return self._processed
 
 
 def create_service() -> DataService:
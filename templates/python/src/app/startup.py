@@ -0,0 +1,141 @@
+# src/app/startup.py
+"""Startup profiler - cold -X importtime in a child process with a budget gate"""
+
+import os
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+# Modules the default CLI path imports lazily
+DEFAULT_MODULES = ("app.models", "app.services")
+# Calibration: ten best-of-3 runs of the default modules measured 25-40 ms
+# on the development runner (single runs 23-42 ms). 75 ms is about twice
+# the slowest, which absorbs a cold bytecode cache on the first child and
+# a slower CI runner. When the default path changes, re-measure the same
+# way and keep the budget near twice the slowest best-of-3.
+DEFAULT_BUDGET_MS = 75.0
+DEFAULT_REPEAT = 3
+BUDGET_ENV = "APP_STARTUP_BUDGET_MS"
+IMPORTTIME_PREFIX = "import time:"
+
+
+@dataclass(slots=True)
+class ImportRecord:
+    """One module's import cost, as in `python -X importtime`"""
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(text: str) -> list[ImportRecord]:
+    """Parse `python -X importtime` stderr into records, in completion order"""
+    records = []
+    for line in text.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        fields = line[len(IMPORTTIME_PREFIX):].split("|", 2)
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        # Name column is "| " plus two spaces per nesting level
+        column = fields[2][1:]
+        name = column.lstrip(" ")
+        records.append(ImportRecord(
+            name=name.rstrip(),
+            self_us=int(fields[0]),
+            cumulative_us=int(fields[1]),
+            depth=(len(column) - len(name)) // 2,
+        ))
+    return records
+
+
+def profile_imports(modules: Iterable[str], repeat: int = 1) -> list[ImportRecord]:
+    """
+    Import modules in a fresh interpreter under `-X importtime`.
+
+    A child process starts with nothing but the interpreter's own startup
+    modules loaded, so every stdlib module the app pulls in (dataclasses,
+    typing, ...) is charged to the app import that first needs it. This
+    process's sys.path is passed on so the child finds the same packages.
+
+    With repeat > 1 the child is run that many times and the fastest run
+    is returned, as timeit does: scheduler noise only ever adds time, and
+    the first run's bytecode compilation is not charged to later ones.
+    """
+    import subprocess
+
+    code = "\n".join(f"__import__({name!r})" for name in modules)
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(path for path in sys.path if path)}
+    best: list[ImportRecord] = []
+    for _ in range(max(1, repeat)):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            env=env, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            last_line = result.stderr.strip().rpartition("\n")[2]
+            raise ImportError(last_line or f"import exited with {result.returncode}")
+        records = parse_importtime(result.stderr)
+        if not best or _top_level_us(records) < _top_level_us(best):
+            best = records
+    return best
+
+
+def _top_level_us(records: list[ImportRecord]) -> int:
+    return sum(record.cumulative_us for record in records if record.depth == 0)
+
+
+def package_cost_us(records: list[ImportRecord], packages: Iterable[str] = ("app",)) -> int:
+    """Cumulative cost of the top-level imports belonging to `packages`"""
+    packages = set(packages)
+    return sum(
+        record.cumulative_us for record in records
+        if record.depth == 0 and record.name.split(".")[0] in packages
+    )
+
+
+def format_report(records: list[ImportRecord]) -> str:
+    """Render records in the `-X importtime` layout"""
+    lines = [f"{IMPORTTIME_PREFIX} self [us] | cumulative | imported package"]
+    for record in records:
+        lines.append(
+            f"{IMPORTTIME_PREFIX} {record.self_us:>9} | {record.cumulative_us:>10} | "
+            f"{'  ' * record.depth}{record.name}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str]) -> dict[str, Any]:
+    """CLI: --startup-profile [--budget-ms MS] [module ...]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="app --startup-profile", description=__doc__)
+    parser.add_argument(
+        "modules", nargs="*", default=list(DEFAULT_MODULES),
+        help=f"Modules to import cold (default: {' '.join(DEFAULT_MODULES)})",
+    )
+    parser.add_argument(
+        "--budget-ms", type=float,
+        default=float(os.environ.get(BUDGET_ENV, DEFAULT_BUDGET_MS)),
+        help=f"Fail when the app package costs more (default: ${BUDGET_ENV} or "
+        f"{DEFAULT_BUDGET_MS:g})",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT,
+        help=f"Child runs to take the fastest of (default: {DEFAULT_REPEAT})",
+    )
+    args = parser.parse_args(argv)
+
+    records = profile_imports(args.modules, args.repeat)
+    app_ms = package_cost_us(records, {name.split(".")[0] for name in args.modules}) / 1000
+    within_budget = app_ms <= args.budget_ms
+
+    print(format_report(records))
+    print(
+        f"app startup: {app_ms:.2f} ms (budget {args.budget_ms:g} ms) - "
+        f"{'PASS' if within_budget else 'FAIL'}"
+    )
+    if not within_budget:
+        raise SystemExit(1)
+    return {"status": "success", "startup_ms": app_ms, "budget_ms": args.budget_ms}
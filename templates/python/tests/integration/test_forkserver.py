@@ -0,0 +1,135 @@
+# tests/integration/test_forkserver.py
+"""Integration tests - forkserver round trips over a real Unix socket (CI only)"""
+
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from app import client, ipc
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+CLIENT = SRC / "app" / "client.py"
+
+
+@pytest.fixture
+def server_env(tmp_path: Path) -> Iterator[dict[str, str]]:
+    """Start a forkserver on a private socket and stop it afterwards"""
+    socket_path = tmp_path / "app.sock"
+    env = {**os.environ, "PYTHONPATH": str(SRC), "APP_FORKSERVER_SOCKET": str(socket_path)}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app", "--serve"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while not socket_path.exists():
+            assert server.poll() is None, "forkserver exited during startup"
+            assert time.monotonic() < deadline, "forkserver did not start"
+            time.sleep(0.02)
+        yield env
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def _client(
+    env: dict[str, str], *args: str, cwd: Path | None = None
+) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-S", str(CLIENT), *args],
+        env=env, cwd=cwd, capture_output=True, text=True, timeout=30,
+    )
+
+
+class TestForkserver:
+    """Test requests are served by forked children"""
+
+    def test_version_via_server(self, server_env: dict[str, str]) -> None:
+        """Test output reaches the client's stdout"""
+        result = _client(server_env, "--version")
+        assert result.returncode == 0
+        assert result.stdout.strip() == "python-boilerplate 1.0.0"
+
+    def test_socket_is_owner_only(self, server_env: dict[str, str]) -> None:
+        """Test the socket is created 0600 rather than chmod-ed after bind"""
+        mode = os.stat(server_env["APP_FORKSERVER_SOCKET"]).st_mode
+        assert stat.S_IMODE(mode) == 0o600
+
+    def test_exit_code_forwarded(self, server_env: dict[str, str]) -> None:
+        """Test a failing command's status comes back to the client"""
+        result = _client(server_env, "--startup-profile", "--budget-ms", "0")
+        assert result.returncode == 1
+        assert "FAIL" in result.stdout
+
+    def test_stdin_and_cwd_forwarded(self, server_env: dict[str, str], tmp_path: Path) -> None:
+        """Test ingest reads the client's stdin and resolves paths from its cwd"""
+        result = subprocess.run(
+            [sys.executable, "-S", str(CLIENT), "ingest", "--in", "-", "--out", "out.jsonl"],
+            env=server_env, cwd=tmp_path, capture_output=True, text=True, timeout=30,
+            input=json.dumps({"name": "Ada", "email": "ada@example.com"}) + "\n",
+        )
+        assert result.returncode == 0, result.stderr
+        rows = (tmp_path / "out.jsonl").read_text().splitlines()
+        assert json.loads(rows[0])["processed"] is True
+
+    def test_fallback_without_server(self, tmp_path: Path) -> None:
+        """Test the client runs in-process when nothing is listening"""
+        env = {**os.environ, "APP_FORKSERVER_SOCKET": str(tmp_path / "missing.sock")}
+        result = _client(env, "--version")
+        assert result.returncode == 0
+        assert result.stdout.strip() == "python-boilerplate 1.0.0"
+
+
+class TestSocketOwnership:
+    """Test sockets and runtime dirs of other users are refused"""
+
+    def test_client_refuses_socket_of_another_uid(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test the client sends nothing to a socket it does not own"""
+        path = str(tmp_path / "app.sock")
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(path)
+        listener.listen(1)
+        listener.settimeout(0.2)
+        monkeypatch.setenv("APP_FORKSERVER_SOCKET", path)
+        monkeypatch.setattr(os, "getuid", lambda: os.stat(path).st_uid + 1)
+        try:
+            with pytest.raises(PermissionError):
+                ipc.connect_owned(path)
+            assert client.main(["--version"]) == 0
+            with pytest.raises(TimeoutError):
+                listener.accept()
+        finally:
+            listener.close()
+        output = capsys.readouterr()
+        assert output.out.strip() == "python-boilerplate 1.0.0"
+        assert "not using forkserver" in output.err
+
+    def test_server_refuses_to_replace_a_foreign_file(self, tmp_path: Path) -> None:
+        """Test bind_private does not unlink something that is not our socket"""
+        path = tmp_path / "app.sock"
+        path.write_text("not a socket")
+        with pytest.raises(PermissionError):
+            ipc.bind_private(str(path), 1)
+        assert path.read_text() == "not a socket"
+
+    def test_runtime_dir_is_private(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the default socket dir is created 0700 and a shared one refused"""
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        path = ipc.runtime_dir()
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o700
+        os.chmod(path, 0o777)
+        with pytest.raises(PermissionError):
+            ipc.runtime_dir()
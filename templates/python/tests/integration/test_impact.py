@@ -0,0 +1,85 @@
+# tests/integration/test_impact.py
+"""Integration tests - test impact index fingerprints and selection (CI only)"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from impact import MODULE_BLOCK, ImpactIndex, fingerprint  # noqa: E402
+
+SOURCE = '''
+import os
+
+LIMIT = 1
+
+
+class Box:
+    size = 2
+
+    def grow(self):
+        return [x for x in range(self.size)]
+
+
+def helper():
+    def inner():
+        return LIMIT
+    return inner()
+'''
+
+
+class TestFingerprint:
+    """Test AST fingerprints per def"""
+
+    def test_blocks_by_qualname(self) -> None:
+        """Test methods, nested defs and module code each get a block"""
+        blocks = fingerprint(SOURCE)
+        assert set(blocks) == {"Box.grow", "helper", "helper.<locals>.inner", MODULE_BLOCK}
+
+    def test_comments_do_not_change_fingerprints(self) -> None:
+        """Test formatting-only edits leave every checksum alone"""
+        edited = SOURCE.replace("return inner()", "return inner()  # call it")
+        assert fingerprint(edited) == fingerprint(SOURCE)
+
+    def test_body_edit_changes_only_that_def(self) -> None:
+        """Test a body change is attributed to its def, not the module"""
+        before = fingerprint(SOURCE)
+        after = fingerprint(SOURCE.replace("range(self.size)", "range(3)"))
+        changed = {name for name in before if before[name] != after[name]}
+        assert changed == {"Box.grow"}
+
+    def test_class_attribute_edit_changes_module_block(self) -> None:
+        """Test code outside def bodies is tracked as the module block"""
+        before, after = fingerprint(SOURCE), fingerprint(SOURCE.replace("size = 2", "size = 3"))
+        changed = {name for name in before if before[name] != after[name]}
+        assert changed == {MODULE_BLOCK}
+
+
+class TestImpactIndex:
+    """Test selection against the real app sources"""
+
+    def _index(self, tmp_path: Path) -> ImpactIndex:
+        index = ImpactIndex(str(tmp_path / "impact.json"))
+        index.update({
+            "tests/unit/test_services.py::TestDataService::test_process_counts_users": (
+                {"app.services:DataService.process"}, {"app.services"}, True,
+            ),
+            "tests/unit/test_models.py::TestUserModel::test_user_creation": (
+                set(), {"app.models"}, False,
+            ),
+        })
+        index.save()
+        return ImpactIndex(index.path)
+
+    def test_unchanged_tree_selects_nothing_but_failures(self, tmp_path: Path) -> None:
+        """Test passing tests are skipped and failing ones rerun"""
+        index = self._index(tmp_path)
+        nodeids = list(index.tests)
+        assert index.affected(nodeids) == {nodeids[1]}
+
+    def test_unknown_tests_are_selected(self, tmp_path: Path) -> None:
+        """Test tests missing from the index always run"""
+        index = self._index(tmp_path)
+        new = "tests/unit/test_services.py::TestDataService::test_brand_new"
+        assert new in index.affected([new])
@@ -0,0 +1,93 @@
+# tests/integration/test_ingest.py
+"""Integration tests - real files, memory-mapped input (CI only)"""
+
+import json
+from pathlib import Path
+from typing import IO, Any
+
+import pytest
+
+from app.ingest import main, run_ingest
+
+
+class TestIngestFiles:
+    """Test file-to-file ingestion"""
+
+    def test_run_ingest_mmap_and_buffered_match(self, tmp_path: Path) -> None:
+        """Test mmap and plain reads produce the same records"""
+        source = tmp_path / "users.jsonl"
+        source.write_text("".join(json.dumps({"name": f"u{i}"}) + "\n" for i in range(50)))
+
+        mapped_out = tmp_path / "mapped.jsonl"
+        plain_out = tmp_path / "plain.jsonl"
+        assert run_ingest(str(source), str(mapped_out), chunk_size=7, use_mmap=True) == 50
+        assert run_ingest(str(source), str(plain_out), chunk_size=7, use_mmap=False) == 50
+
+        def users(path: Path) -> list[dict]:
+            return [json.loads(line)["user"] for line in path.read_text().splitlines()]
+
+        assert users(mapped_out) == users(plain_out)
+
+    def test_run_ingest_empty_file(self, tmp_path: Path) -> None:
+        """Test empty input falls back from mmap and writes nothing"""
+        source = tmp_path / "empty.jsonl"
+        source.write_text("")
+        out = tmp_path / "out.jsonl"
+        assert run_ingest(str(source), str(out)) == 0
+        assert out.read_text() == ""
+
+    def test_run_ingest_closes_input_when_output_fails(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the input file is closed if the output cannot be opened"""
+        source = tmp_path / "users.jsonl"
+        source.write_text(json.dumps({"name": "a"}) + "\n")
+        opened: list[IO[Any]] = []
+
+        def tracking_open(*args: Any, **kwargs: Any) -> IO[Any]:
+            f = open(*args, **kwargs)
+            opened.append(f)
+            return f
+
+        monkeypatch.setattr("app.ingest.open", tracking_open, raising=False)
+        with pytest.raises(FileNotFoundError):
+            run_ingest(str(source), str(tmp_path / "missing" / "out.jsonl"))
+        assert len(opened) == 1
+        assert opened[0].closed
+
+    def test_run_ingest_cache_file_persists(self, tmp_path: Path) -> None:
+        """Test a second run over unchanged users is served from the cache file"""
+        source = tmp_path / "users.jsonl"
+        source.write_text("".join(json.dumps({"name": f"u{i}"}) + "\n" for i in range(20)))
+        cache_file = tmp_path / "cache.json"
+
+        first_out, second_out = tmp_path / "first.jsonl", tmp_path / "second.jsonl"
+        assert run_ingest(str(source), str(first_out), cache_path=str(cache_file)) == 20
+        assert cache_file.exists()
+        assert run_ingest(str(source), str(second_out), cache_path=str(cache_file)) == 20
+
+        assert first_out.read_text() == second_out.read_text()
+
+    def test_run_ingest_cache_file_is_bounded(self, tmp_path: Path) -> None:
+        """Test the cache file keeps at most cache_max_entries results"""
+        source = tmp_path / "users.jsonl"
+        source.write_text("".join(json.dumps({"name": f"u{i}"}) + "\n" for i in range(20)))
+        cache_file = tmp_path / "cache.json"
+
+        run_ingest(
+            str(source), str(tmp_path / "out.jsonl"),
+            cache_path=str(cache_file), cache_max_entries=5,
+        )
+        assert len(json.loads(cache_file.read_text())["entries"]) == 5
+
+    def test_cli_cache_bounds(self, tmp_path: Path) -> None:
+        """Test --cache-max-entries reaches the cache and bad bounds are rejected"""
+        source = tmp_path / "users.jsonl"
+        source.write_text("".join(json.dumps({"name": f"u{i}"}) + "\n" for i in range(10)))
+        cache_file = tmp_path / "cache.json"
+        paths = ["--in", str(source), "--out", str(tmp_path / "out.jsonl")]
+
+        main([*paths, "--cache", str(cache_file), "--cache-max-entries", "3", "--cache-ttl", "60"])
+        assert len(json.loads(cache_file.read_text())["entries"]) == 3
+        with pytest.raises(SystemExit):
+            main([*paths, "--cache", str(cache_file), "--cache-ttl", "0"])
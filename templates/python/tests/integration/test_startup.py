@@ -0,0 +1,82 @@
+# tests/integration/test_startup.py
+"""Integration tests - CLI cold-start latency guard (CI only)"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from app.startup import package_cost_us, profile_imports
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+# Budget for `python -m app --version` on top of a bare interpreter start
+VERSION_OVERHEAD_BUDGET_MS = 50.0
+RUNS = 7
+# Gate for the probe modules: an empty module fits, asyncio (~10+ ms) does not
+PROBE_BUDGET_MS = 5.0
+
+
+def _median_ms(args: list[str]) -> float:
+    env = {**os.environ, "PYTHONPATH": str(SRC), "PYTHONDONTWRITEBYTECODE": "1"}
+    samples = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], env=env, check=True, capture_output=True)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+class TestStartupBudget:
+    """Guard CLI startup latency"""
+
+    def test_version_startup_overhead(self) -> None:
+        """Test `python -m app --version` stays close to a bare interpreter"""
+        baseline = _median_ms(["-c", "pass"])
+        version = _median_ms(["-m", "app", "--version"])
+        assert version - baseline < VERSION_OVERHEAD_BUDGET_MS, (
+            f"--version took {version:.1f} ms vs {baseline:.1f} ms bare interpreter"
+        )
+
+    def test_startup_profile_within_budget(self) -> None:
+        """Test the default CLI path passes its own startup budget"""
+        env = {**os.environ, "PYTHONPATH": str(SRC)}
+        result = subprocess.run(
+            [sys.executable, "-m", "app", "--startup-profile"],
+            env=env, capture_output=True, text=True,
+        )
+        assert result.returncode == 0, result.stdout
+        assert "PASS" in result.stdout
+
+    def test_stdlib_imports_are_charged_to_app(self) -> None:
+        """Test stdlib modules app.models pulls in count toward the app cost"""
+        records = profile_imports(["app.models"])
+        nested = [r for r in records if r.name == "dataclasses"]
+        assert nested and nested[0].depth > 0
+        assert package_cost_us(records) >= nested[0].cumulative_us
+
+    def test_repeat_keeps_the_fastest_run(self) -> None:
+        """Test repeated profiling returns a single run's records"""
+        single = profile_imports(["app.models"])
+        best = profile_imports(["app.models"], repeat=3)
+        assert [r.name for r in best] == [r.name for r in single]
+
+    def test_heavy_import_fails_the_gate(self, tmp_path: Path) -> None:
+        """Test adding a heavy import to a module pushes it over budget"""
+        (tmp_path / "light_probe.py").write_text("VALUE = 1\n")
+        (tmp_path / "heavy_probe.py").write_text("import asyncio  # noqa: F401\n")
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(SRC), str(tmp_path)])}
+
+        def gate(module: str) -> subprocess.CompletedProcess[str]:
+            return subprocess.run(
+                [sys.executable, "-m", "app", "--startup-profile", module,
+                 "--budget-ms", str(PROBE_BUDGET_MS)],
+                env=env, capture_output=True, text=True,
+            )
+
+        light, heavy = gate("light_probe"), gate("heavy_probe")
+        assert light.returncode == 0, light.stdout
+        assert heavy.returncode == 1, heavy.stdout
+        assert "asyncio" in heavy.stdout
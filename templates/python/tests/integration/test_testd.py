@@ -0,0 +1,102 @@
+# tests/integration/test_testd.py
+"""Integration tests - persistent test runner over a real socket (CI only)"""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+TESTD = ROOT / "scripts" / "testd.py"
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import testd  # noqa: E402
+
+
+@pytest.fixture
+def testd_env(tmp_path: Path) -> Iterator[dict[str, str]]:
+    """Start a test daemon on a private socket and stop it afterwards"""
+    socket_path = tmp_path / "testd.sock"
+    env = {**os.environ, "APP_TESTD_SOCKET": str(socket_path)}
+    daemon = subprocess.Popen(
+        [sys.executable, str(TESTD), "serve"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while not socket_path.exists():
+            assert daemon.poll() is None, "test daemon exited during startup"
+            assert time.monotonic() < deadline, "test daemon did not start"
+            time.sleep(0.05)
+        yield env
+    finally:
+        daemon.terminate()
+        daemon.wait(timeout=10)
+
+
+def _run(env: dict[str, str], *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-S", str(TESTD), "run", *args],
+        env=env, cwd=ROOT, capture_output=True, text=True, timeout=60,
+    )
+
+
+class TestTestDaemon:
+    """Test warm runs through the daemon"""
+
+    def test_tier_run_reports_timings(self, testd_env: dict[str, str]) -> None:
+        """Test a tier runs in the daemon and prints per-test timings"""
+        result = _run(testd_env, "contract")
+        assert result.returncode == 0, result.stdout
+        assert "per-test timings" in result.stdout
+        assert "testd:" in result.stdout
+
+    def test_repeated_runs_stay_green(self, testd_env: dict[str, str]) -> None:
+        """Test re-collection works on a warm interpreter"""
+        assert _run(testd_env, "unit").returncode == 0
+        assert _run(testd_env, "unit").returncode == 0
+
+    def test_failure_exit_code(self, testd_env: dict[str, str]) -> None:
+        """Test pytest's exit code is returned to the client"""
+        result = _run(testd_env, "tests/unit/test_models.py", "--", "-k", "no_such_test")
+        assert result.returncode == 5
+
+
+class TestNoDaemon:
+    """Test the cold fallback when nothing is listening"""
+
+    def test_python_s_client_falls_back_to_cold_run(self, tmp_path: Path) -> None:
+        """Test `python -S ... run` still finds pytest with no daemon up"""
+        env = {**os.environ, "APP_TESTD_SOCKET": str(tmp_path / "missing.sock")}
+        result = _run(env, "contract")
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "per-test timings" in result.stdout
+
+
+class TestSocketOwnership:
+    """Test the client never hands its stdio to another user's daemon"""
+
+    def test_socket_of_another_uid_runs_cold(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a foreign socket is refused and the run falls back to cold"""
+        path = str(tmp_path / "testd.sock")
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(path)
+        listener.listen(1)
+        listener.settimeout(0.2)
+        monkeypatch.setenv("APP_TESTD_SOCKET", path)
+        monkeypatch.setattr(os, "getuid", lambda: os.stat(path).st_uid + 1)
+        monkeypatch.setattr(testd, "run_cold", lambda args: 42)
+        try:
+            assert testd.run(["unit"]) == 42
+            with pytest.raises(TimeoutError):
+                listener.accept()
+        finally:
+            listener.close()
+        assert "not using the daemon" in capsys.readouterr().err
@@ -0,0 +1,45 @@
+# tests/unit/test_async_services.py
+"""Fast unit tests - async service with a zero-latency stub pool"""
+
+import asyncio
+
+from app.async_services import AsyncDataService, ConnectionPool, StubConnection
+from app.models import User
+
+
+async def _collect(service: AsyncDataService, users: list[User], ordered: bool = True) -> list:
+    return [result async for result in service.process_stream(users, ordered=ordered)]
+
+
+class TestAsyncDataService:
+    """Test AsyncDataService - no network, no event-loop plugin"""
+
+    def test_process_returns_user_result(self) -> None:
+        """Test single-user contract matches DataService"""
+        service = AsyncDataService(ConnectionPool.stub(size=1))
+        result = asyncio.run(service.process(User(name="one")))
+        assert result.user.name == "one"
+        assert result.processed is True
+        assert service.get_processed_count() == 1
+
+    def test_process_stream_keeps_order(self) -> None:
+        """Test ordered stream yields in input order"""
+        users = [User(name=str(i)) for i in range(50)]
+        service = AsyncDataService(ConnectionPool.stub(size=4), concurrency=8)
+        results = asyncio.run(_collect(service, users))
+        assert [r.user for r in results] == users
+
+    def test_process_stream_unordered_yields_everything(self) -> None:
+        """Test unordered stream still processes every user once"""
+        users = [User(name=str(i)) for i in range(30)]
+        service = AsyncDataService(ConnectionPool.stub(size=3), concurrency=5)
+        results = asyncio.run(_collect(service, users, ordered=False))
+        assert sorted(r.user.name for r in results) == sorted(u.name for u in users)
+
+    def test_pool_is_shared(self) -> None:
+        """Test lookups are spread over the pool's connections"""
+        connections = [StubConnection(latency=0.001) for _ in range(2)]
+        service = AsyncDataService(ConnectionPool(connections), concurrency=10)
+        asyncio.run(_collect(service, [User(name=str(i)) for i in range(20)]))
+        assert sum(c.calls for c in connections) == 20
+        assert all(c.calls > 0 for c in connections)
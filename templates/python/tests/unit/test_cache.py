@@ -0,0 +1,107 @@
+# tests/unit/test_cache.py
+"""Fast unit tests - result cache eviction and metrics, no files"""
+
+import pytest
+
+from app.cache import ResultCache, user_key
+from app.models import User, UserResult
+from app.services import DataService
+
+
+def _result(name: str, timestamp: str = "2024-01-01T00:00:00") -> UserResult:
+    return UserResult(user=User(name=name), processed=True, timestamp=timestamp)
+
+
+class TestUserKey:
+    """Test the stable user hash"""
+
+    def test_equal_users_share_a_key(self) -> None:
+        """Test the key depends only on field values"""
+        assert user_key(User(name="a", email="a@x")) == user_key(User(name="a", email="a@x"))
+
+    def test_any_field_changes_the_key(self) -> None:
+        """Test name, email and active all feed the key"""
+        base = User(name="a", email="a@x")
+        variants = [
+            User(name="b", email="a@x"),
+            User(name="a"),
+            User(name="a", email="a@x", active=False),
+        ]
+        assert all(user_key(v) != user_key(base) for v in variants)
+
+    def test_no_collisions_across_field_boundaries(self) -> None:
+        """Test None vs "None" and separator characters inside fields stay distinct"""
+        users = [
+            User(name="x", email=None),
+            User(name="x", email="None"),
+            User(name="a\x1fb", email="c"),
+            User(name="a", email="b\x1fc"),
+            User(name="a', 'b", email="c"),
+            User(name="a", email="b', 'c"),
+        ]
+        assert len({user_key(user) for user in users}) == len(users)
+
+    def test_colliding_fields_get_their_own_results(self) -> None:
+        """Test process_many never returns another user's cached result"""
+        service = DataService(cache=ResultCache())
+        first, second = User(name="x", email=None), User(name="x", email="None")
+        results = list(service.process_many([first, second]))
+        assert [result.user for result in results] == [first, second]
+
+
+class TestResultCache:
+    """Test eviction policies and metrics"""
+
+    def test_lru_eviction_by_entries(self) -> None:
+        """Test the least recently used entry is evicted first"""
+        cache = ResultCache(max_entries=2)
+        cache.put("a", _result("a"))
+        cache.put("b", _result("b"))
+        cache.get("a")
+        cache.put("c", _result("c"))
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.evictions == 1
+
+    def test_eviction_by_bytes(self) -> None:
+        """Test the byte limit bounds the estimated size"""
+        cache = ResultCache(max_bytes=1000)
+        for i in range(100):
+            cache.put(str(i), _result(str(i)))
+        assert 0 < len(cache) < 100
+        assert cache.size_bytes <= 1000
+
+    def test_ttl_expiry(self) -> None:
+        """Test entries older than ttl are treated as misses"""
+        cache = ResultCache(ttl=60)
+        cache.put("old", _result("old"), stored_at=0.0)
+        assert cache.get("old") is None
+        assert cache.expirations == 1
+        assert "old" not in cache
+
+    def test_stats(self) -> None:
+        """Test hits, misses and hit ratio"""
+        cache = ResultCache()
+        first, second = _result("first"), _result("second")
+        assert cache.get_or_put("k", first) is first
+        assert cache.get_or_put("k", second) is first
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+    def test_rejects_bad_limits(self) -> None:
+        """Test limits must be positive"""
+        with pytest.raises(ValueError):
+            ResultCache(max_entries=0)
+
+
+class TestCachedService:
+    """Test DataService memoization"""
+
+    def test_unchanged_users_reuse_results(self) -> None:
+        """Test a repeated user gets its first result object back"""
+        cache = ResultCache()
+        service = DataService(cache=cache)
+        first = service.process(User(name="a"))
+        batch = list(service.process_many([User(name="a"), User(name="b")]))
+        assert batch[0] is first
+        assert cache.stats()["hits"] == 1
+        assert service.get_processed_count() == 3
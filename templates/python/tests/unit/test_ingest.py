@@ -0,0 +1,29 @@
+# tests/unit/test_ingest.py
+"""Fast unit tests - in-memory streams, no files"""
+
+import io
+import json
+
+from app.ingest import ingest_stream, parse_users
+from app.models import User
+
+
+class TestIngest:
+    """Test JSON-lines ingestion - no filesystem"""
+
+    def test_parse_users_defaults(self) -> None:
+        """Test optional fields fall back to User defaults"""
+        users = list(parse_users(['{"name": "a"}', "", '{"name": "b", "active": false}']))
+        assert users == [User(name="a"), User(name="b", active=False)]
+
+    def test_ingest_stream_writes_results(self) -> None:
+        """Test every record is processed and written as one line"""
+        lines = [json.dumps({"name": str(i), "email": None}).encode() for i in range(5)]
+        out = io.StringIO()
+
+        count = ingest_stream(lines, out, chunk_size=2)
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert count == 5
+        assert [r["user"]["name"] for r in records] == ["0", "1", "2", "3", "4"]
+        assert all(r["processed"] is True for r in records)
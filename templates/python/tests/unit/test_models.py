@@ -1,7 +1,11 @@
 # tests/unit/test_models.py
 """Fast unit tests - pure functions, no fixtures"""
 
-from app.models import User, create_default_user, user_to_dict
+import json
+
+import pytest
+
+from app.models import User, UserBatch, create_default_user, user_to_dict
 
 
 class TestUserModel:
@@ -33,3 +37,36 @@ class TestUserModel:
         assert result["name"] == "test"
         assert result["email"] == "test@example.com"
         assert result["active"] is True
+
+    def test_user_has_no_instance_dict(self) -> None:
+        """Test User is slotted - no per-instance __dict__"""
+        user = User(name="slim")
+        assert not hasattr(user, "__dict__")
+        with pytest.raises(AttributeError):
+            user.nickname = "x"  # type: ignore[attr-defined]
+
+
+class TestUserBatch:
+    """Test columnar UserBatch - no per-user objects"""
+
+    def test_from_users_round_trip(self) -> None:
+        """Test users survive a trip through the columns"""
+        users = [User(name="a", email="a@example.com"), User(name="b", active=False)]
+        batch = UserBatch.from_users(users)
+        assert len(batch) == 2
+        assert list(batch.users()) == users
+        assert batch[1] == users[1]
+
+    def test_rows_match_user_to_dict(self) -> None:
+        """Test rows equal per-user serialization"""
+        users = [User(name="a", email="a@example.com"), User(name="b", active=False)]
+        batch = UserBatch.from_users(users)
+        assert list(batch.rows()) == [user_to_dict(user) for user in users]
+
+    def test_iter_json_lines(self) -> None:
+        """Test JSON lines stream"""
+        batch = UserBatch()
+        batch.append("a", None, True)
+        lines = list(batch.iter_json())
+        assert lines[0].endswith("\n")
+        assert json.loads(lines[0]) == {"name": "a", "email": None, "active": True}
@@ -0,0 +1,45 @@
+# tests/unit/test_services.py
+"""Fast unit tests - service logic, no fixtures"""
+
+import pytest
+
+from app.models import User
+from app.services import DataService
+
+
+class TestDataService:
+    """Test DataService - no external dependencies"""
+
+    def test_process_counts_users(self) -> None:
+        """Test single-user processing updates the counter"""
+        service = DataService()
+        result = service.process(User(name="one"))
+        assert result.processed is True
+        assert service.get_processed_count() == 1
+
+    def test_process_many_is_lazy(self) -> None:
+        """Test nothing is processed until results are consumed"""
+        service = DataService()
+        results = service.process_many(User(name=str(i)) for i in range(5))
+        assert service.get_processed_count() == 0
+        assert [r.user.name for r in results] == ["0", "1", "2", "3", "4"]
+        assert service.get_processed_count() == 5
+
+    def test_process_many_stamps_once_per_chunk(self) -> None:
+        """Test users in the same chunk share a timestamp"""
+        service = DataService()
+        results = list(service.process_many([User(name=str(i)) for i in range(4)], chunk_size=2))
+        assert results[0].timestamp == results[1].timestamp
+        assert results[2].timestamp == results[3].timestamp
+
+    def test_process_many_counts_by_chunk(self) -> None:
+        """Test the counter advances a chunk at a time"""
+        service = DataService()
+        results = service.process_many((User(name=str(i)) for i in range(10)), chunk_size=4)
+        next(results)
+        assert service.get_processed_count() == 4
+
+    def test_process_many_rejects_bad_chunk_size(self) -> None:
+        """Test chunk_size must be positive"""
+        with pytest.raises(ValueError):
+            list(DataService().process_many([User(name="x")], chunk_size=0))
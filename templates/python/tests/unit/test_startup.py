@@ -0,0 +1,42 @@
+# tests/unit/test_startup.py
+"""Fast unit tests - -X importtime parsing and budget accounting"""
+
+from app.startup import format_report, package_cost_us, parse_importtime
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       300 |        300 |   _typing
+import time:      4000 |       4300 | typing
+import time:       900 |      20900 |   dataclasses
+import time:       170 |        170 |   app
+import time:      3600 |      24670 | app.models
+import time:      1400 |       3600 | app.services
+Traceback (most recent call last):
+"""
+
+
+class TestStartupProfiler:
+    """Test importtime parsing - no subprocesses"""
+
+    def test_parse_importtime_records(self) -> None:
+        """Test names, costs and nesting depth are read from each line"""
+        records = parse_importtime(IMPORTTIME)
+        assert [(r.name, r.depth) for r in records] == [
+            ("_typing", 1), ("typing", 0), ("dataclasses", 1),
+            ("app", 1), ("app.models", 0), ("app.services", 0),
+        ]
+        assert records[2].self_us == 900
+        assert records[2].cumulative_us == 20900
+
+    def test_package_cost_counts_nested_stdlib(self) -> None:
+        """Test stdlib imports nested under an app import count toward app"""
+        records = parse_importtime(IMPORTTIME)
+        assert package_cost_us(records) == 24670 + 3600
+        assert package_cost_us(records, ["typing"]) == 4300
+
+    def test_format_report_round_trips(self) -> None:
+        """Test the report uses the -X importtime layout it parses"""
+        records = parse_importtime(IMPORTTIME)
+        report = format_report(records)
+        assert report.splitlines()[0] == "import time: self [us] | cumulative | imported package"
+        assert parse_importtime(report) == records